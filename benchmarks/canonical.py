@@ -0,0 +1,45 @@
+"""
+Content fingerprints of Interfaces, against model_dump_json with the same
+exclusions.
+
+    python -m benchmarks.canonical [--count 100000]
+"""
+
+import argparse
+import gc
+import time
+
+from benchmarks.fixtures import interface
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.canonical import fingerprint
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    instances = [Interface.model_validate(interface(i)) for i in range(args.count)]
+    cases = {
+        "fingerprint": fingerprint,
+        "model_dump_json": lambda i: i.model_dump_json(
+            by_alias=True, exclude_none=True, exclude_defaults=True, exclude={"status"}
+        ),
+    }
+    print(f"{args.count} Interfaces")
+    for name, run in cases.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            for instance in instances:
+                run(instance)
+            best = min(best, time.perf_counter() - start)
+            gc.enable()
+        print(f"{name:<16} {best:6.3f}s {best / args.count * 1e6:6.2f} us/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Round trip of Interfaces through the positional codecs, against pydantic JSON.
+
+    python -m benchmarks.codecs [--count 20000]
+
+Every instance is encoded and decoded on its own, as messages between services
+are. The JSON baseline is the exclude_unset dump the codecs preserve. Times are
+the best of --repeat runs, with the garbage collector disabled as timeit does.
+"""
+
+import argparse
+import gc
+import time
+
+from benchmarks.fixtures import interface
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.codecs import JsonCodec, MsgpackCodec
+
+
+class PydanticJson:
+    """
+    model_dump_json and model_validate_json, for comparison.
+    """
+
+    def encode(self, instance: Interface) -> bytes:
+        return instance.model_dump_json(by_alias=True, exclude_unset=True).encode()
+
+    def decode(self, model: type[Interface], data: bytes) -> Interface:
+        return model.model_validate_json(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    instances = [Interface.model_validate(interface(i)) for i in range(args.count)]
+    print(f"{args.count} Interfaces")
+    for name, codec in (
+        ("pydantic json", PydanticJson()),
+        ("JsonCodec", JsonCodec()),
+        ("MsgpackCodec", MsgpackCodec()),
+    ):
+        encoded = elapsed = float("inf")
+        for _ in range(args.repeat):
+            decoded = None
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            payloads = [codec.encode(i) for i in instances]
+            encoded = min(encoded, time.perf_counter() - start)
+            start = time.perf_counter()
+            decoded = [codec.decode(Interface, p) for p in payloads]
+            elapsed = min(elapsed, time.perf_counter() - start)
+            gc.enable()
+        assert decoded == instances
+        size = sum(map(len, payloads))
+        print(
+            f"{name:<14} {size / 2**20:6.2f} MB  encode {encoded:6.3f}s  "
+            f"decode {elapsed:6.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Synthetic list payloads shaped like the ones returned by an EDA fabric.
+
+Resources are spread over a few namespaces and nodes and carry the usual
+labels, so that the strings repeat across items as they do in real lists.
+"""
+
+import json
+from typing import Any
+
+NAMESPACES = ("eda", "eda-system", "lab")
+ROLES = ("leaf", "spine", "borderleaf", "superspine")
+
+
+def _node(i: int) -> str:
+    return f"{ROLES[i % len(ROLES)]}-{i % 64 + 1}"
+
+
+def _labels(i: int) -> dict[str, str]:
+    return {
+        "eda.nokia.com/role": ROLES[i % len(ROLES)],
+        "eda.nokia.com/pod": f"pod-{i % 4}",
+        "eda.nokia.com/security-profile": "managed",
+    }
+
+
+def interface(i: int) -> dict[str, Any]:
+    node = _node(i)
+    port = f"ethernet-1-{i % 48 + 1}"
+    return {
+        "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+        "kind": "Interface",
+        "metadata": {
+            "name": f"{node}-{port}-{i}",
+            "namespace": NAMESPACES[i % len(NAMESPACES)],
+            "labels": _labels(i),
+        },
+        "spec": {
+            "description": f"uplink of {node}",
+            "enabled": True,
+            "mtu": 9000,
+            "members": [{"node": node, "interface": port, "enabled": True}],
+        },
+        "status": {
+            "enabled": True,
+            "operationalState": "up",
+            "speed": "100G",
+            "lastChange": "2025-01-02T03:04:05Z",
+            "members": [
+                {
+                    "node": node,
+                    "interface": port,
+                    "nodeInterface": port,
+                    "operationalState": "up",
+                    "speed": "100G",
+                    "enabled": True,
+                }
+            ],
+        },
+    }
+
+
+def topolink(i: int) -> dict[str, Any]:
+    local, remote = _node(i), _node(i + 1)
+    port = f"ethernet-1-{i % 48 + 1}"
+    return {
+        "apiVersion": "core.eda.nokia.com/v1",
+        "kind": "TopoLink",
+        "metadata": {
+            "name": f"{local}-{remote}-{i}",
+            "namespace": NAMESPACES[i % len(NAMESPACES)],
+            "labels": _labels(i),
+        },
+        "spec": {
+            "links": [
+                {
+                    "type": "interSwitch",
+                    "speed": "100G",
+                    "local": {
+                        "node": local,
+                        "interface": port,
+                        "interfaceResource": f"{local}-{port}",
+                    },
+                    "remote": {
+                        "node": remote,
+                        "interface": port,
+                        "interfaceResource": f"{remote}-{port}",
+                    },
+                }
+            ]
+        },
+        "status": {
+            "operationalState": "up",
+            "members": [
+                {"node": local, "interface": port, "operationalState": "up"},
+                {"node": remote, "interface": port, "operationalState": "up"},
+            ],
+        },
+    }
+
+
+def interface_list(count: int) -> bytes:
+    """
+    Return the JSON body of an InterfaceList of count items.
+    """
+    items = [interface(i) for i in range(count)]
+    return json.dumps(
+        {"apiVersion": "interfaces.eda.nokia.com/v1alpha1", "kind": "InterfaceList"}
+        | {"items": items}
+    ).encode()
+
+
+def topolink_list(count: int) -> bytes:
+    """
+    Return the JSON body of a TopoLinkList of count items.
+    """
+    items = [topolink(i) for i in range(count)]
+    return json.dumps(
+        {"apiVersion": "core.eda.nokia.com/v1", "kind": "TopoLinkList"}
+        | {"items": items}
+    ).encode()
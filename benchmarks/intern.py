@@ -0,0 +1,76 @@
+"""
+Memory footprint of bulk decoded InterfaceList and TopoLinkList items, with and
+without a shared StringPool.
+
+    python -m benchmarks.intern [--count 100000]
+
+Items are decoded one by one, the way a cache fed by watch events holds them,
+from JSON and from Python objects (json.loads output, as parsed YAML would be).
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.fixtures import interface_list, topolink_list
+from pydantic_eda.apps.core.v1.models import TopoLink
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.intern import StringPool, intern_strings
+
+
+def traced(build) -> int:
+    """
+    Return the memory held by the result of build(), in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run(name: str, model, body: bytes):
+    items = json.loads(body)["items"]
+    payloads = [json.dumps(item).encode() for item in items]
+
+    def python(pool=None):
+        instances = [model.model_validate(json.loads(p)) for p in payloads]
+        if pool is None:
+            return instances
+        return [intern_strings(i, pool) for i in instances]
+
+    def from_json(pool=None):
+        instances = [model.model_validate_json(p) for p in payloads]
+        if pool is None:
+            return instances
+        return [intern_strings(i, pool) for i in instances]
+
+    cases = {
+        "python": python,
+        "python, interned": lambda: python(StringPool()),
+        "json": from_json,
+        "json, interned": lambda: from_json(StringPool()),
+    }
+    for case, build in cases.items():
+        size = traced(build)
+        print(
+            f"{name:<12} {case:<18} {size / 2**20:8.1f} MB "
+            f"{size / len(payloads):8.0f} B/item"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run("Interface", Interface, interface_list(args.count))
+    run("TopoLink", TopoLink, topolink_list(args.count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Correlation of alarm jspaths to the Interfaces of a ResourceStore.
+
+    python -m benchmarks.jspath [--interfaces 50000] [--alarms 10000]
+
+The alarms carry EDA jspaths with an informational srl segment, e.g.
+.node{.name=="leaf-1"}.srl{.version=="24.10.1"}.interface{.name=="ethernet-1-1"}
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from benchmarks.fixtures import interface
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.jspath import JsPathResolver
+from pydantic_eda.store import ResourceStore
+
+PORTS = 48
+
+
+def node_interface(i: int) -> dict[str, Any]:
+    """
+    Return interface i of the fabric, 48 ports per node, so that a node and
+    port name a single Interface as they do on a real fabric.
+    """
+    data = interface(i)
+    data["metadata"]["namespace"] = "eda"
+    for member in data["spec"]["members"] + data["status"]["members"]:
+        member["node"] = f"leaf-{i // PORTS + 1}"
+    return data
+
+
+def alarm(i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        jsPath=(
+            f'.node{{.name=="leaf-{i // PORTS + 1}"}}.srl{{.version=="24.10.1"}}'
+            f'.interface{{.name=="ethernet-1-{i % PORTS + 1}"}}'
+        ),
+        namespace="eda",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interfaces", type=int, default=50_000)
+    parser.add_argument("--alarms", type=int, default=10_000)
+    args = parser.parse_args()
+
+    store = ResourceStore(
+        Interface,
+        indexes={"member": "spec.members[*].interface", "node": "spec.members[*].node"},
+    )
+    store.replace(
+        Interface.model_validate(node_interface(i)) for i in range(args.interfaces)
+    )
+    resolver = JsPathResolver()
+    resolver.bind(
+        "interface", store, {"name": "member", "node.name": "node"}, ignore={"srl"}
+    )
+    # spread the alarms over the fabric
+    step = max(args.interfaces // args.alarms, 1)
+    alarms = [alarm(i * step % args.interfaces) for i in range(args.alarms)]
+
+    for run in ("cold", "warm"):
+        errors = {}
+        start = time.perf_counter()
+        result = resolver.correlate(alarms, errors=errors)
+        elapsed = time.perf_counter() - start
+        found = sum(map(len, result.values()))
+        print(
+            f"{run:<5} {elapsed * 1e3:8.1f} ms {elapsed / len(alarms) * 1e6:6.1f} "
+            f"us/alarm, {found} interfaces, {len(errors)} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Validation of the apiVersion, kind and metadata of every generated resource kind,
+with the Literal fields emitted by the generator against the pattern-constrained
+str fields they replace.
+
+    python -m benchmarks.patterns [--count 20000]
+"""
+
+import argparse
+import importlib
+import json
+import re
+import time
+import typing
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import BaseModel, Field, create_model
+
+import pydantic_eda
+
+HEADER = ("apiVersion", "kind", "metadata")
+
+
+def resource_kinds() -> list[type[BaseModel]]:
+    """
+    Return the resource models of every app module: the ones with Literal
+    apiVersion and kind fields.
+    """
+    kinds = []
+    # the packages are namespace packages, find the app modules on disk
+    apps = Path(next(iter(pydantic_eda.__path__))) / "apps"
+    for path in sorted(apps.glob("*/*/models.py")):
+        app, version = path.parent.parent.name, path.parent.name
+        module = importlib.import_module(f"pydantic_eda.apps.{app}.{version}.models")
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseModel)
+                and value.__module__ == module.__name__
+                and all(f in value.model_fields for f in HEADER)
+                and typing.get_origin(value.model_fields["kind"].annotation)
+                is typing.Literal
+            ):
+                kinds.append(value)
+    return kinds
+
+
+def headers(
+    model: type[BaseModel], names: tuple[str, ...]
+) -> tuple[type[BaseModel], type[BaseModel]]:
+    """
+    Return models of some header fields of a kind, as generated (Literal) and as
+    generated before (str constrained by a pattern).
+    """
+    fields = {
+        n: (model.model_fields[n].annotation, model.model_fields[n]) for n in names
+    }
+    patterns = dict(fields)
+    for name in ("apiVersion", "kind"):
+        (value,) = typing.get_args(fields[name][0])
+        patterns[name] = (Annotated[str, Field(pattern=f"^{re.escape(value)}$")], ...)
+    return (
+        create_model(f"{model.__name__}Header", **fields),
+        create_model(f"{model.__name__}PatternHeader", **patterns),
+    )
+
+
+def payloads(model: type[BaseModel], count: int) -> list[bytes]:
+    (api_version,) = typing.get_args(model.model_fields["apiVersion"].annotation)
+    (kind,) = typing.get_args(model.model_fields["kind"].annotation)
+    return [
+        json.dumps(
+            {
+                "apiVersion": api_version,
+                "kind": kind,
+                "metadata": {
+                    "name": f"leaf-{i % 64}.ethernet-1-{i % 48}",
+                    "namespace": "eda",
+                    "labels": {"eda.nokia.com/role": "leaf"},
+                },
+            }
+        ).encode()
+        for i in range(count)
+    ]
+
+
+def timed(model: type[BaseModel], data: list[bytes]) -> float:
+    validate = model.__pydantic_validator__.validate_json
+    start = time.perf_counter()
+    for payload in data:
+        validate(payload)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    kinds = resource_kinds()
+    data = {model: payloads(model, args.count) for model in kinds}
+    validated = len(kinds) * args.count
+    print(f"{len(kinds)} kinds, {args.count} headers each")
+    for label, names in (("apiVersion, kind", HEADER[:2]), ("with metadata", HEADER)):
+        literal_total = pattern_total = 0.0
+        for model in kinds:
+            literal, pattern = headers(model, names)
+            literal_total += timed(literal, data[model])
+            pattern_total += timed(pattern, data[model])
+        for name, total in (("Literal", literal_total), ("pattern", pattern_total)):
+            print(
+                f"{label:<17} {name:<8} {total:7.3f}s "
+                f"{total / validated * 1e9:6.0f} ns/header"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import argparse
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
@@ -25,6 +26,44 @@ install(show_locals=False)
 
 logger = logging.getLogger(__name__)
 
+# matches str fields constrained by a pattern that can only match one literal string,
+# e.g. Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
+LITERAL_PATTERN_FIELD = re.compile(
+    r'Annotated\[\s*str,\s*Field\(pattern="\^((?:[A-Za-z0-9/_-]|\\\\\.)+)\$"\)\s*\]'
+)
+
+# the typing import of a generated module, on one line or parenthesized
+TYPING_IMPORT = re.compile(r"^from typing import (?:\(([^)]*)\)|(.+))$", re.MULTILINE)
+# the first import of a module, after its docstring and comments
+FIRST_IMPORT = re.compile(r"^(?:from|import) ", re.MULTILINE)
+
+
+def add_typing_import(content: str, name: str) -> str:
+    """
+    Add a name to the typing import of a module, adding the import if needed.
+    :param content: Source of the module
+    :param name: Name to import from typing
+    """
+    typing_import = TYPING_IMPORT.search(content)
+    if typing_import is None:
+        future = re.search(r"^from __future__ import .+\n", content, re.MULTILINE)
+        if future is not None:
+            at = future.end()
+            return f"{content[:at]}\nfrom typing import {name}\n{content[at:]}"
+        first = FIRST_IMPORT.search(content)
+        at = first.start() if first is not None else 0
+        return f"{content[:at]}from typing import {name}\n{content[at:]}"
+
+    names = (typing_import.group(1) or typing_import.group(2)).split(",")
+    names = [n.strip() for n in names if n.strip()]
+    if name in names:
+        return content
+    return (
+        content[: typing_import.start()]
+        + f"from typing import {', '.join(sorted(names + [name]))}"
+        + content[typing_import.end() :]
+    )
+
 
 class Generator:
     def __init__(
@@ -173,6 +212,8 @@ class Generator:
 
             subprocess.run(cmd, check=True, env=env)
 
+            self.literalize_patterns(dest_file)
+
             # Format the generated file with ruff
             logger.debug(f"Formatting {dest_file} with ruff...")
             ruff_cmd = ["ruff", "format", str(dest_file)]
@@ -181,6 +222,30 @@ class Generator:
         except subprocess.CalledProcessError as e:
             logger.error(f"Error generating models for {spec_file}: {e}")
 
+    def literalize_patterns(self, dest_file: Path):
+        """
+        Replace str fields whose pattern matches exactly one string (apiVersion and
+        kind of every resource) with a Literal of that string, so that pydantic
+        validates them with an equality check instead of running a regex.
+        :param dest_file: Path to the generated models file
+        """
+        with open(dest_file, "r") as f:
+            content = f.read()
+
+        content, count = LITERAL_PATTERN_FIELD.subn(
+            lambda m: 'Literal["{}"]'.format(m.group(1).replace("\\\\.", ".")),
+            content,
+        )
+        if not count:
+            return
+
+        # make sure Literal is imported by the generated module
+        content = add_typing_import(content, "Literal")
+
+        logger.debug(f"Replaced {count} literal patterns in {dest_file}")
+        with open(dest_file, "w") as f:
+            f.write(content)
+
     def sanitize_schema_objects(self, spec_file: Path, api_name: str, api_version: str):
         """
         Sanitize schema objects by removing extra info like com.nokia.com, app name and api version
@@ -0,0 +1,239 @@
+"""
+Compiled field-path accessors for the generated models.
+
+`compile_accessor(model, path)` checks a path against the field tables of a
+model once and returns an accessor reading that path from instances, without
+splitting strings nor looking fields up at evaluation time:
+
+    holdtime = compile_accessor(Fabric, "spec.overlayProtocol.bgp.timers.holdTime")
+    holdtime(fabric)           # None when any field along the path is unset
+    holdtime.many(fabrics)     # one value per instance
+
+Paths are dotted (or JSON pointers) with [index] and ["key"] segments.
+`[*]` (or `*`) iterates over all the items of a list or values of a dict and
+makes the accessor return a list, flattened when several wildcards are used.
+Paths going through an untyped field (`Dict[str, Any]`, `Any`, e.g. the status
+of state kinds) can't be checked beyond it; the rest of the path is read from
+plain dicts and lists.
+"""
+
+import typing
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cache, partial
+from operator import attrgetter, itemgetter, methodcaller
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from pydantic_eda.fields import fields_by_key, fields_by_name
+from pydantic_eda.update import parse_path
+
+WILDCARD = "*"
+
+
+class PathError(ValueError):
+    """
+    Raised when a path does not exist in a model.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class _Step:
+    # "field", "index", "key", "dynamic" or "wildcard"
+    kind: str
+    arg: Any = None
+
+
+def _dynamic_get(value: Any, token: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(token)
+    if isinstance(value, list):
+        if token.isdigit() and int(token) < len(value):
+            return value[int(token)]
+        return None
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        spec = fields_by_key(cls).get(token) or fields_by_name(cls).get(token)
+        return None if spec is None else value.__dict__[spec.name]
+    return None
+
+
+def _untyped(annotation: Any) -> bool:
+    # values that can't be checked: Any, object, bare or Any-valued containers
+    if annotation is Any or annotation is object or annotation in (dict, list):
+        return True
+    args = typing.get_args(annotation)
+    return typing.get_origin(annotation) in (dict, list) and (
+        not args or _untyped(args[-1])
+    )
+
+
+def _steps(model: type[BaseModel], path: str) -> list[_Step]:
+    steps = []
+    # the class of the current value, None for scalars and untyped values
+    current: Optional[type[BaseModel]] = model
+    # "list" or "dict" when the current value is a container
+    container = None
+    # whether the items of the container are untyped
+    untyped_items = False
+    typed = True
+    try:
+        tokens = parse_path(path)
+    except ValueError as e:
+        raise PathError(str(e)) from None
+    for token in tokens:
+        if not typed:
+            steps.append(_Step("wildcard" if token == WILDCARD else "dynamic", token))
+            continue
+
+        if container is not None:
+            if token == WILDCARD:
+                steps.append(_Step("wildcard", container))
+            elif container == "list":
+                if not token.isdigit():
+                    raise PathError(
+                        f"{path!r}: expected an index or * instead of {token!r}"
+                    )
+                steps.append(_Step("index", int(token)))
+            else:
+                steps.append(_Step("key", token))
+            container = None
+            typed = not untyped_items
+            continue
+
+        if current is None:
+            raise PathError(f"{path!r}: {token!r} is below a scalar field")
+        if token == WILDCARD:
+            raise PathError(f"{path!r}: * used on a value that isn't a list or dict")
+        spec = fields_by_key(current).get(token) or fields_by_name(current).get(token)
+        if spec is None:
+            raise PathError(f"{path!r}: {current.__name__} has no field {token!r}")
+        steps.append(_Step("field", spec.name))
+        current = spec.model
+        container = spec.container
+        if container is not None:
+            untyped_items = current is None and _untyped(
+                typing.get_args(spec.annotation)[-1]
+            )
+        elif current is None and _untyped(spec.annotation):
+            typed = False
+    return steps
+
+
+def _op(step: _Step) -> Callable[[Any], Any]:
+    if step.kind == "index":
+        return itemgetter(step.arg)
+    if step.kind == "key":
+        return methodcaller("get", step.arg)
+    return partial(_dynamic_get, token=step.arg)
+
+
+def _chain(steps: list[_Step]) -> Callable[[Any], Any]:
+    """
+    Compose the function reading a path without wildcard from operator getters,
+    runs of fields being read by a single dotted attrgetter.
+    """
+    ops = []
+    names: list[str] = []
+    for step in steps:
+        if step.kind == "field":
+            names.append(step.arg)
+            continue
+        if names:
+            ops.append(attrgetter(".".join(names)))
+            names = []
+        ops.append(_op(step))
+    if names:
+        ops.append(attrgetter(".".join(names)))
+
+    # the fields are checked against the models: AttributeError comes from a
+    # None field within a run of fields, IndexError from a list too short
+    if len(ops) == 1:
+        (op,) = ops
+
+        def get_one(v):
+            if v is None:
+                return None
+            try:
+                return op(v)
+            except (AttributeError, IndexError):
+                return None
+
+        return get_one
+
+    def get(v):
+        try:
+            for op in ops:
+                if v is None:
+                    return None
+                v = op(v)
+            return v
+        except (AttributeError, IndexError):
+            return None
+
+    return get
+
+
+def _build(steps: list[_Step]) -> Callable[[Any], Any]:
+    for i, step in enumerate(steps):
+        if step.kind == "wildcard":
+            head = _chain(steps[:i])
+            tail = _build(steps[i + 1 :])
+            nested = any(s.kind == "wildcard" for s in steps[i + 1 :])
+
+            def get(v, head=head, tail=tail, nested=nested):
+                v = head(v)
+                if isinstance(v, dict):
+                    items = v.values()
+                elif isinstance(v, list):
+                    items = v
+                else:
+                    return []
+                if not nested:
+                    return [tail(item) for item in items]
+                return [r for item in items for r in tail(item)]
+
+            return get
+    return _chain(steps)
+
+
+class Accessor:
+    """
+    Reads a field path from instances of a model, see compile_accessor.
+    """
+
+    __slots__ = ("model", "path", "wildcard", "_get")
+
+    def __init__(self, model: type[BaseModel], path: str):
+        self.model = model
+        self.path = path
+        steps = _steps(model, path)
+        self.wildcard = any(s.kind == "wildcard" for s in steps)
+        self._get = _build(steps)
+
+    def __call__(self, instance: BaseModel) -> Any:
+        return self._get(instance)
+
+    def many(self, instances: Iterable[BaseModel]) -> list:
+        """
+        Read the path from many instances.
+        :param instances: Instances of the model
+        """
+        get = self._get
+        return [get(i) for i in instances]
+
+    def __repr__(self) -> str:
+        return f"Accessor({self.model.__name__}, {self.path!r})"
+
+
+@cache
+def compile_accessor(model: type[BaseModel], path: str) -> Accessor:
+    """
+    Compile a field path of a model into an accessor; accessors are cached.
+    Raises PathError if the path doesn't exist in the model.
+    :param model: The generated model class
+    :param path: Dotted path or JSON pointer, e.g. spec.overlayProtocol.bgp.timers
+        or status.members[*].operationalState
+    """
+    return Accessor(model, path)
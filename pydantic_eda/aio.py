@@ -0,0 +1,247 @@
+"""
+Async decoding of the generated models for asyncio services.
+
+Validating a large payload (a QueryResponse, a TransactionExecutionResult or
+a *List) inline blocks the event loop for as long as it takes. `DecodePool`
+validates payloads smaller than a threshold inline and hands larger ones over
+to a bounded executor, so the loop keeps serving other requests.
+
+pydantic-core holds the GIL for the whole validation of a payload, so only
+the default process executor keeps the loop running meanwhile; the resulting
+instance is pickled back, which still holds the GIL of the service for a
+fraction of the validation time. The thread executor only helps on
+free-threaded builds of Python. Worker processes are started with the
+forkserver method where available, spawn otherwise, as forking a threaded
+service is unsafe.
+
+`LoopLagMonitor` measures how late the event loop wakes up, to tune the
+threshold.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Literal, NamedTuple, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.decode import Buffer, as_json_input
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class PoolInfo(NamedTuple):
+    inline: int
+    offloaded: int
+    pending: int
+    max_pending: int
+
+
+class LagInfo(NamedTuple):
+    samples: int
+    last: float
+    max: float
+    mean: float
+
+
+def _default_mp_context() -> BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _validate(model: type[M], data: str | bytes | bytearray) -> M:
+    return model.__pydantic_validator__.validate_json(data)
+
+
+class DecodePool:
+    """
+    Decodes payloads inline or in an executor depending on their size.
+
+    Offloaded decodes are bounded by max_pending: once that many are in flight,
+    callers wait for one of them to complete, which pushes back on the producers
+    instead of queueing payloads without limit. The bound applies per event
+    loop when the pool is shared by several loops.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 64 * 1024,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        kind: Literal["thread", "process"] = "process",
+        mp_context: Optional[BaseContext] = None,
+    ):
+        """
+        :param threshold: Size in bytes from which payloads are decoded in the executor
+        :param max_workers: Number of workers of the executor, defaults to the
+            number of CPUs
+        :param max_pending: Maximum number of offloaded decodes in flight,
+            defaults to twice the number of workers
+        :param kind: Executor to use, "thread" or "process"
+        :param mp_context: Multiprocessing context of the process executor,
+            defaults to forkserver where available, spawn otherwise
+        """
+        self.threshold = threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        if kind == "process":
+            self._executor: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context or _default_mp_context(),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # semaphores are bound to the loop they are first used in
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._slots_lock = threading.Lock()
+        self._inline = 0
+        self._offloaded = 0
+        self._pending = 0
+
+    def _loop_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        with self._slots_lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+            return slots
+
+    async def decode(self, model: type[M], data: Buffer) -> M:
+        """
+        Validate a JSON payload into the given model.
+        :param model: The generated model class to validate into
+        :param data: JSON payload
+        """
+        data = as_json_input(data)
+        if len(data) < self.threshold:
+            self._inline += 1
+            return _validate(model, data)
+
+        loop = asyncio.get_running_loop()
+        async with self._loop_slots(loop):
+            self._pending += 1
+            try:
+                return await loop.run_in_executor(
+                    self._executor, _validate, model, data
+                )
+            finally:
+                self._pending -= 1
+                self._offloaded += 1
+
+    def info(self) -> PoolInfo:
+        """
+        Return the number of inline and offloaded decodes, and of decodes in flight.
+        """
+        return PoolInfo(self._inline, self._offloaded, self._pending, self.max_pending)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut the executor down.
+        :param wait: Wait for the decodes in flight to complete
+        """
+        self._executor.shutdown(wait=wait)
+
+
+_default_pool: Optional[DecodePool] = None
+_default_lock = threading.Lock()
+
+
+def configure(**kwargs) -> DecodePool:
+    """
+    Replace the shared pool used by `decode`, see DecodePool for the arguments.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is not None:
+            _default_pool.shutdown(wait=False)
+        _default_pool = DecodePool(**kwargs)
+        return _default_pool
+
+
+def default_pool() -> DecodePool:
+    """
+    Return the shared pool used by `decode`, created on first use.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = DecodePool()
+        return _default_pool
+
+
+async def decode(model: type[M], data: Buffer) -> M:
+    """
+    Validate a JSON payload into the given model using the shared pool.
+    :param model: The generated model class to validate into
+    :param data: JSON payload
+    """
+    return await default_pool().decode(model, data)
+
+
+class LoopLagMonitor:
+    """
+    Measures the event loop lag: how late a task sleeping for a fixed interval
+    wakes up.
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    ...
+    print(monitor.info().max)
+    """
+
+    def __init__(self, interval: float = 0.1):
+        """
+        :param interval: Time between two samples in seconds
+        """
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the samples collected so far.
+        """
+        self._samples = 0
+        self._last = 0.0
+        self._max = 0.0
+        self._total = 0.0
+
+    def start(self):
+        """
+        Start sampling on the running loop.
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        """
+        Stop sampling.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self._samples += 1
+            self._last = lag
+            self._max = max(self._max, lag)
+            self._total += lag
+
+    def info(self) -> LagInfo:
+        """
+        Return the number of samples and the last, max and mean lag in seconds.
+        """
+        mean = self._total / self._samples if self._samples else 0.0
+        return LagInfo(self._samples, self._last, self._max, mean)
@@ -0,0 +1,253 @@
+"""
+Deduplicating, indexed store of core alarms.
+
+Alarms (`AlarmData`, or the alarm of an `AlarmHistoryData` entry) are kept once
+per namespace and name, the most recently changed one according to
+`lastChanged` wins. The store maintains indexes on the fields alarms are
+usually filtered by, and the reverse of `parentAlarms`, so that both filters
+and the root-cause view are set operations instead of scans.
+"""
+
+import datetime
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from pydantic_eda.core.v25_8_1.models import AlarmData, AlarmHistoryData
+
+Key = tuple[Optional[str], str]
+
+# fields of AlarmData with an index
+INDEXED_FIELDS = (
+    "severity",
+    "kind",
+    "sourceKind",
+    "resource",
+    "namespace",
+    "clusterMember",
+    "cleared",
+    "acknowledged",
+)
+
+
+def _changed_at(alarm: AlarmData) -> Any:
+    value = alarm.lastChanged
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _newer(new: Any, old: Any) -> bool:
+    if old is None or new is None:
+        return new is not None or old is None
+    try:
+        return new >= old
+    except TypeError:
+        # timestamps in different forms, compare them as strings
+        return str(new) >= str(old)
+
+
+class AlarmStore:
+    """
+    Thread-safe store of alarms indexed by severity, kind, resource, namespace,
+    cluster member, state and parent alarms.
+
+    store = AlarmStore()
+    store.ingest_many(alarms)
+    critical = store.query(severity="critical", cleared=False)
+    roots = store.root_causes(cleared=False)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._alarms: dict[Key, AlarmData] = {}
+        self._changed: dict[Key, Any] = {}
+        # field -> value -> alarm keys
+        self._indexes: dict[str, dict[Any, set[Key]]] = {f: {} for f in INDEXED_FIELDS}
+        # alarm name -> keys of its children alarms
+        self._children: dict[str, set[Key]] = {}
+        # alarm name -> keys of the alarms with that name, in any namespace
+        self._names: dict[str, set[Key]] = {}
+
+    @staticmethod
+    def _add(table: dict, value: Any, key: Key):
+        table.setdefault(value, set()).add(key)
+
+    @staticmethod
+    def _discard(table: dict, value: Any, key: Key):
+        keys = table.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del table[value]
+
+    def _link(self, key: Key, alarm: AlarmData):
+        for field, index in self._indexes.items():
+            self._add(index, getattr(alarm, field), key)
+        for parent in alarm.parentAlarms or ():
+            self._add(self._children, parent, key)
+        self._add(self._names, key[1], key)
+
+    def _unlink(self, key: Key, alarm: AlarmData):
+        for field, index in self._indexes.items():
+            self._discard(index, getattr(alarm, field), key)
+        for parent in alarm.parentAlarms or ():
+            self._discard(self._children, parent, key)
+        self._discard(self._names, key[1], key)
+
+    def _ingest(self, alarm: AlarmData | AlarmHistoryData) -> bool:
+        if isinstance(alarm, AlarmHistoryData):
+            alarm = alarm.alarm
+            if alarm is None:
+                return False
+        if not alarm.name:
+            raise ValueError("alarms without a name can't be stored")
+
+        key = (alarm.namespace, alarm.name)
+        changed = _changed_at(alarm)
+        previous = self._alarms.get(key)
+        if previous is not None:
+            if not _newer(changed, self._changed[key]):
+                return False
+            self._unlink(key, previous)
+        self._alarms[key] = alarm
+        self._changed[key] = changed
+        self._link(key, alarm)
+        return True
+
+    def ingest(self, alarm: AlarmData | AlarmHistoryData) -> bool:
+        """
+        Add or update an alarm, returns False when the stored one is more recent.
+        :param alarm: An AlarmData, or an AlarmHistoryData entry
+        """
+        with self._lock:
+            return self._ingest(alarm)
+
+    def ingest_many(self, alarms: Iterable[AlarmData | AlarmHistoryData]) -> int:
+        """
+        Add or update alarms, returns the number of alarms stored or updated.
+        :param alarms: AlarmData or AlarmHistoryData entries
+        """
+        with self._lock:
+            return sum(self._ingest(alarm) for alarm in alarms)
+
+    def remove(self, name: str, namespace: Optional[str] = None) -> Optional[AlarmData]:
+        """
+        Remove an alarm, returns it if it was present.
+        :param name: Name of the alarm
+        :param namespace: Namespace of the alarm
+        """
+        key = (namespace, name)
+        with self._lock:
+            alarm = self._alarms.pop(key, None)
+            if alarm is not None:
+                del self._changed[key]
+                self._unlink(key, alarm)
+            return alarm
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[AlarmData]:
+        """
+        Return an alarm by name, or None.
+        :param name: Name of the alarm
+        :param namespace: Namespace of the alarm
+        """
+        return self._alarms.get((namespace, name))
+
+    def _select(self, criteria: dict[str, Any]) -> set[Key]:
+        if not criteria:
+            return set(self._alarms)
+        sets = []
+        for field, value in criteria.items():
+            index = self._indexes.get(field)
+            if index is None:
+                raise ValueError(f"{field} is not indexed, use one of {INDEXED_FIELDS}")
+            if isinstance(value, (list, tuple, set, frozenset)):
+                sets.append(set().union(*(index.get(v, ()) for v in value)))
+            else:
+                sets.append(index.get(value, set()))
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+    def query(self, **criteria: Any) -> list[AlarmData]:
+        """
+        Return the alarms matching all the criteria, e.g.
+        query(severity=("major", "critical"), cleared=False, namespace="eda").
+        A tuple, list or set of values matches any of them.
+        :param criteria: Values of indexed fields, see INDEXED_FIELDS
+        """
+        with self._lock:
+            return [self._alarms[k] for k in self._select(criteria)]
+
+    def _resolve(self, name: str, namespace: Optional[str]) -> set[Key]:
+        # parents are referenced by name, preferably in the same namespace
+        if (namespace, name) in self._alarms:
+            return {(namespace, name)}
+        return set(self._names.get(name, ()))
+
+    def _has_parent(self, alarm: AlarmData) -> bool:
+        return any(self._resolve(p, alarm.namespace) for p in alarm.parentAlarms or ())
+
+    def children(self, name: str, namespace: Optional[str] = None) -> list[AlarmData]:
+        """
+        Return the alarms listing the given alarm among their parents.
+        :param name: Name of the alarm
+        :param namespace: Namespace of the alarm
+        """
+        target = (namespace, name)
+        with self._lock:
+            return [
+                self._alarms[k]
+                for k in self._children.get(name, ())
+                if target in self._resolve(name, k[0])
+            ]
+
+    def roots_of(self, name: str, namespace: Optional[str] = None) -> list[AlarmData]:
+        """
+        Return the root causes of an alarm: the ancestors, following parentAlarms,
+        that have no parent in the store. An alarm without parents is its own root.
+        :param name: Name of the alarm
+        :param namespace: Namespace of the alarm
+        """
+        with self._lock:
+            start = self._resolve(name, namespace)
+            roots = set()
+            seen = set()
+            pending = list(start)
+            while pending:
+                key = pending.pop()
+                if key in seen:
+                    continue
+                seen.add(key)
+                parents = set()
+                for parent in self._alarms[key].parentAlarms or ():
+                    parents |= self._resolve(parent, key[0])
+                if parents:
+                    pending.extend(parents)
+                else:
+                    roots.add(key)
+            return [self._alarms[k] for k in roots]
+
+    def root_causes(self, **criteria: Any) -> list[AlarmData]:
+        """
+        Return the alarms matching the criteria that have no parent in the store.
+        :param criteria: Values of indexed fields, see query
+        """
+        with self._lock:
+            return [
+                alarm
+                for alarm in (self._alarms[k] for k in self._select(criteria))
+                if not alarm.parentAlarms or not self._has_parent(alarm)
+            ]
+
+    def values(self) -> list[AlarmData]:
+        """
+        Return the stored alarms.
+        """
+        with self._lock:
+            return list(self._alarms.values())
+
+    def __len__(self) -> int:
+        return len(self._alarms)
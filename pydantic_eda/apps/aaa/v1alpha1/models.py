@@ -366,8 +366,8 @@ class NodeGroup(BaseModel):
     NodeGroup is the Schema for the nodegroups API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^aaa\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^NodeGroup$")]
+    apiVersion: Literal["aaa.eda.nokia.com/v1alpha1"]
+    kind: Literal["NodeGroup"]
     metadata: NodeGroupMetadata
     spec: Annotated[
         NodeGroupSpec,
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import AwareDatetime, BaseModel, Field, RootModel
 
@@ -556,10 +556,8 @@ class Backend(BaseModel):
     Backend is the Schema for the backends API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^aifabrics\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Backend$")]
+    apiVersion: Literal["aifabrics.eda.nokia.com/v1alpha1"]
+    kind: Literal["Backend"]
     metadata: BackendMetadata
     spec: Annotated[
         BackendSpec,
@@ -559,8 +559,8 @@ class AppInstaller(BaseModel):
     AppInstaller is the Schema for the appinstallers API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^appstore\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^AppInstaller$")]
+    apiVersion: Literal["appstore.eda.nokia.com/v1"]
+    kind: Literal["AppInstaller"]
     metadata: AppInstallerMetadata
     spec: Annotated[AppInstallerSpec, Field(title="Specification")]
     status: Annotated[Optional[AppInstallerStatus], Field(title="Status")] = None
@@ -581,8 +581,8 @@ class Catalog(BaseModel):
     Catalog is the Schema for the catalogs API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^appstore\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Catalog$")]
+    apiVersion: Literal["appstore.eda.nokia.com/v1"]
+    kind: Literal["Catalog"]
     metadata: CatalogMetadata
     spec: Annotated[
         CatalogSpec,
@@ -615,8 +615,8 @@ class Registry(BaseModel):
     Registry is the Schema for the registries API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^appstore\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Registry$")]
+    apiVersion: Literal["appstore.eda.nokia.com/v1"]
+    kind: Literal["Registry"]
     metadata: RegistryMetadata
     spec: Annotated[
         RegistrySpec,
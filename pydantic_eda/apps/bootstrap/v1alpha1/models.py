@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import AwareDatetime, BaseModel, Field, RootModel
 
@@ -371,10 +371,8 @@ class Init(BaseModel):
     Init is the Schema for the inits API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^bootstrap\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Init$")]
+    apiVersion: Literal["bootstrap.eda.nokia.com/v1alpha1"]
+    kind: Literal["Init"]
     metadata: InitMetadata
     spec: Annotated[
         InitSpec,
@@ -406,10 +404,8 @@ class ManagementRouter(BaseModel):
     ManagementRouter is the Schema for the managementrouters API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^bootstrap\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^ManagementRouter$")]
+    apiVersion: Literal["bootstrap.eda.nokia.com/v1alpha1"]
+    kind: Literal["ManagementRouter"]
     metadata: ManagementRouterMetadata
     spec: Annotated[
         ManagementRouterSpec,
@@ -363,8 +363,8 @@ class Configlet(BaseModel):
     Configlet is the Schema for the configlets API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^config\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Configlet$")]
+    apiVersion: Literal["config.eda.nokia.com/v1alpha1"]
+    kind: Literal["Configlet"]
     metadata: ConfigletMetadata
     spec: Annotated[
         ConfigletSpec,
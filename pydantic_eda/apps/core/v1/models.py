@@ -2238,8 +2238,8 @@ class ClusterRole(BaseModel):
     ClusterRole is the Schema for the clusterroles API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^ClusterRole$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["ClusterRole"]
     metadata: ClusterRoleMetadata
     spec: Annotated[
         ClusterRoleSpec,
@@ -2271,8 +2271,8 @@ class Deviation(BaseModel):
     Deviation is the Schema for the deviations API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Deviation$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["Deviation"]
     metadata: DeviationMetadata
     spec: Annotated[
         DeviationSpec,
@@ -2295,8 +2295,8 @@ class DeviationAction(BaseModel):
     DeviationAction is the Schema for the deviationactions API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^DeviationAction$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["DeviationAction"]
     metadata: DeviationActionMetadata
     spec: Annotated[
         DeviationActionSpec,
@@ -2339,8 +2339,8 @@ class EdgeInterface(BaseModel):
     EdgeInterface is the Schema for the edgeinterfaces API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^EdgeInterface$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["EdgeInterface"]
     metadata: EdgeInterfaceMetadata
     spec: Annotated[
         EdgeInterfaceSpec,
@@ -2373,8 +2373,8 @@ class HttpProxy(BaseModel):
     HttpProxy is the Schema for the httpproxies API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^HttpProxy$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["HttpProxy"]
     metadata: HttpProxyMetadata
     spec: Annotated[
         HttpProxySpec,
@@ -2407,8 +2407,8 @@ class IPAllocationPool(BaseModel):
     IPAllocationPool is the Schema for the ipallocationpools API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^IPAllocationPool$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["IPAllocationPool"]
     metadata: IPAllocationPoolMetadata
     spec: Annotated[
         IPAllocationPoolSpec,
@@ -2441,8 +2441,8 @@ class IPInSubnetAllocationPool(BaseModel):
     IPInSubnetAllocationPool is the Schema for the ipinsubnetallocationpools API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^IPInSubnetAllocationPool$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["IPInSubnetAllocationPool"]
     metadata: IPInSubnetAllocationPoolMetadata
     spec: Annotated[
         IPInSubnetAllocationPoolSpec,
@@ -2475,8 +2475,8 @@ class IndexAllocationPool(BaseModel):
     IndexAllocationPool is the Schema for the indexallocationpools API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^IndexAllocationPool$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["IndexAllocationPool"]
     metadata: IndexAllocationPoolMetadata
     spec: Annotated[
         IndexAllocationPoolSpec,
@@ -2509,8 +2509,8 @@ class License(BaseModel):
     License is the Schema for the licenses API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^License$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["License"]
     metadata: LicenseMetadata
     spec: Annotated[
         LicenseSpec,
@@ -2540,8 +2540,8 @@ class Namespace(BaseModel):
     Namespace is the Schema for the namespaces API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Namespace$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["Namespace"]
     metadata: NamespaceMetadata
     spec: Annotated[
         NamespaceSpec,
@@ -2574,8 +2574,8 @@ class NodeProfile(BaseModel):
     NodeProfile is the Schema for the nodeprofiles API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^NodeProfile$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["NodeProfile"]
     metadata: NodeProfileMetadata
     spec: Annotated[
         NodeProfileSpec,
@@ -2602,8 +2602,8 @@ class NodeUser(BaseModel):
     NodeUser is the Schema for the nodeusers API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^NodeUser$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["NodeUser"]
     metadata: NodeUserMetadata
     spec: Annotated[
         NodeUserSpec,
@@ -2633,8 +2633,8 @@ class Role(BaseModel):
     Role is the Schema for the roles API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Role$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["Role"]
     metadata: RoleMetadata
     spec: Annotated[
         RoleSpec,
@@ -2666,8 +2666,8 @@ class SubnetAllocationPool(BaseModel):
     SubnetAllocationPool is the Schema for the subnetallocationpools API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^SubnetAllocationPool$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["SubnetAllocationPool"]
     metadata: SubnetAllocationPoolMetadata
     spec: Annotated[
         SubnetAllocationPoolSpec,
@@ -2700,8 +2700,8 @@ class TopoBreakout(BaseModel):
     TopoBreakout is the Schema for the topobreakouts API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^TopoBreakout$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["TopoBreakout"]
     metadata: TopoBreakoutMetadata
     spec: Annotated[
         TopoBreakoutSpec,
@@ -2734,8 +2734,8 @@ class TopoLink(BaseModel):
     TopoLink is the Schema for the topolinks API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^TopoLink$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["TopoLink"]
     metadata: TopoLinkMetadata
     spec: Annotated[
         TopoLinkSpec,
@@ -2768,8 +2768,8 @@ class TopoNode(BaseModel):
     TopoNode is the Schema for the toponodes API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^TopoNode$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["TopoNode"]
     metadata: TopoNodeMetadata
     spec: Annotated[
         TopoNodeSpec,
@@ -2802,8 +2802,8 @@ class UdpProxy(BaseModel):
     UdpProxy is the Schema for the udpproxies API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^UdpProxy$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["UdpProxy"]
     metadata: UdpProxyMetadata
     spec: Annotated[
         UdpProxySpec,
@@ -2836,8 +2836,8 @@ class Workflow(BaseModel):
     Workflow is the Schema for the workflows API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Workflow$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["Workflow"]
     metadata: WorkflowMetadata
     spec: Annotated[
         WorkflowSpec,
@@ -2860,8 +2860,8 @@ class WorkflowDefinition(BaseModel):
     WorkflowDefinition is the Schema for the workflowdefinitions API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^core\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^WorkflowDefinition$")]
+    apiVersion: Literal["core.eda.nokia.com/v1"]
+    kind: Literal["WorkflowDefinition"]
     metadata: WorkflowDefinitionMetadata
     spec: Annotated[
         WorkflowDefinitionSpec,
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, RootModel
 
@@ -185,10 +185,8 @@ class CliPlugin(BaseModel):
     CliPlugin is the Schema for the cliplugins API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^environment\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^CliPlugin$")]
+    apiVersion: Literal["environment.eda.nokia.com/v1alpha1"]
+    kind: Literal["CliPlugin"]
     metadata: CliPluginMetadata
     spec: Annotated[
         CliPluginSpec,
@@ -221,10 +219,8 @@ class SetupEnv(BaseModel):
     SetupEnv is the Schema for the setupenvs API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^environment\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^SetupEnv$")]
+    apiVersion: Literal["environment.eda.nokia.com/v1alpha1"]
+    kind: Literal["SetupEnv"]
     metadata: SetupEnvMetadata
     spec: Annotated[
         SetupEnvSpec,
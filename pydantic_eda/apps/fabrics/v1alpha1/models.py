@@ -1442,8 +1442,8 @@ class Fabric(BaseModel):
     Fabric is the Schema for the fabrics API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^fabrics\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Fabric$")]
+    apiVersion: Literal["fabrics.eda.nokia.com/v1alpha1"]
+    kind: Literal["Fabric"]
     metadata: FabricMetadata
     spec: Annotated[
         FabricSpec,
@@ -1476,8 +1476,8 @@ class ISL(BaseModel):
     ISL is the Schema for the isls API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^fabrics\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^ISL$")]
+    apiVersion: Literal["fabrics.eda.nokia.com/v1alpha1"]
+    kind: Literal["ISL"]
     metadata: ISLMetadata
     spec: Annotated[
         ISLSpec,
@@ -1509,8 +1509,8 @@ class IslPing(BaseModel):
     IslPing is the Schema for the islpings API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^fabrics\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^IslPing$")]
+    apiVersion: Literal["fabrics.eda.nokia.com/v1alpha1"]
+    kind: Literal["IslPing"]
     metadata: IslPingMetadata
     spec: Annotated[
         IslPingSpec,
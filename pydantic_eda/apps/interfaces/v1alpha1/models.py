@@ -913,10 +913,8 @@ class Breakout(BaseModel):
     Breakout is the Schema for the breakouts API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^interfaces\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Breakout$")]
+    apiVersion: Literal["interfaces.eda.nokia.com/v1alpha1"]
+    kind: Literal["Breakout"]
     metadata: BreakoutMetadata
     spec: Annotated[
         BreakoutSpec,
@@ -949,10 +947,8 @@ class CheckInterfaces(BaseModel):
     CheckInterfaces is the Schema for the checkinterfacess API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^interfaces\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^CheckInterfaces$")]
+    apiVersion: Literal["interfaces.eda.nokia.com/v1alpha1"]
+    kind: Literal["CheckInterfaces"]
     metadata: CheckInterfacesMetadata
     spec: Annotated[
         CheckInterfacesSpec,
@@ -985,10 +981,8 @@ class Interface(BaseModel):
     Interface is the Schema for the interfaces API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^interfaces\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Interface$")]
+    apiVersion: Literal["interfaces.eda.nokia.com/v1alpha1"]
+    kind: Literal["Interface"]
     metadata: InterfaceMetadata
     spec: Annotated[
         InterfaceSpec,
@@ -1015,10 +1009,8 @@ class InterfaceState(BaseModel):
     InterfaceState is the Schema for the interfacestates API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^interfaces\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^InterfaceState$")]
+    apiVersion: Literal["interfaces.eda.nokia.com/v1alpha1"]
+    kind: Literal["InterfaceState"]
     metadata: InterfaceStateMetadata
     spec: Annotated[InterfaceStateSpec, Field(title="Specification")]
     status: Annotated[
@@ -1585,8 +1585,8 @@ class Mirror(BaseModel):
     Mirror is the Schema for the mirrors API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^oam\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Mirror$")]
+    apiVersion: Literal["oam.eda.nokia.com/v1alpha1"]
+    kind: Literal["Mirror"]
     metadata: MirrorMetadata
     spec: Annotated[
         MirrorSpec,
@@ -1619,8 +1619,8 @@ class Ping(BaseModel):
     Ping is the Schema for the pings API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^oam\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Ping$")]
+    apiVersion: Literal["oam.eda.nokia.com/v1alpha1"]
+    kind: Literal["Ping"]
     metadata: PingMetadata
     spec: Annotated[
         PingSpec,
@@ -1652,8 +1652,8 @@ class TechSupport(BaseModel):
     TechSupport is the Schema for the techsupports API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^oam\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^TechSupport$")]
+    apiVersion: Literal["oam.eda.nokia.com/v1alpha1"]
+    kind: Literal["TechSupport"]
     metadata: TechSupportMetadata
     spec: Annotated[
         TechSupportSpec,
@@ -1686,8 +1686,8 @@ class Threshold(BaseModel):
     Threshold is the Schema for the thresholds API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^oam\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Threshold$")]
+    apiVersion: Literal["oam.eda.nokia.com/v1alpha1"]
+    kind: Literal["Threshold"]
     metadata: ThresholdMetadata
     spec: Annotated[
         ThresholdSpec,
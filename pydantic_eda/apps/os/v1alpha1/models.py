@@ -381,8 +381,8 @@ class DeployImage(BaseModel):
     DeployImage is the Schema for the deployimages API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^os\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^DeployImage$")]
+    apiVersion: Literal["os.eda.nokia.com/v1alpha1"]
+    kind: Literal["DeployImage"]
     metadata: DeployImageMetadata
     spec: Annotated[
         DeployImageSpec,
@@ -1759,8 +1759,8 @@ class EgressPolicy(BaseModel):
     EgressPolicy is the Schema for the egresspolicys API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^EgressPolicy$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["EgressPolicy"]
     metadata: EgressPolicyMetadata
     spec: Annotated[
         EgressPolicySpec,
@@ -1793,8 +1793,8 @@ class ForwardingClass(BaseModel):
     ForwardingClass is the Schema for the forwardingclasss API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^ForwardingClass$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["ForwardingClass"]
     metadata: ForwardingClassMetadata
     spec: Annotated[
         Optional[Dict[str, Any]],
@@ -1827,8 +1827,8 @@ class IngressPolicy(BaseModel):
     IngressPolicy is the Schema for the ingresspolicys API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^IngressPolicy$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["IngressPolicy"]
     metadata: IngressPolicyMetadata
     spec: Annotated[
         IngressPolicySpec,
@@ -1861,8 +1861,8 @@ class PolicyAttachment(BaseModel):
     PolicyAttachment is the Schema for the policyattachments API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^PolicyAttachment$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["PolicyAttachment"]
     metadata: PolicyAttachmentMetadata
     spec: Annotated[
         PolicyAttachmentSpec,
@@ -1895,8 +1895,8 @@ class PolicyDeployment(BaseModel):
     PolicyDeployment is the Schema for the policydeployments API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^PolicyDeployment$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["PolicyDeployment"]
     metadata: PolicyDeploymentMetadata
     spec: Annotated[
         PolicyDeploymentSpec,
@@ -1929,8 +1929,8 @@ class Queue(BaseModel):
     Queue is the Schema for the queues API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^qos\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Queue$")]
+    apiVersion: Literal["qos.eda.nokia.com/v1"]
+    kind: Literal["Queue"]
     metadata: QueueMetadata
     spec: Annotated[
         QueueSpec,
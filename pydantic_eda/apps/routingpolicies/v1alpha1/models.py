@@ -742,10 +742,8 @@ class ASPathSet(BaseModel):
     ASPathSet is the Schema for the aspathsets API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^routingpolicies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^ASPathSet$")]
+    apiVersion: Literal["routingpolicies.eda.nokia.com/v1alpha1"]
+    kind: Literal["ASPathSet"]
     metadata: ASPathSetMetadata
     spec: Annotated[
         ASPathSetSpec,
@@ -778,10 +776,8 @@ class CommunitySet(BaseModel):
     CommunitySet is the Schema for the communitysets API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^routingpolicies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^CommunitySet$")]
+    apiVersion: Literal["routingpolicies.eda.nokia.com/v1alpha1"]
+    kind: Literal["CommunitySet"]
     metadata: CommunitySetMetadata
     spec: Annotated[
         CommunitySetSpec,
@@ -814,10 +810,8 @@ class Policy(BaseModel):
     Policy is the Schema for the policys API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^routingpolicies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Policy$")]
+    apiVersion: Literal["routingpolicies.eda.nokia.com/v1alpha1"]
+    kind: Literal["Policy"]
     metadata: PolicyMetadata
     spec: Annotated[
         PolicySpec,
@@ -850,10 +844,8 @@ class PrefixSet(BaseModel):
     PrefixSet is the Schema for the prefixsets API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^routingpolicies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^PrefixSet$")]
+    apiVersion: Literal["routingpolicies.eda.nokia.com/v1alpha1"]
+    kind: Literal["PrefixSet"]
     metadata: PrefixSetMetadata
     spec: Annotated[
         PrefixSetSpec,
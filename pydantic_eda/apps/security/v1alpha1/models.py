@@ -315,8 +315,8 @@ class Keychain(BaseModel):
     Keychain is the Schema for the keychains API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^security\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Keychain$")]
+    apiVersion: Literal["security.eda.nokia.com/v1alpha1"]
+    kind: Literal["Keychain"]
     metadata: KeychainMetadata
     spec: Annotated[
         KeychainSpec,
@@ -339,8 +339,8 @@ class KeychainDeployment(BaseModel):
     KeychainDeployment is the Schema for the keychaindeployments API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^security\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^KeychainDeployment$")]
+    apiVersion: Literal["security.eda.nokia.com/v1alpha1"]
+    kind: Literal["KeychainDeployment"]
     metadata: KeychainDeploymentMetadata
     spec: Annotated[
         KeychainDeploymentSpec,
@@ -5482,8 +5482,8 @@ class BridgeDomain(BaseModel):
     BridgeDomain is the Schema for the bridgedomains API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^BridgeDomain$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["BridgeDomain"]
     metadata: BridgeDomainMetadata
     spec: Annotated[
         BridgeDomainSpec,
@@ -5516,8 +5516,8 @@ class BridgeInterface(BaseModel):
     BridgeInterface is the Schema for the bridgeinterfaces API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^BridgeInterface$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["BridgeInterface"]
     metadata: BridgeInterfaceMetadata
     spec: Annotated[
         BridgeInterfaceSpec,
@@ -5544,8 +5544,8 @@ class DHCPRelay(BaseModel):
     DHCPRelay is the Schema for the dhcprelays API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^DHCPRelay$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["DHCPRelay"]
     metadata: DHCPRelayMetadata
     spec: Annotated[
         DHCPRelaySpec,
@@ -5578,8 +5578,8 @@ class EdgePing(BaseModel):
     EdgePing is the Schema for the edgepings API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^EdgePing$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["EdgePing"]
     metadata: EdgePingMetadata
     spec: Annotated[
         EdgePingSpec,
@@ -5612,8 +5612,8 @@ class IRBInterface(BaseModel):
     IRBInterface is the Schema for the irbinterfaces API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^IRBInterface$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["IRBInterface"]
     metadata: IRBInterfaceMetadata
     spec: Annotated[
         IRBInterfaceSpec,
@@ -5646,8 +5646,8 @@ class RoutedInterface(BaseModel):
     RoutedInterface is the Schema for the routedinterfaces API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^RoutedInterface$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["RoutedInterface"]
     metadata: RoutedInterfaceMetadata
     spec: Annotated[
         RoutedInterfaceSpec,
@@ -5680,8 +5680,8 @@ class Router(BaseModel):
     Router is the Schema for the routers API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^Router$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["Router"]
     metadata: RouterMetadata
     spec: Annotated[
         RouterSpec,
@@ -5714,8 +5714,8 @@ class VLAN(BaseModel):
     VLAN is the Schema for the vlans API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^VLAN$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["VLAN"]
     metadata: VLANMetadata
     spec: Annotated[
         VLANSpec,
@@ -5742,8 +5742,8 @@ class VirtualNetwork(BaseModel):
     VirtualNetwork is the Schema for the virtualnetworks API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^services\\.eda\\.nokia\\.com/v1$")]
-    kind: Annotated[str, Field(pattern="^VirtualNetwork$")]
+    apiVersion: Literal["services.eda.nokia.com/v1"]
+    kind: Literal["VirtualNetwork"]
     metadata: VirtualNetworkMetadata
     spec: Annotated[
         VirtualNetworkSpec,
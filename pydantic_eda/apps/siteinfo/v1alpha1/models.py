@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import AwareDatetime, BaseModel, Field, RootModel
 
@@ -321,8 +321,8 @@ class Banner(BaseModel):
     Banner is the Schema for the banners API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^siteinfo\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Banner$")]
+    apiVersion: Literal["siteinfo.eda.nokia.com/v1alpha1"]
+    kind: Literal["Banner"]
     metadata: BannerMetadata
     spec: Annotated[
         BannerSpec,
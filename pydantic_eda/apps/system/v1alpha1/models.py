@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import AwareDatetime, BaseModel, Field, RootModel
 
@@ -652,8 +652,8 @@ class Monitor(BaseModel):
     Monitor is the Schema for the monitors API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^system\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^Monitor$")]
+    apiVersion: Literal["system.eda.nokia.com/v1alpha1"]
+    kind: Literal["Monitor"]
     metadata: MonitorMetadata
     spec: Annotated[
         MonitorSpec,
@@ -676,8 +676,8 @@ class MonitorAggregateState(BaseModel):
     MonitorAggregateState is the Schema for the monitoraggregatestates API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^system\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^MonitorAggregateState$")]
+    apiVersion: Literal["system.eda.nokia.com/v1alpha1"]
+    kind: Literal["MonitorAggregateState"]
     metadata: MonitorAggregateStateMetadata
     spec: Annotated[
         MonitorAggregateStateSpec,
@@ -720,8 +720,8 @@ class MonitorState(BaseModel):
     MonitorState is the Schema for the monitorstates API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^system\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^MonitorState$")]
+    apiVersion: Literal["system.eda.nokia.com/v1alpha1"]
+    kind: Literal["MonitorState"]
     metadata: MonitorStateMetadata
     spec: Annotated[
         MonitorStateSpec,
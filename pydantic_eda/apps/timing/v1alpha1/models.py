@@ -395,8 +395,8 @@ class NTPClient(BaseModel):
     NTPClient is the Schema for the ntpclients API
     """
 
-    apiVersion: Annotated[str, Field(pattern="^timing\\.eda\\.nokia\\.com/v1alpha1$")]
-    kind: Annotated[str, Field(pattern="^NTPClient$")]
+    apiVersion: Literal["timing.eda.nokia.com/v1alpha1"]
+    kind: Literal["NTPClient"]
     metadata: NTPClientMetadata
     spec: Annotated[
         NTPClientSpec,
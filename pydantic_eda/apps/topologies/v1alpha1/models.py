@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import AwareDatetime, BaseModel, Field, RootModel
 
@@ -650,10 +650,8 @@ class Topology(BaseModel):
     Topology is the Schema for the topologies API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^topologies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^Topology$")]
+    apiVersion: Literal["topologies.eda.nokia.com/v1alpha1"]
+    kind: Literal["Topology"]
     metadata: TopologyMetadata
     spec: Annotated[
         TopologySpec,
@@ -676,10 +674,8 @@ class DeviationOverlay(BaseModel):
     DeviationOverlay is the Schema for the deviationoverlays API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^topologies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^DeviationOverlay$")]
+    apiVersion: Literal["topologies.eda.nokia.com/v1alpha1"]
+    kind: Literal["DeviationOverlay"]
     metadata: DeviationOverlayMetadata
     spec: Annotated[
         DeviationOverlaySpec,
@@ -712,10 +708,8 @@ class LldpOverlay(BaseModel):
     LldpOverlay is the Schema for the lldpoverlays API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^topologies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^LldpOverlay$")]
+    apiVersion: Literal["topologies.eda.nokia.com/v1alpha1"]
+    kind: Literal["LldpOverlay"]
     metadata: LldpOverlayMetadata
     spec: Annotated[
         LldpOverlaySpec,
@@ -748,10 +742,8 @@ class TopologyGrouping(BaseModel):
     TopologyGrouping is the Schema for the topologygroupings API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^topologies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^TopologyGrouping$")]
+    apiVersion: Literal["topologies.eda.nokia.com/v1alpha1"]
+    kind: Literal["TopologyGrouping"]
     metadata: TopologyGroupingMetadata
     spec: Annotated[
         TopologyGroupingSpec,
@@ -794,10 +786,8 @@ class TrafficRateOverlay(BaseModel):
     TrafficRateOverlay is the Schema for the trafficrateoverlays API
     """
 
-    apiVersion: Annotated[
-        str, Field(pattern="^topologies\\.eda\\.nokia\\.com/v1alpha1$")
-    ]
-    kind: Annotated[str, Field(pattern="^TrafficRateOverlay$")]
+    apiVersion: Literal["topologies.eda.nokia.com/v1alpha1"]
+    kind: Literal["TrafficRateOverlay"]
     metadata: TrafficRateOverlayMetadata
     spec: Annotated[
         TrafficRateOverlaySpec,
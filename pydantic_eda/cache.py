@@ -0,0 +1,117 @@
+"""
+Opt-in cache of validated models keyed by the digest of the raw JSON payload.
+
+Reconcile loops tend to receive the very same payloads on every periodic list
+call. Instead of re-validating them, the cache hashes the raw bytes and hands
+back the instance validated the first time those bytes were seen.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.decode import Buffer, as_json_input
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def digest(data: Buffer) -> bytes:
+    """
+    Compute the digest used as a cache key for a raw payload.
+    :param data: Raw JSON payload
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    # hashlib reads any buffer (memoryview, mmap) without copying it
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ValidationCache:
+    """
+    A bounded LRU cache of validated model instances.
+
+    Entries are keyed by the target model and the digest of the raw JSON bytes.
+    Returned instances are plain instances of the model, shared between callers
+    nested sub-models included: they must not be mutated, unless requested as
+    copies.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[type[BaseModel], bytes], BaseModel] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def validate_json(self, model: type[M], data: Buffer, copy: bool = False) -> M:
+        """
+        Validate a JSON payload into the given model, reusing the previously
+        validated instance when the very same bytes were seen before.
+        :param model: The generated model class to validate into
+        :param data: Raw JSON payload
+        :param copy: Return a deep copy of the cached instance, for callers that
+            mutate it
+        """
+        key = (model, digest(data))
+
+        with self._lock:
+            instance = self._entries.get(key)
+            if instance is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return instance.model_copy(deep=True) if copy else instance
+            self._misses += 1
+
+        # validate outside of the lock, concurrent misses on the same payload
+        # simply race to store an equivalent instance
+        instance = model.__pydantic_validator__.validate_json(as_json_input(data))
+
+        with self._lock:
+            self._entries[key] = instance
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return instance.model_copy(deep=True) if copy else instance
+
+    def info(self) -> CacheInfo:
+        """
+        Return the hit/miss/eviction counters and the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self):
+        """
+        Drop all cached instances and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,82 @@
+"""
+Canonical serialization and content fingerprints of the generated models.
+
+`model_dump_json` output depends on which fields were explicitly set, on dict
+insertion order and on whether defaults were spelled out. The canonical form
+removes all of these so that two instances describing the same resource always
+serialize to the same bytes:
+
+- keys are sorted at every level
+- fields holding None or their schema default are omitted
+- the `status` of resources is omitted, it is owned by the server
+- JSON is compact (no whitespace) and UTF-8 encoded, non-ASCII is not escaped
+
+Fingerprint format (version 1): the hex blake2b digest (16 bytes) of the
+canonical JSON, prefixed by "1:". The format is guaranteed to stay the same
+across releases of this library; should it ever change, the prefix changes too,
+so fingerprints of different formats never compare equal by accident.
+Note that dropping defaults means a fingerprint changes when EDA changes the
+default of a field the resource leaves unset.
+
+The canonical JSON is the `json.dumps` output of `canonical_dict`, a single
+path whose bytes don't depend on how pydantic-core formats numbers. It is not
+fast: 100k `Interface` fingerprints take about 1.9s here, against 0.5s for
+`model_dump_json` with the same exclusions (benchmarks/canonical.py), and the
+target of well under a second for 100k is not met.
+"""
+
+import hashlib
+import json
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+
+FINGERPRINT_VERSION = "1"
+
+# fields owned by the server, never part of the canonical form of a resource
+SERVER_FIELDS = frozenset({"status"})
+
+
+@cache
+def _exclude(model: type[BaseModel]) -> Any:
+    return frozenset(f for f in SERVER_FIELDS if f in model.model_fields) or None
+
+
+def canonical_dict(instance: BaseModel) -> dict:
+    """
+    Return the canonical form of an instance as JSON-compatible python objects.
+    :param instance: A generated model instance
+    """
+    exclude = _exclude(type(instance))
+    return instance.__pydantic_serializer__.to_python(
+        instance,
+        mode="json",
+        by_alias=True,
+        exclude_none=True,
+        exclude_defaults=True,
+        exclude=exclude,
+    )
+
+
+def canonical_json(instance: BaseModel) -> bytes:
+    """
+    Serialize an instance into its canonical JSON form.
+    :param instance: A generated model instance
+    """
+    return json.dumps(
+        canonical_dict(instance),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode()
+
+
+def fingerprint(instance: BaseModel) -> str:
+    """
+    Return the content fingerprint of an instance, e.g. to detect drift between the
+    desired and the observed version of a resource, or to skip no-op writes.
+    :param instance: A generated model instance
+    """
+    digest = hashlib.blake2b(canonical_json(instance), digest_size=16).hexdigest()
+    return f"{FINGERPRINT_VERSION}:{digest}"
@@ -0,0 +1,291 @@
+"""
+Schema-aware positional codecs for the generated models.
+
+JSON repeats every key of every object. Since both ends of our own services
+share the generated models, instances can instead be encoded positionally:
+every model becomes a map of its explicitly set fields keyed by their position
+in declaration order ("0", "1", ...); unset fields hold their defaults and are
+not sent. Each payload starts with the schema fingerprint of the encoded model,
+which covers the format version, so a reader built from different models
+rejects it instead of silently mis-decoding it.
+
+Decoding runs in pydantic-core, with validators built from the core schemas of
+the models whose validation aliases are the field positions: the nested
+instances, the defaults of unset fields and the set fields are all handled
+there, without per-field Python work. Decoded instances have the same set
+fields as the encoded ones, so that their exclude_unset serialization is the
+same.
+
+Two codecs are provided: `JsonCodec` (compact positional JSON, no extra
+dependency) and `MsgpackCodec` (requires the `msgpack` extra).
+"""
+
+import abc
+import datetime
+import hashlib
+from collections.abc import Callable
+from functools import cache
+from typing import Any, Optional, TypeVar
+
+from pydantic import AwareDatetime, BaseModel, SecretStr, ValidationError
+from pydantic_core import SchemaValidator, core_schema, from_json, to_json
+
+from pydantic_eda.fields import FieldSpec, field_table
+
+M = TypeVar("M", bound=BaseModel)
+
+# version of the positional format, part of the schema fingerprints
+FORMAT_VERSION = 3
+
+# scalar types that are not natively representable, with their encoder; the
+# validators of the models parse them back
+_SCALARS: dict[Any, Callable[[Any], Any]] = {
+    AwareDatetime: datetime.datetime.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    SecretStr: SecretStr.get_secret_value,
+}
+
+
+class CodecError(ValueError):
+    """
+    Raised when a payload can't be decoded into the requested model.
+    """
+
+
+def _feed_schema(model: type[BaseModel], h, seen: dict[type, int]):
+    if model in seen:
+        h.update(b"@%d;" % seen[model])
+        return
+    seen[model] = len(seen)
+
+    h.update(b"{")
+    for spec in field_table(model):
+        h.update(f"{spec.key}:{spec.container}:".encode())
+        if spec.model is not None:
+            _feed_schema(spec.model, h, seen)
+        elif spec.literals is not None:
+            h.update(repr(spec.literals).encode())
+        else:
+            h.update(
+                getattr(spec.annotation, "__name__", repr(spec.annotation)).encode()
+            )
+        h.update(b";")
+    h.update(b"}")
+
+
+@cache
+def schema_fingerprint(model: type[BaseModel]) -> bytes:
+    """
+    Return an 8-byte fingerprint of the structure of a model: field keys and order,
+    containers, scalar types and Literal values, nested models included, and of
+    the version of the positional format.
+    :param model: The generated model class
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(b"v%d;" % FORMAT_VERSION)
+    _feed_schema(model, h, {})
+    return h.digest()
+
+
+def _field_encoder(spec: FieldSpec) -> Optional[Callable[[Any], Any]]:
+    if spec.model is not None:
+        if spec.container == "list":
+            return lambda v: [encoder(type(i))(i) for i in v]
+        if spec.container == "dict":
+            return lambda v: {k: encoder(type(i))(i) for k, i in v.items()}
+        return lambda v: encoder(type(v))(v)
+
+    if spec.container is None:
+        return _SCALARS.get(spec.annotation)
+    return None
+
+
+@cache
+def encoder(model: type[BaseModel]) -> Callable[[BaseModel], Any]:
+    """
+    Return the function encoding instances of a model into positional maps.
+    :param model: The generated model class
+    """
+    plan = [
+        (spec.name, str(i), _field_encoder(spec))
+        for i, spec in enumerate(field_table(model))
+    ]
+    if model.__pydantic_root_model__:
+        # root models are validated from their value
+        ((name, _, enc),) = plan
+
+        def encode_root(instance: BaseModel) -> Any:
+            v = instance.__dict__[name]
+            return v if enc is None or v is None else enc(v)
+
+        return encode_root
+
+    def encode(instance: BaseModel) -> dict[str, Any]:
+        values = instance.__dict__
+        fields_set = instance.model_fields_set
+        out = {}
+        # unset fields hold their defaults, they don't need to be sent
+        for name, key, enc in plan:
+            if name in fields_set:
+                v = values[name]
+                out[key] = v if enc is None or v is None else enc(v)
+        return out
+
+    return encode
+
+
+def _positional(schema: Any) -> Any:
+    """
+    Copy a core schema, validating the fields of every model from their position.
+    """
+    if isinstance(schema, list):
+        return [_positional(s) for s in schema]
+    if not isinstance(schema, dict):
+        return schema
+    copy = {k: _positional(v) for k, v in schema.items()}
+    if copy.get("type") == "model" and copy["schema"].get("type") == "model-fields":
+        keys = {spec.name: str(i) for i, spec in enumerate(field_table(copy["cls"]))}
+        copy["schema"]["fields"] = {
+            name: field | {"validation_alias": keys[name]}
+            for name, field in copy["schema"]["fields"].items()
+        }
+    return copy
+
+
+@cache
+def _validator(model: type[BaseModel]) -> SchemaValidator:
+    # build every nested validator from the copy, not from the model classes
+    return SchemaValidator(
+        _positional(model.__pydantic_core_schema__), _use_prebuilt=False
+    )
+
+
+@cache
+def _json_validator(model: type[BaseModel]) -> SchemaValidator:
+    # the whole [fingerprint, payload] pair, a foreign fingerprint fails item 0
+    return SchemaValidator(
+        core_schema.tuple_schema(
+            [
+                core_schema.literal_schema([schema_fingerprint(model).hex()]),
+                _positional(model.__pydantic_core_schema__),
+            ]
+        ),
+        _use_prebuilt=False,
+    )
+
+
+def _mismatch(model: type[BaseModel]) -> CodecError:
+    return CodecError(
+        f"payload was not encoded from the {model.__name__} schema in use"
+    )
+
+
+def _malformed(model: type[BaseModel], e: ValidationError) -> CodecError:
+    return CodecError(f"malformed {model.__name__} payload: {e}")
+
+
+@cache
+def decoder(model: type[M]) -> Callable[[Any], M]:
+    """
+    Return the function decoding positional maps into instances of a model.
+    :param model: The generated model class
+    """
+    validate = _validator(model).validate_python
+
+    def decode(data: Any) -> M:
+        try:
+            return validate(data)
+        except ValidationError as e:
+            raise _malformed(model, e) from None
+
+    return decode
+
+
+class Codec(abc.ABC):
+    """
+    Base class of the positional codecs.
+    """
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize a [fingerprint, payload] pair.
+        :param obj: The pair, the fingerprint as bytes
+        """
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a [fingerprint, payload] pair.
+        :param data: The serialized pair
+        """
+
+    def encode(self, instance: BaseModel) -> bytes:
+        """
+        Encode an instance of a generated model.
+        :param instance: A generated model instance
+        """
+        return self.dumps(
+            [schema_fingerprint(type(instance)), encoder(type(instance))(instance)]
+        )
+
+    def decode(self, model: type[M], data: bytes) -> M:
+        """
+        Decode a payload into an instance of the given model.
+        Raises CodecError if the payload was encoded from a different schema.
+        :param model: The generated model class to decode into
+        :param data: The encoded payload
+        """
+        try:
+            fingerprint, payload = self.loads(data)
+        except (ValueError, TypeError) as e:
+            raise CodecError(f"malformed payload: {e}") from e
+        if fingerprint != schema_fingerprint(model):
+            raise _mismatch(model)
+        return decoder(model)(payload)
+
+
+class JsonCodec(Codec):
+    """
+    Positional compact JSON codec, written and parsed by pydantic-core.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        fingerprint, payload = obj
+        return to_json([fingerprint.hex(), payload])
+
+    def loads(self, data: bytes) -> Any:
+        fingerprint, payload = from_json(data)
+        return bytes.fromhex(fingerprint), payload
+
+    def decode(self, model: type[M], data: bytes) -> M:
+        # parse and validate in one pass
+        try:
+            return _json_validator(model).validate_json(data)[1]
+        except ValidationError as e:
+            if any(error["loc"] == (0,) for error in e.errors()):
+                raise _mismatch(model) from None
+            raise _malformed(model, e) from None
+
+
+class MsgpackCodec(Codec):
+    """
+    Positional msgpack codec, requires the msgpack package.
+    """
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "MsgpackCodec requires msgpack, install pydantic-eda[msgpack]"
+            ) from e
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._unpackb = msgpack.unpackb
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._packer.pack(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._unpackb(data, raw=False, use_list=True, strict_map_key=False)
@@ -0,0 +1,261 @@
+"""
+Columnar export of lists of generated model instances to NumPy arrays.
+
+A set of scalar field paths is flattened into one array per path, reading the
+attributes of the instances in a single pass:
+
+- int fields become int64 columns, missing values are INT_MISSING
+- float fields become float64 columns, missing values are NaN
+- bool fields become int8 columns: 1, 0 and -1 when missing
+- Literal fields become int8 codes, the index of the value among the Literal
+  values (stable across exports), -1 when missing
+- str fields are dictionary-encoded into int32 codes, -1 when missing
+- datetime fields become datetime64[ns] columns, missing values are NaT
+- date fields become datetime64[D] columns, missing values are NaT
+
+Items of lists and dicts are addressed by index or key. Below untyped fields
+(`Dict[str, Any]`, `Any`, e.g. the status of state kinds) paths can't be
+checked, their values are read from plain dicts and lists and the caller
+gives their type, str by default.
+
+Requires numpy, install pydantic-eda[numpy].
+"""
+
+import datetime
+import types
+import typing
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic import AwareDatetime, BaseModel
+
+from pydantic_eda.access import compile_accessor
+from pydantic_eda.fields import fields_by_key, fields_by_name
+from pydantic_eda.update import parse_path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+INT_MISSING = -(2**63)
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    path: str
+    # one of int, float, bool, literal, str, datetime, date
+    kind: str
+    # Literal values of literal columns
+    literals: Optional[tuple] = None
+
+
+class ColumnTable:
+    """
+    Columns exported from a list of instances, keyed by field path.
+    String and Literal columns hold codes, decoded with `categories`.
+    """
+
+    def __init__(self, columns: dict[str, Any], categories: dict[str, tuple]):
+        self.columns = columns
+        self.categories = categories
+
+    def __getitem__(self, path: str):
+        return self.columns[path]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def decode(self, path: str) -> list:
+        """
+        Return the values of a coded (str or Literal) column, None when missing.
+        :param path: Field path of the column
+        """
+        categories = self.categories[path]
+        return [categories[c] if c >= 0 else None for c in self.columns[path].tolist()]
+
+    def to_structured(self):
+        """
+        Return the columns as a NumPy structured array, one field per path.
+        """
+        dtype = [(path, column.dtype) for path, column in self.columns.items()]
+        array = np.empty(len(self), dtype=dtype)
+        for path, column in self.columns.items():
+            array[path] = column
+        return array
+
+
+def _kind(annotation: Any) -> str:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _kind(typing.get_args(annotation)[0])
+    if origin is typing.Union or origin is types.UnionType:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return _kind(args[0])
+    if annotation is bool:
+        return "bool"
+    if annotation is int:
+        return "int"
+    if annotation is float:
+        return "float"
+    if annotation is str:
+        return "str"
+    if annotation in (AwareDatetime, datetime.datetime):
+        return "datetime"
+    if annotation is datetime.date:
+        return "date"
+    raise TypeError(f"unsupported column type {annotation!r}")
+
+
+def _untyped(annotation: Any) -> bool:
+    # values read from plain dicts and lists: Any, bare or Any-valued containers
+    if annotation is Any or annotation is object or annotation in (dict, list):
+        return True
+    args = typing.get_args(annotation)
+    return typing.get_origin(annotation) in (dict, list) and (
+        not args or _untyped(args[-1])
+    )
+
+
+def compile_column(
+    model: type[BaseModel], path: str, dtype: Optional[type] = None
+) -> Column:
+    """
+    Resolve a scalar field path against a model.
+    :param model: The generated model class of the items
+    :param path: Dotted path or JSON pointer of a scalar field, list and dict
+        items are addressed by index or key, e.g. spec.members[0].node
+    :param dtype: Type of the values of a path below an untyped field, one of
+        int, float, bool, str, datetime.datetime and datetime.date, str by default
+    """
+    current: Optional[type[BaseModel]] = model
+    spec = None
+    annotation: Any = None
+    tokens = parse_path(path)
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == "*":
+            raise ValueError(f"{path!r}: * can't be used in a column")
+        if annotation is not None and _untyped(annotation):
+            # the rest of the path is read from plain dicts and lists
+            i += 1
+            continue
+        if current is None:
+            raise ValueError(f"{path!r}: {token!r} is below a scalar field")
+        spec = fields_by_key(current).get(token) or fields_by_name(current).get(token)
+        if spec is None:
+            raise ValueError(f"{path!r}: {current.__name__} has no field {token!r}")
+        annotation = spec.annotation
+        i += 1
+        if spec.container is not None:
+            if spec.container == "list" and (
+                i == len(tokens) or not tokens[i].isdigit()
+            ):
+                raise ValueError(f"{path!r}: list {token!r} needs an index")
+            if i == len(tokens) or tokens[i] == "*":
+                raise ValueError(f"{path!r}: dict {token!r} needs a key")
+            annotation = typing.get_args(annotation)[-1]
+            i += 1
+        current = spec.model
+
+    if spec is None:
+        raise ValueError(f"{path!r} is not a scalar field")
+    if _untyped(annotation):
+        return Column(path, _kind(dtype or str))
+    if spec.model is not None:
+        raise ValueError(f"{path!r} is not a scalar field")
+    if spec.literals is not None:
+        return Column(path, "literal", spec.literals)
+    return Column(path, _kind(annotation))
+
+
+def _parse_datetime(value: Any) -> Any:
+    # values below untyped fields are still JSON strings
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_date(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def to_columns(
+    items: BaseModel | Iterable[BaseModel],
+    paths: Sequence[str],
+    model: Optional[type[BaseModel]] = None,
+    dtypes: Optional[Mapping[str, type]] = None,
+) -> ColumnTable:
+    """
+    Export scalar fields of a list of instances into NumPy columns.
+    :param items: A generated *List instance, or an iterable of instances of one kind
+    :param paths: Field paths of the columns, e.g. spec.members[0].node
+    :param model: The model class of the items, taken from the first item by default
+    :param dtypes: Types of the paths below untyped fields, see compile_column
+    """
+    if np is None:
+        raise ImportError("to_columns requires numpy, install pydantic-eda[numpy]")
+
+    if isinstance(items, BaseModel):
+        items = items.items or []
+    items = items if isinstance(items, Sequence) else list(items)
+    if model is None:
+        if not items:
+            return ColumnTable({p: np.empty(0) for p in paths}, {})
+        model = type(items[0])
+
+    dtypes = dtypes or {}
+    columns = [compile_column(model, p, dtypes.get(p)) for p in paths]
+    getters = [compile_accessor(model, p) for p in paths]
+    values: list[list] = [[] for _ in columns]
+    appends = [v.append for v in values]
+
+    # single pass over the instances
+    for item in items:
+        for get, append in zip(getters, appends):
+            append(get(item))
+
+    arrays = {}
+    categories = {}
+    for column, data in zip(columns, values):
+        if column.kind == "int":
+            arrays[column.path] = np.array(
+                [INT_MISSING if v is None else v for v in data], dtype=np.int64
+            )
+        elif column.kind == "float":
+            arrays[column.path] = np.array(
+                [np.nan if v is None else v for v in data], dtype=np.float64
+            )
+        elif column.kind == "bool":
+            arrays[column.path] = np.array(
+                [-1 if v is None else v for v in data], dtype=np.int8
+            )
+        elif column.kind == "datetime":
+            arrays[column.path] = np.array(
+                ["NaT" if v is None else _parse_datetime(v) for v in data],
+                dtype="datetime64[ns]",
+            )
+        elif column.kind == "date":
+            arrays[column.path] = np.array(
+                ["NaT" if v is None else _parse_date(v) for v in data],
+                dtype="datetime64[D]",
+            )
+        else:
+            if column.kind == "literal":
+                codes = {v: i for i, v in enumerate(column.literals)}
+            else:
+                codes = {}
+            setdefault = codes.setdefault
+            arrays[column.path] = np.array(
+                [-1 if v is None else setdefault(v, len(codes)) for v in data],
+                dtype=np.int8 if column.kind == "literal" else np.int32,
+            )
+            categories[column.path] = tuple(codes)
+    return ColumnTable(arrays, categories)
@@ -0,0 +1,179 @@
+"""
+Compact read-only variants of the generated models.
+
+A pydantic instance carries its `__dict__` and the set of explicitly set fields.
+For large caches of read-only resources (InterfaceState, BGPPeerState, Monitor,
+Fan, MonitorState, ...) that bookkeeping dominates the memory footprint.
+`compact()` generates a slotted named tuple mirroring a model class, with
+nested models converted to their own compact variants, lists to tuples and
+dicts to FrozenDict, so compact instances are immutable and hashable. The
+explicitly set fields are kept as a bitmask in a trailing `fields_set_` entry.
+"""
+
+from collections import namedtuple
+from functools import cache
+from typing import Any, Callable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.fields import FieldSpec, construct, field_table
+
+M = TypeVar("M", bound=BaseModel)
+
+# name of the entry holding the bitmask of the explicitly set fields
+FIELDS_SET = "fields_set_"
+
+
+class FrozenDict(dict):
+    """
+    A hashable dict that rejects mutation.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = (
+        __ior__
+    ) = _readonly
+
+    def __hash__(self) -> int:
+        # equal dicts may differ in insertion order
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        # dict subclasses are pickled through __setitem__ otherwise
+        return type(self), (dict(self),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+
+class CompactModel(tuple):
+    """
+    Base class of the compact variants generated by `compact()`.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        # variants are not module attributes, pickle them through their model
+        return _restore, (self.__model__, tuple(self))
+
+
+def _restore(model: type[BaseModel], values: tuple) -> CompactModel:
+    return compact(model)._make(values)
+
+
+def _freeze_any(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze_any(v) for v in value)
+    if isinstance(value, dict):
+        return FrozenDict((k, _freeze_any(v)) for k, v in value.items())
+    if isinstance(value, BaseModel):
+        return to_compact(value)
+    return value
+
+
+def _thaw_any(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_thaw_any(v) for v in value]
+    if isinstance(value, FrozenDict):
+        return {k: _thaw_any(v) for k, v in value.items()}
+    if isinstance(value, CompactModel):
+        return value.to_model()
+    return value
+
+
+def _is_scalar(spec: FieldSpec) -> bool:
+    return spec.container is None and spec.model is None and spec.annotation is not Any
+
+
+def _freezer(spec: FieldSpec) -> Optional[Callable[[Any], Any]]:
+    if _is_scalar(spec):
+        return None
+    if spec.model is None:
+        return _freeze_any
+
+    if spec.container == "list":
+        return lambda v: tuple(to_compact(i) for i in v)
+    if spec.container == "dict":
+        return lambda v: FrozenDict((k, to_compact(i)) for k, i in v.items())
+    return to_compact
+
+
+def _thawer(spec: FieldSpec) -> Optional[Callable[[Any], Any]]:
+    if _is_scalar(spec):
+        return None
+    if spec.model is None:
+        return _thaw_any
+
+    if spec.container == "list":
+        return lambda v: [i.to_model() for i in v]
+    if spec.container == "dict":
+        return lambda v: {k: i.to_model() for k, i in v.items()}
+    return lambda v: v.to_model()
+
+
+@cache
+def compact(model: type[M]) -> type:
+    """
+    Return the compact read-only variant of a generated model class.
+
+    The variant is a named tuple with the same attribute names as the model,
+    followed by the bitmask of the explicitly set fields. Instances are created
+    with `to_compact()` and converted back with their `to_model()` method,
+    neither of which re-validates the data.
+    :param model: The generated model class
+    """
+    table = field_table(model)
+    names = [f.name for f in table]
+    if FIELDS_SET in names:
+        raise ValueError(f"{model.__name__} has a field named {FIELDS_SET}")
+    freezers = tuple((f.name, _freezer(f)) for f in table)
+    thawers = tuple((f.name, _thawer(f)) for f in table)
+    bits = {name: 1 << i for i, name in enumerate(names)}
+
+    def from_model(cls, instance: M):
+        values = instance.__dict__
+        args = []
+        for name, freeze in freezers:
+            v = values[name]
+            args.append(v if freeze is None or v is None else freeze(v))
+        # the set fields, so that exclude_unset serialization of to_model()
+        # matches the original instance
+        args.append(sum(bits[name] for name in instance.model_fields_set))
+        return tuple.__new__(cls, args)
+
+    def to_model(self) -> M:
+        values = {}
+        for (name, thaw), v in zip(thawers, self):
+            values[name] = v if thaw is None or v is None else thaw(v)
+        mask = self[-1]
+        fields_set = {name for name in names if mask & bits[name]}
+        return construct(model, values, fields_set)
+
+    base = namedtuple(model.__name__, [*names, FIELDS_SET], module=__name__)
+    # named after the full path of the model, as app modules share class names
+    name = f"{model.__module__}.{model.__qualname__}"
+    return type(
+        name,
+        (base, CompactModel),
+        {
+            "__slots__": (),
+            "__module__": __name__,
+            "__qualname__": name,
+            "__model__": model,
+            "from_model": classmethod(from_model),
+            "to_model": to_model,
+        },
+    )
+
+
+def to_compact(instance: BaseModel) -> Any:
+    """
+    Convert a generated model instance to its compact read-only variant.
+    :param instance: A generated model instance
+    """
+    return compact(type(instance)).from_model(instance)
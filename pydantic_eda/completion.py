@@ -0,0 +1,332 @@
+"""
+Local label and field path completion.
+
+`CompletionIndex` offers the completions of the label completion and query
+completion APIs offline: label keys and values of the resources of
+ResourceStores, kept in prefix tries updated incrementally on every change of
+the stores, and the field paths of the generated models. Answers are the core
+`LabelCompletionResponse` and `QueryCompletionResponse` models.
+
+    index = CompletionIndex()
+    index.track(interfaces)
+    index.complete_labels(GetLabelCompletionRequest(gvk=gvk, value="eda.nokia.com/ro"))
+    index.complete_labels(GetLabelCompletionRequest(gvk=gvk, value="role=le"))
+    index.complete_query("spec.mem", gvk)
+"""
+
+import re
+import threading
+from collections.abc import Iterator
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from pydantic_eda.core.v25_8_1.models import (
+    GetLabelCompletionRequest,
+    GroupVersionKind,
+    LabelCompletionResponse,
+    QueryCompletion,
+    QueryCompletionResponse,
+)
+from pydantic_eda.fields import field_table, fields_by_name
+from pydantic_eda.store import EventType, Key, ResourceStore
+
+# (group, kind), versions of a kind share their completions
+Scope = tuple[str, str]
+
+# the field path being typed at the end of a query
+_TOKEN = re.compile(r"[\w.\[\]*\"/-]*$")
+
+# depth of the field paths of recursive models
+MAX_DEPTH = 16
+
+
+class _Node:
+    __slots__ = ("children", "end", "size")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # whether a word ends at this node
+        self.end = False
+        # distinct words in the subtree
+        self.size = 0
+
+
+class PrefixTrie:
+    """
+    Trie of reference-counted words: a word added n times is removed after n
+    discards, so that words shared by many resources are kept until the last
+    of them goes away. The trie itself only changes when a word appears or
+    disappears.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._counts: dict[str, int] = {}
+
+    def add(self, word: str):
+        """
+        Add a reference to a word.
+        :param word: The word
+        """
+        count = self._counts.get(word, 0)
+        self._counts[word] = count + 1
+        if count:
+            return
+        node = self._root
+        node.size += 1
+        for char in word:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+            node.size += 1
+        node.end = True
+
+    def discard(self, word: str):
+        """
+        Remove a reference to a word, if present.
+        :param word: The word
+        """
+        count = self._counts.get(word)
+        if count is None:
+            return
+        if count > 1:
+            self._counts[word] = count - 1
+            return
+        del self._counts[word]
+        node = self._root
+        node.size -= 1
+        for char in word:
+            child = node.children[char]
+            if child.size == 1:
+                # prune the branch left without words
+                del node.children[char]
+                return
+            node = child
+            node.size -= 1
+        node.end = False
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _walk(self, node: _Node, prefix: str) -> Iterator[str]:
+        stack = [(prefix, node)]
+        while stack:
+            word, node = stack.pop()
+            if node.end:
+                yield word
+            for char in sorted(node.children, reverse=True):
+                stack.append((word + char, node.children[char]))
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        """
+        Return the words starting with a prefix, in lexicographic order.
+        :param prefix: The prefix
+        :param limit: The maximum number of words to return
+        """
+        node = self._find(prefix)
+        if node is None or limit == 0:
+            return []
+        words = []
+        for word in self._walk(node, prefix):
+            words.append(word)
+            if len(words) == limit:
+                break
+        return words
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._counts
+
+    def __len__(self) -> int:
+        return self._root.size
+
+
+def _scope_of(group: Optional[str], kind: Optional[str]) -> Scope:
+    return group or "", kind or ""
+
+
+def _resource_scope(resource: BaseModel) -> Scope:
+    api_version = getattr(resource, "apiVersion", None) or ""
+    group = api_version.rpartition("/")[0]
+    return _scope_of(group, getattr(resource, "kind", None))
+
+
+def _model_scope(model: type[BaseModel]) -> Optional[Scope]:
+    fields = fields_by_name(model)
+    try:
+        (api_version,) = fields["apiVersion"].literals
+        (kind,) = fields["kind"].literals
+    except (KeyError, TypeError, ValueError):
+        return None
+    return _scope_of(api_version.rpartition("/")[0], kind)
+
+
+def field_paths(model: type[BaseModel], prefix: str = "", depth: int = 0) -> list[str]:
+    """
+    Return the field paths of a model, as accepted by compile_accessor, e.g.
+    spec, spec.members, spec.members[*] and spec.members[*].node.
+    :param model: The generated model class
+    :param prefix: Path of the model in its parent
+    :param depth: Depth of the model in its parent
+    """
+    paths = []
+    if depth >= MAX_DEPTH:
+        return paths
+    for spec in field_table(model):
+        path = f"{prefix}{spec.key}"
+        paths.append(path)
+        if spec.model is None:
+            continue
+        if spec.container is not None:
+            path += "[*]"
+            paths.append(path)
+        paths.extend(field_paths(spec.model, path + ".", depth + 1))
+    return paths
+
+
+class CompletionIndex:
+    """
+    Label key and value, and field path completion over tracked stores and models.
+    Label completions are scoped by group and kind, and by namespace when the
+    request has one.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # (scope, namespace or None) -> label keys
+        self._keys: dict[tuple[Scope, Optional[str]], PrefixTrie] = {}
+        # (scope, namespace or None, label key) -> label values
+        self._values: dict[tuple[Scope, Optional[str], str], PrefixTrie] = {}
+        self._paths: dict[Scope, PrefixTrie] = {}
+
+    def _label(self, scope: Scope, namespace: Optional[str], key: str, value: str):
+        for ns in {namespace, None}:
+            keys = self._keys.get((scope, ns))
+            if keys is None:
+                keys = self._keys[(scope, ns)] = PrefixTrie()
+            keys.add(key)
+            values = self._values.get((scope, ns, key))
+            if values is None:
+                values = self._values[(scope, ns, key)] = PrefixTrie()
+            values.add(value)
+
+    def _unlabel(self, scope: Scope, namespace: Optional[str], key: str, value: str):
+        for ns in {namespace, None}:
+            keys = self._keys.get((scope, ns))
+            if keys is not None:
+                keys.discard(key)
+                if not len(keys):
+                    del self._keys[(scope, ns)]
+            values = self._values.get((scope, ns, key))
+            if values is not None:
+                values.discard(value)
+                if not len(values):
+                    del self._values[(scope, ns, key)]
+
+    def add(self, resource: BaseModel):
+        """
+        Add the labels of a resource.
+        :param resource: A generated resource instance
+        """
+        labels = getattr(resource.metadata, "labels", None)
+        if not labels:
+            return
+        scope = _resource_scope(resource)
+        namespace = getattr(resource.metadata, "namespace", None)
+        with self._lock:
+            for key, value in labels.items():
+                self._label(scope, namespace, key, value)
+
+    def discard(self, resource: BaseModel):
+        """
+        Remove the labels of a resource previously added.
+        :param resource: A generated resource instance
+        """
+        labels = getattr(resource.metadata, "labels", None)
+        if not labels:
+            return
+        scope = _resource_scope(resource)
+        namespace = getattr(resource.metadata, "namespace", None)
+        with self._lock:
+            for key, value in labels.items():
+                self._unlabel(scope, namespace, key, value)
+
+    def _on_change(self, event: EventType, key: Key, old: Any, new: Any):
+        if old is not None:
+            self.discard(old)
+        if new is not None:
+            self.add(new)
+
+    def track(self, store: ResourceStore):
+        """
+        Index the labels of the resources of a store, and keep them up to date
+        as the store changes. The field paths of the model of the store are
+        added as well.
+        :param store: The store
+        """
+        if store.model is not None:
+            self.add_model(store.model)
+        store.on_change(self._on_change)
+
+    def add_model(self, model: type[BaseModel]):
+        """
+        Add the field paths of a generated resource model.
+        :param model: The generated model class, with apiVersion and kind Literals
+        """
+        scope = _model_scope(model)
+        if scope is None:
+            raise ValueError(f"{model.__name__} is not a resource model")
+        trie = PrefixTrie()
+        for path in field_paths(model):
+            trie.add(path)
+        with self._lock:
+            self._paths[scope] = trie
+
+    def complete_labels(
+        self, request: GetLabelCompletionRequest
+    ) -> LabelCompletionResponse:
+        """
+        Complete a label key, or a label value when the request value holds
+        an =, in which case the results are key=value strings.
+        :param request: The label completion request
+        """
+        gvk = request.gvk or GroupVersionKind()
+        scope = _scope_of(gvk.group, gvk.kind)
+        namespace = request.namespace or None
+        key, equal, prefix = request.value.partition("=")
+        with self._lock:
+            if not equal:
+                trie = self._keys.get((scope, namespace))
+                results = trie.complete(key, request.limit) if trie else []
+            else:
+                trie = self._values.get((scope, namespace, key))
+                results = (
+                    [f"{key}={v}" for v in trie.complete(prefix, request.limit)]
+                    if trie
+                    else []
+                )
+        return LabelCompletionResponse(results=results)
+
+    def complete_query(
+        self, text: str, gvk: GroupVersionKind, limit: Optional[int] = None
+    ) -> QueryCompletionResponse:
+        """
+        Complete the field path at the end of a query text, the completions
+        are full paths with the typed part as token.
+        :param text: The query text
+        :param gvk: Group and kind of the queried resources
+        :param limit: The maximum number of completions to return
+        """
+        token = _TOKEN.search(text).group()
+        with self._lock:
+            trie = self._paths.get(_scope_of(gvk.group, gvk.kind))
+            paths = trie.complete(token, limit) if trie else []
+        return QueryCompletionResponse(
+            completions=[QueryCompletion(completion=p, token=token) for p in paths]
+        )
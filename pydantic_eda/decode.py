@@ -0,0 +1,70 @@
+"""
+Decode entry points that accept any bytes-like buffer, including memory-mapped files.
+"""
+
+import mmap
+import os
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+Buffer = str | bytes | bytearray | memoryview | mmap.mmap
+
+
+def as_json_input(data: Buffer) -> str | bytes | bytearray:
+    """
+    Return the JSON input pydantic-core can parse for the given buffer.
+
+    str, bytes and bytearray are passed through as is. A memoryview that spans
+    a whole bytes/bytearray object is unwrapped to that object without copying.
+    Any other buffer (partial views, mmaps) is copied exactly once, as
+    pydantic-core only parses str, bytes and bytearray inputs.
+    :param data: JSON payload
+    """
+    if isinstance(data, (str, bytes, bytearray)):
+        return data
+
+    if isinstance(data, memoryview):
+        if (
+            isinstance(data.obj, (bytes, bytearray))
+            and data.contiguous
+            and data.nbytes == len(data.obj)
+        ):
+            return data.obj
+        return data.tobytes()
+
+    if isinstance(data, mmap.mmap):
+        return data[:]
+
+    raise TypeError(f"unsupported JSON input type: {type(data).__name__}")
+
+
+def validate_buffer(model: type[M], data: Buffer) -> M:
+    """
+    Validate a JSON payload held in any bytes-like buffer into the given model.
+    :param model: The generated model class to validate into
+    :param data: JSON payload
+    """
+    return model.__pydantic_validator__.validate_json(as_json_input(data))
+
+
+def load(model: type[M], path: str | os.PathLike) -> M:
+    """
+    Validate the JSON document stored in a file into the given model.
+
+    The file is memory-mapped rather than read, so the only copy of the
+    payload is the one handed over to the parser; the mapped pages belong
+    to the page cache and are released as soon as the map is closed.
+    :param model: The generated model class to validate into
+    :param path: Path to the JSON file, e.g. a cached InterfaceStateList snapshot
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files can't be mapped, let the validator report the error
+            return validate_buffer(model, b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[:]
+
+    return validate_buffer(model, data)
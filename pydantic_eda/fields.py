@@ -0,0 +1,129 @@
+"""
+Per-class field tables derived from the generated models.
+
+The tables are computed once per class and describe every field in terms the
+hand-written helpers in this package need: the serialized key, whether the
+value is a nested model, a list or a dict of them, and the allowed Literal values.
+"""
+
+import types
+import typing
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Literal, Optional, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    # python attribute name, e.g. from_
+    name: str
+    # key used on the wire, e.g. from
+    key: str
+    # annotation with Optional stripped
+    annotation: Any
+    # None for scalars, "list" or "dict" for containers
+    container: Optional[Literal["list", "dict"]]
+    # the model class held by the field, or by the container
+    model: Optional[type[BaseModel]]
+    # allowed values of Literal fields
+    literals: Optional[tuple]
+    required: bool
+    default: Any
+
+
+def _strip_optional(annotation: Any) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _model_class(annotation: Any) -> Optional[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _field_spec(name: str, info) -> FieldSpec:
+    annotation = _strip_optional(info.annotation)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    container = None
+    item = annotation
+    if origin is list and args:
+        container, item = "list", _strip_optional(args[0])
+    elif origin is dict and len(args) == 2:
+        container, item = "dict", _strip_optional(args[1])
+
+    literals = None
+    if typing.get_origin(item) is Literal:
+        literals = typing.get_args(item)
+
+    default = info.default
+    if default is PydanticUndefined:
+        default = None
+
+    return FieldSpec(
+        name=name,
+        key=info.alias or name,
+        annotation=annotation,
+        container=container,
+        model=_model_class(item),
+        literals=literals,
+        required=info.is_required(),
+        default=default,
+    )
+
+
+@cache
+def field_table(model: type[BaseModel]) -> tuple[FieldSpec, ...]:
+    """
+    Return the field table of a generated model class, in declaration order.
+    :param model: The generated model class
+    """
+    return tuple(_field_spec(name, info) for name, info in model.model_fields.items())
+
+
+@cache
+def fields_by_name(model: type[BaseModel]) -> dict[str, FieldSpec]:
+    """
+    Return the field table of a model keyed by python attribute name.
+    :param model: The generated model class
+    """
+    return {f.name: f for f in field_table(model)}
+
+
+@cache
+def fields_by_key(model: type[BaseModel]) -> dict[str, FieldSpec]:
+    """
+    Return the field table of a model keyed by the serialized key (alias).
+    :param model: The generated model class
+    """
+    return {f.key: f for f in field_table(model)}
+
+
+def construct(model: type[M], values: dict[str, Any], fields_set: set[str]) -> M:
+    """
+    Build an instance from already validated values without running validation.
+
+    This is a leaner `model_construct` for callers that provide a value for
+    every field, keyed by attribute name, as the generated models have neither
+    extra nor private attributes.
+    :param model: The generated model class
+    :param values: Values of all fields keyed by attribute name
+    :param fields_set: Names of the fields considered explicitly set
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
@@ -0,0 +1,129 @@
+"""
+String interning for bulk decoded resources.
+
+The same `apiVersion`, `kind`, namespaces, label keys/values, node names and
+Literal states repeat across thousands of resources. pydantic-core keeps a
+bounded cache of short strings (up to 64 chars) seen while parsing JSON, but
+resources validated from Python objects (e.g. YAML or `json.loads` output),
+longer strings and strings evicted from that cache all end up as separate
+copies. Routing the decoded instances through a shared pool makes all equal
+strings point to a single object for the lifetime of the pool.
+"""
+
+import threading
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.decode import Buffer, validate_buffer
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class StringPool:
+    """
+    A pool of canonical string objects.
+
+    Unlike sys.intern, a pool can be dropped as a whole together with the cache
+    whose instances were interned through it.
+    """
+
+    def __init__(self, max_length: int = 256):
+        """
+        :param max_length: Strings longer than that are not pooled, as they are
+        unlikely to repeat (descriptions, certificates, etc).
+        """
+        self.max_length = max_length
+        self._strings: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, s: str) -> str:
+        """
+        Return the canonical object for the given string.
+        :param s: String to intern
+        """
+        if len(s) > self.max_length:
+            return s
+        canonical = self._strings.get(s)
+        if canonical is None:
+            with self._lock:
+                canonical = self._strings.setdefault(s, s)
+        return canonical
+
+    def clear(self):
+        with self._lock:
+            self._strings.clear()
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, s: str) -> bool:
+        return s in self._strings
+
+
+# process-wide pool used when no explicit pool is given
+default_pool = StringPool()
+
+
+def _intern_value(value: Any, pool: StringPool) -> Any:
+    if isinstance(value, str):
+        return pool.intern(value)
+    if isinstance(value, BaseModel):
+        intern_strings(value, pool)
+        return value
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            value[i] = _intern_value(item, pool)
+        return value
+    if isinstance(value, dict):
+        return {
+            (pool.intern(k) if isinstance(k, str) else k): _intern_value(v, pool)
+            for k, v in value.items()
+        }
+    return value
+
+
+def intern_strings(instance: M, pool: StringPool | None = None) -> M:
+    """
+    Replace every string held by the instance, nested models, lists and dict
+    keys/values included, with its canonical object from the pool.
+    The instance is updated in place and returned.
+    :param instance: A generated model instance
+    :param pool: Pool to intern into, defaults to the process-wide pool
+    """
+    if pool is None:
+        pool = default_pool
+
+    # write straight into __dict__ to bypass frozen/validate_assignment configs,
+    # the values are equal so the instance stays valid
+    values = instance.__dict__
+    for name, value in values.items():
+        if value is not None:
+            values[name] = _intern_value(value, pool)
+
+    return instance
+
+
+def validate_python_interned(
+    model: type[M], data: Any, pool: StringPool | None = None
+) -> M:
+    """
+    Validate a Python object (e.g. a parsed YAML document) into the given model
+    and intern its strings.
+    :param model: The generated model class to validate into
+    :param data: Python object to validate
+    :param pool: Pool to intern into, defaults to the process-wide pool
+    """
+    return intern_strings(model.model_validate(data), pool)
+
+
+def validate_json_interned(
+    model: type[M], data: Buffer, pool: StringPool | None = None
+) -> M:
+    """
+    Validate a JSON payload into the given model and intern its strings.
+    :param model: The generated model class to validate into
+    :param data: JSON payload
+    :param pool: Pool to intern into, defaults to the process-wide pool
+    """
+    return intern_strings(validate_buffer(model, data), pool)
@@ -0,0 +1,335 @@
+"""
+Parser and evaluator of EDA jspaths.
+
+A jspath is a list of segments, each optionally followed by key predicates in
+braces, e.g. the path of an alarm:
+
+    .node{.name=="spine-1-1"}.srl{.version=="24.10.1"}.interface{.name=="ethernet-1-1"}
+
+or a plain EDB path such as .namespace.node.normal.components_eda_nokia_com.v1.
+
+Predicates compare a field of the segment to a quoted string or a number with
+== or !=, and are joined with `and`. Parsed paths are cached.
+
+`JsPathResolver` resolves paths to the resources held by ResourceStores: segments
+are bound to a store, and the predicates of the path to indexes of that store,
+so that resolving a path is a few index lookups. Other predicates of the bound
+segment are checked on the resources found.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel
+
+from pydantic_eda.access import PathError, compile_accessor
+from pydantic_eda.store import ResourceStore
+from pydantic_eda.update import get_in
+
+_SEGMENT = re.compile(r"\.([^.{}\s]+)")
+_PREDICATE = re.compile(
+    r"""\s*\.?([^\s=!{}]+)\s*(==|!=)\s*(?:"((?:[^"\\]|\\.)*)"|(-?\d+(?:\.\d+)?)|(true|false))\s*"""
+)
+_AND = re.compile(r"\s*(?:and|&&|,)\s*")
+
+
+class JsPathError(ValueError):
+    """
+    Raised for jspaths that can't be parsed.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class Predicate:
+    field: str
+    op: Literal["==", "!="]
+    value: Any
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            value = '"' + self.value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        elif isinstance(self.value, bool):
+            value = "true" if self.value else "false"
+        else:
+            value = str(self.value)
+        return f".{self.field}{self.op}{value}"
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    name: str
+    predicates: tuple[Predicate, ...] = ()
+
+    def __str__(self) -> str:
+        if not self.predicates:
+            return f".{self.name}"
+        return f".{self.name}{{{' and '.join(map(str, self.predicates))}}}"
+
+
+@dataclass(frozen=True, slots=True)
+class JsPath:
+    segments: tuple[Segment, ...]
+
+    def __str__(self) -> str:
+        return "".join(map(str, self.segments))
+
+    def keys(self) -> dict[str, Any]:
+        """
+        Return the values of the equality predicates, keyed by segment.field,
+        e.g. {"node.name": "spine-1-1", "interface.name": "ethernet-1-1"}.
+        """
+        return {
+            f"{s.name}.{p.field}": p.value
+            for s in self.segments
+            for p in s.predicates
+            if p.op == "=="
+        }
+
+
+def _value(m: re.Match) -> Any:
+    string, number, boolean = m.group(3), m.group(4), m.group(5)
+    if string is not None:
+        return re.sub(r"\\(.)", r"\1", string)
+    if number is not None:
+        return float(number) if "." in number else int(number)
+    return boolean == "true"
+
+
+def _predicates(text: str, path: str) -> tuple[Predicate, ...]:
+    predicates = []
+    pos = 0
+    while pos < len(text):
+        m = _PREDICATE.match(text, pos)
+        if m is None:
+            raise JsPathError(f"invalid predicate in {path!r}: {text[pos:]!r}")
+        predicates.append(Predicate(m.group(1), m.group(2), _value(m)))
+        pos = m.end()
+        if pos < len(text):
+            sep = _AND.match(text, pos)
+            if sep is None or sep.end() == pos:
+                raise JsPathError(f"invalid predicate in {path!r}: {text[pos:]!r}")
+            pos = sep.end()
+    return tuple(predicates)
+
+
+def _closing_brace(path: str, start: int) -> int:
+    in_string = False
+    i = start
+    while i < len(path):
+        c = path[i]
+        if in_string:
+            if c == "\\":
+                i += 1
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "}":
+            return i
+        i += 1
+    raise JsPathError(f"unterminated predicate in {path!r}")
+
+
+@lru_cache(maxsize=65536)
+def parse_jspath(path: str) -> JsPath:
+    """
+    Parse a jspath, parsed paths are cached.
+    :param path: The jspath, e.g. .node{.name=="leaf1"}.srl.interface{.name=="e1"}
+    """
+    segments = []
+    pos = 0
+    path = path.strip()
+    while pos < len(path):
+        m = _SEGMENT.match(path, pos)
+        if m is None:
+            raise JsPathError(f"invalid jspath {path!r} at position {pos}")
+        pos = m.end()
+        predicates = ()
+        if pos < len(path) and path[pos] == "{":
+            end = _closing_brace(path, pos + 1)
+            predicates = _predicates(path[pos + 1 : end], path)
+            pos = end + 1
+        segments.append(Segment(m.group(1), predicates))
+    return JsPath(tuple(segments))
+
+
+@dataclass(frozen=True, slots=True)
+class _Binding:
+    store: ResourceStore
+    # segment.field or field of the bound segment -> index name
+    keys: Mapping[str, str]
+    # segments, and segment.field or field of predicates, that are not checked
+    ignore: frozenset[str]
+
+
+# reads the value a predicate is checked against from a resource
+_Filter = tuple[Callable[[BaseModel], Any], Literal["==", "!="], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _Plan:
+    store: ResourceStore
+    # (index name, op, value) conditions of the index lookup
+    conditions: list
+    # predicates checked on the resources found
+    filters: list[_Filter]
+
+
+def _matches(value: Any, op: str, expected: Any) -> bool:
+    # list values match any of their items, as they are indexed
+    found = expected in value if isinstance(value, list) else value == expected
+    return found if op == "==" else not found
+
+
+class JsPathResolver:
+    """
+    Resolves jspaths to the resources of ResourceStores.
+
+    interfaces = ResourceStore(Interface, indexes={
+        "name": "metadata.name",
+        "node": lambda i: [m.node for m in i.spec.members],
+    })
+    resolver = JsPathResolver()
+    resolver.bind("interface", interfaces, {"name": "name", "node.name": "node"})
+    resolver.resolve('.node{.name=="leaf1"}.srl.interface{.name=="ethernet-1-1"}')
+
+    A path resolves against the binding of its last bound segment. The predicates
+    of that segment are referenced by field ("name"), the ones of the segments
+    before it by segment and field ("node.name"). A predicate of the bound
+    segment that is not bound to an index is checked on the resources found,
+    its field being a path of the resources (e.g. spec.enabled); predicates of
+    the other segments must be bound or ignored, e.g. the srl version of alarm
+    paths with ignore={"srl"}, JsPathError is raised otherwise. A path
+    without any bound equality resolves to nothing. Note that indexed values
+    are matched as they are in the resources: the interface names of jspaths
+    (ethernet-1/1) may need an index of their own.
+    """
+
+    def __init__(self, max_plans: int = 4096):
+        """
+        :param max_plans: Number of resolution plans kept, least recently used
+            plans are dropped first
+        """
+        self.max_plans = max_plans
+        self._bindings: dict[str, _Binding] = {}
+        # plans by parsed path, dropped when a binding changes
+        self._plans: OrderedDict[JsPath, Optional[_Plan]] = OrderedDict()
+
+    def bind(
+        self,
+        segment: str,
+        store: ResourceStore,
+        keys: Mapping[str, str],
+        ignore: Iterable[str] = (),
+    ):
+        """
+        Bind a segment name to a store.
+        :param segment: Name of the segment, e.g. interface
+        :param store: The store holding the resources of the segment
+        :param keys: Index of the store used for each predicate, keyed by field
+            for the predicates of the segment, by segment.field for the others
+        :param ignore: Predicates that only inform and are not checked, by
+            field or segment.field as in keys, or whole segments by name,
+            e.g. srl or srl.version
+        """
+        for index in keys.values():
+            if not store.has_index(index):
+                raise ValueError(f"the store has no index {index!r}")
+        self._bindings[segment] = _Binding(store, dict(keys), frozenset(ignore))
+        self._plans.clear()
+
+    @staticmethod
+    def _getter(store: ResourceStore, field: str) -> Callable[[BaseModel], Any]:
+        if store.model is None:
+            return partial(get_in, path=field)
+        try:
+            return compile_accessor(store.model, field)
+        except PathError as e:
+            raise JsPathError(f"predicate on {field!r} can't be checked: {e}") from None
+
+    def _plan(self, path: JsPath) -> Optional[_Plan]:
+        for i in range(len(path.segments) - 1, -1, -1):
+            binding = self._bindings.get(path.segments[i].name)
+            if binding is None:
+                continue
+
+            conditions = []
+            filters = []
+            for j, segment in enumerate(path.segments[: i + 1]):
+                if j < i and segment.name in binding.ignore:
+                    continue
+                for p in segment.predicates:
+                    ref = p.field if j == i else f"{segment.name}.{p.field}"
+                    if ref in binding.ignore:
+                        continue
+                    index = binding.keys.get(ref)
+                    if index is not None:
+                        conditions.append((index, p.op, p.value))
+                    elif j == i:
+                        filters.append(
+                            (self._getter(binding.store, ref), p.op, p.value)
+                        )
+                    else:
+                        raise JsPathError(
+                            f"predicate {segment.name}{{{p}}} of {str(path)!r} "
+                            "is neither bound to an index nor ignored"
+                        )
+            if not any(op == "==" for _, op, _ in conditions):
+                return None
+            return _Plan(binding.store, conditions, filters)
+        return None
+
+    def resolve(
+        self, path: str | JsPath, namespace: Optional[str] = None
+    ) -> list[BaseModel]:
+        """
+        Return the resources a jspath refers to.
+        :param path: The jspath, as a string or parsed
+        :param namespace: Only return resources of this namespace
+        """
+        if isinstance(path, str):
+            path = parse_jspath(path)
+        plans = self._plans
+        try:
+            plan = plans[path]
+            plans.move_to_end(path)
+        except KeyError:
+            plan = plans[path] = self._plan(path)
+            while len(plans) > self.max_plans:
+                plans.popitem(last=False)
+        if plan is None:
+            return []
+        found = plan.store.find(plan.conditions, namespace)
+        for get, op, value in plan.filters:
+            found = [r for r in found if _matches(get(r), op, value)]
+        return found
+
+    def correlate(
+        self,
+        items: Iterable[Any],
+        path_attr: str = "jsPath",
+        errors: Optional[dict[int, JsPathError]] = None,
+    ) -> dict[int, list[BaseModel]]:
+        """
+        Resolve the jspath of many items, e.g. AlarmData, returns the resources
+        of each item keyed by its position in items. Items whose jspath can't
+        be parsed or resolved are skipped, so one of them doesn't abort the rest.
+        :param items: Objects holding a jspath and optionally a namespace
+        :param path_attr: Name of the attribute holding the jspath
+        :param errors: Filled with the error of each skipped item, by position
+        """
+        result = {}
+        for i, item in enumerate(items):
+            path = getattr(item, path_attr, None)
+            if not path:
+                continue
+            try:
+                result[i] = self.resolve(path, getattr(item, "namespace", None))
+            except JsPathError as e:
+                if errors is not None:
+                    errors[i] = e
+        return result
@@ -0,0 +1,529 @@
+"""
+JSON patches between instances of the generated models.
+
+`diff()` walks two instances of the same kind using the per-class field tables
+and emits the K8SPatchOp list turning the first one into the second.
+`apply_patch()` and `apply_merge_patch()` apply JSON patches and JSON merge
+patches to an instance, validating only the models holding the changed fields.
+
+The generated K8SPatchOp models only accept objects as the op value, therefore a
+change that can't be expressed with an object value (a scalar or a list of
+scalars being set) is expressed by replacing the nearest enclosing object.
+"""
+
+import sys
+from collections.abc import Iterable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.fields import FieldSpec, field_table, fields_by_key, fields_by_name
+from pydantic_eda.write import write_python
+
+M = TypeVar("M", bound=BaseModel)
+
+# field used to match items of lists of objects across versions
+LIST_KEY = "name"
+
+
+def escape(token: str) -> str:
+    """
+    Escape a JSON pointer reference token (RFC 6901).
+    :param token: Key to escape
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def patch_op_class(model: type[BaseModel]) -> type[BaseModel]:
+    """
+    Return the K8SPatchOp class of the module a generated model belongs to,
+    falling back to the core one.
+    :param model: The generated model class
+    """
+    return getattr(sys.modules[model.__module__], "K8SPatchOp", core.K8SPatchOp)
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return write_python(value)
+    return value
+
+
+def _dump_dict(value: dict) -> dict:
+    return {k: _dump(v) for k, v in value.items()}
+
+
+class _Diff:
+    def __init__(self):
+        # (op, path, value) tuples
+        self.ops: list[tuple[str, str, Any]] = []
+
+    def model(self, old: BaseModel, new: BaseModel, path: str) -> bool:
+        """
+        Record the ops turning old into new.
+        Return False when the difference requires replacing the whole object.
+        """
+        if old is new:
+            return True
+        if type(old) is not type(new) and field_table(type(old)) != field_table(
+            type(new)
+        ):
+            return False
+
+        mark = len(self.ops)
+        old_values = old.__dict__
+        new_values = new.__dict__
+        for spec in field_table(type(old)):
+            o = old_values[spec.name]
+            n = new_values[spec.name]
+            if o is n:
+                continue
+            if not self.field(spec, o, n, f"{path}/{escape(spec.key)}"):
+                del self.ops[mark:]
+                return False
+        return True
+
+    def field(self, spec: FieldSpec, o: Any, n: Any, path: str) -> bool:
+        if n is None:
+            self.ops.append(("remove", path, None))
+            return True
+        if o is None:
+            if isinstance(n, (BaseModel, dict)):
+                self.ops.append(("add", path, _dump(n)))
+                return True
+            return False
+
+        if spec.model is not None and spec.container == "list":
+            return self.list(o, n, path, LIST_KEY in fields_by_name(spec.model))
+        return self.child(o, n, path)
+
+    def child(self, o: Any, n: Any, path: str) -> bool:
+        """
+        Record the ops turning the value o into n, replacing it as a whole when
+        it is an object that can't be patched in place.
+        Return False when the parent object needs to be replaced instead.
+        """
+        if isinstance(o, BaseModel) and isinstance(n, BaseModel):
+            if not self.model(o, n, path):
+                self.ops.append(("replace", path, _dump(n)))
+            return True
+        if isinstance(o, dict) and isinstance(n, dict):
+            if not self.dict(o, n, path):
+                self.ops.append(("replace", path, _dump_dict(n)))
+            return True
+        if o == n:
+            return True
+        if isinstance(n, (BaseModel, dict)):
+            self.ops.append(("replace", path, _dump(n)))
+            return True
+        return False
+
+    def dict(self, o: dict, n: dict, path: str) -> bool:
+        if o is n:
+            return True
+        mark = len(self.ops)
+        for key in o:
+            if key not in n:
+                self.ops.append(("remove", f"{path}/{escape(key)}", None))
+        for key, value in n.items():
+            child_path = f"{path}/{escape(key)}"
+            if key not in o:
+                if not isinstance(value, (BaseModel, dict)):
+                    del self.ops[mark:]
+                    return False
+                self.ops.append(("add", child_path, _dump(value)))
+            elif o[key] is not value and not self.child(o[key], value, child_path):
+                del self.ops[mark:]
+                return False
+        return True
+
+    def list(self, o: list, n: list, path: str, keyed: bool) -> bool:
+        """
+        Record the ops turning a list of objects o into n.
+        """
+        if o is n:
+            return True
+
+        if keyed:
+            new_keys = [getattr(i, LIST_KEY) for i in n]
+            new_key_set = set(new_keys)
+            kept = [i for i in o if getattr(i, LIST_KEY) in new_key_set]
+            # removals and appends of keyed items are expressed item by item,
+            # reordered items are compared by position below
+            if [getattr(i, LIST_KEY) for i in kept] == new_keys[: len(kept)]:
+                for i in reversed(range(len(o))):
+                    if getattr(o[i], LIST_KEY) not in new_key_set:
+                        self.ops.append(("remove", f"{path}/{i}", None))
+                o = kept
+
+        for i, (a, b) in enumerate(zip(o, n)):
+            if a is not b:
+                self.child(a, b, f"{path}/{i}")
+        for i in reversed(range(len(n), len(o))):
+            self.ops.append(("remove", f"{path}/{i}", None))
+        for item in n[len(o) :]:
+            self.ops.append(("add", f"{path}/-", _dump(item)))
+        return True
+
+
+def diff(old: BaseModel, new: BaseModel) -> list[BaseModel]:
+    """
+    Compute the JSON patch (RFC 6902) turning old into new, as K8SPatchOp instances
+    of the module the models belong to.
+
+    Lists of objects are compared item by item. Items of lists of objects having
+    a `name` field are matched by name, so removing items in the middle of such
+    lists produces remove ops for those items only.
+    :param old: Observed instance, e.g. an Interface read from the API
+    :param new: Desired instance of the same kind
+    """
+    d = _Diff()
+    if not d.model(old, new, ""):
+        d.ops = [("replace", "", _dump(new))]
+
+    patch_op = patch_op_class(type(new))
+    return [
+        patch_op.model_construct(op=op, path=path)
+        if value is None
+        else patch_op.model_construct(op=op, path=path, value=value)
+        for op, path, value in d.ops
+    ]
+
+
+class PatchError(ValueError):
+    """
+    Raised when a patch can't be applied to an instance.
+    """
+
+
+# marks a field removed by a patch
+_MISSING = object()
+
+PatchOps = Iterable[BaseModel | dict[str, Any]]
+
+
+def unescape(token: str) -> str:
+    """
+    Unescape a JSON pointer reference token (RFC 6901).
+    :param token: Token to unescape
+    """
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def parse_pointer(path: str) -> list[str]:
+    """
+    Split a JSON pointer into its unescaped reference tokens.
+    :param path: JSON pointer, e.g. /spec/members/0
+    """
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise PatchError(f"invalid JSON pointer {path!r}")
+    return [unescape(t) for t in path[1:].split("/")]
+
+
+def _index(token: str, size: int) -> int:
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise PatchError(f"invalid list index {token!r}")
+    index = int(token)
+    if index >= size:
+        raise PatchError(f"list index {index} out of range")
+    return index
+
+
+def _rebuild(node: BaseModel, changes: dict[str, Any], validate: bool) -> BaseModel:
+    """
+    Return a copy of node with some fields, given by attribute name, changed.
+    Unchanged fields are shared with node. With validate, the direct fields of node
+    are validated again, nested model instances are reused as they are.
+    """
+    if not validate:
+        return node.model_copy(update=changes)
+
+    fields_set = node.model_fields_set
+    data = {}
+    for spec in field_table(type(node)):
+        if spec.name in changes:
+            value = changes[spec.name]
+            if value is _MISSING:
+                continue
+        elif spec.name in fields_set:
+            value = node.__dict__[spec.name]
+        else:
+            continue
+        data[spec.key] = value
+    return type(node).model_validate(data)
+
+
+def _get(value: Any, tokens: list[str]) -> Any:
+    for token in tokens:
+        if isinstance(value, BaseModel):
+            spec = fields_by_key(type(value)).get(token)
+            value = None if spec is None else value.__dict__[spec.name]
+        elif isinstance(value, list):
+            value = value[_index(token, len(value))]
+        elif isinstance(value, dict):
+            value = value.get(token)
+        else:
+            value = None
+        if value is None:
+            raise PatchError(f"path /{'/'.join(map(escape, tokens))} does not exist")
+    return value
+
+
+def _apply_plain(doc: Any, tokens: list[str], op: str, value: Any) -> Any:
+    """
+    Apply an add/remove/replace/set op to plain lists and dicts, copying the containers
+    along the path instead of mutating them.
+    """
+    if not tokens:
+        return _MISSING if op == "remove" else value
+
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(doc, list):
+        new = list(doc)
+        if not rest and op == "add":
+            if token == "-":
+                new.append(value)
+            else:
+                new.insert(_index(token, len(doc) + 1), value)
+            return new
+        index = _index(token, len(doc))
+        if rest:
+            new[index] = _apply_plain(doc[index], rest, op, value)
+        elif op == "remove":
+            del new[index]
+        else:
+            new[index] = value
+        return new
+
+    if isinstance(doc, dict):
+        new = dict(doc)
+        if token not in doc:
+            if op == "set":
+                new[token] = _create_plain(rest, value)
+                return new
+            if rest or op != "add":
+                raise PatchError(f"key {token!r} does not exist")
+        if rest:
+            new[token] = _apply_plain(doc[token], rest, op, value)
+        elif op == "remove":
+            del new[token]
+        else:
+            new[token] = value
+        return new
+
+    raise PatchError(f"can't resolve {token!r} in a {type(doc).__name__} value")
+
+
+def _create_plain(tokens: list[str], value: Any) -> Any:
+    """
+    Return nested dicts holding value at the path given by tokens.
+    """
+    for token in reversed(tokens):
+        value = {token: value}
+    return value
+
+
+def _create_model(
+    model: type[BaseModel], tokens: list[str], value: Any, by_name: bool
+) -> Any:
+    """
+    Return the raw data of a model holding value at the path given by tokens,
+    to be validated along with the model it is set in.
+    """
+    if not tokens:
+        return value
+    spec = fields_by_key(model).get(tokens[0])
+    if spec is None and by_name:
+        spec = fields_by_name(model).get(tokens[0])
+    if spec is None:
+        raise PatchError(f"{model.__name__} has no field {tokens[0]!r}")
+    return {spec.key: _create(spec, tokens[1:], value, by_name)}
+
+
+def _create(spec: FieldSpec, tokens: list[str], value: Any, by_name: bool) -> Any:
+    """
+    Return the raw data of an unset field holding value at the path given by tokens.
+    Missing models and dicts are created; list items can't be, as their index
+    would not exist.
+    """
+    if not tokens:
+        return value
+    if spec.container == "list":
+        raise PatchError(f"list {spec.key!r} is not set")
+    if spec.container == "dict":
+        key, rest = tokens[0], tokens[1:]
+        if spec.model is not None:
+            return {key: _create_model(spec.model, rest, value, by_name)}
+        return {key: _create_plain(rest, value)}
+    if spec.model is not None:
+        return _create_model(spec.model, tokens, value, by_name)
+    if spec.annotation is Any:
+        return _create_plain(tokens, value)
+    raise PatchError(f"can't resolve {tokens[0]!r} in field {spec.key!r}")
+
+
+def _apply_at(
+    node: BaseModel, tokens: list[str], op: str, value: Any, by_name: bool
+) -> BaseModel:
+    spec = fields_by_key(type(node)).get(tokens[0])
+    if spec is None and by_name:
+        spec = fields_by_name(type(node)).get(tokens[0])
+    if spec is None:
+        raise PatchError(f"{type(node).__name__} has no field {tokens[0]!r}")
+
+    current = node.__dict__[spec.name]
+    rest = tokens[1:]
+
+    if current is None:
+        if op == "set":
+            # missing intermediates are created, and validated along with this model
+            created = _create(spec, rest, value, by_name)
+            return _rebuild(node, {spec.name: created}, validate=True)
+        if rest or op != "add":
+            raise PatchError(f"field {spec.key!r} of {type(node).__name__} is not set")
+        return _rebuild(node, {spec.name: value}, validate=True)
+
+    # descend into nested models, only the models along the path are copied
+    if rest and spec.model is not None:
+        if spec.container is None:
+            child = _apply_at(current, rest, op, value, by_name)
+            return _rebuild(node, {spec.name: child}, validate=False)
+        if len(rest) > 1:
+            if spec.container == "list":
+                key = _index(rest[0], len(current))
+                items = list(current)
+            else:
+                key = rest[0]
+                items = dict(current)
+                if key not in current:
+                    if op != "set":
+                        raise PatchError(f"key {key!r} does not exist")
+                    items[key] = _create_model(spec.model, rest[1:], value, by_name)
+                    return _rebuild(node, {spec.name: items}, validate=True)
+            items[key] = _apply_at(current[key], rest[1:], op, value, by_name)
+            return _rebuild(node, {spec.name: items}, validate=False)
+
+    # the change lands in a field of this model, validate this model only
+    return _rebuild(
+        node, {spec.name: _apply_plain(current, rest, op, value)}, validate=True
+    )
+
+
+def apply_op(
+    instance: M, tokens: list[str], op: str, value: Any = None, by_name: bool = False
+) -> M:
+    """
+    Apply a single op to the location given by reference tokens, see apply_patch.
+    Besides the JSON patch add, remove and replace ops, the set op replaces the
+    target when it exists and adds it otherwise, without inserting into lists.
+    :param instance: A generated model instance
+    :param tokens: Reference tokens of the target location, i.e. keys (aliases)
+    :param op: One of add, remove, replace or set
+    :param value: The value for add, replace and set
+    :param by_name: Also accept python attribute names as tokens, as the paths of
+        the update helpers do; JSON pointers of patches only address keys
+    """
+    if op not in ("add", "remove", "replace", "set"):
+        raise PatchError(f"unsupported patch op {op!r}")
+    if not tokens:
+        if op == "remove":
+            raise PatchError("can't remove the whole document")
+        return type(instance).model_validate(value)
+    return _apply_at(instance, tokens, op, value, by_name)
+
+
+def apply_patch(instance: M, ops: PatchOps) -> M:
+    """
+    Apply a JSON patch (RFC 6902) to an instance and return the patched instance.
+
+    The instance is left untouched. Only the models on the path of each op are
+    copied and only the model directly holding the changed field is validated
+    again; all the other nested models are shared with the original instance.
+    :param instance: A generated model instance
+    :param ops: K8SPatchOp instances (from core or any app module) or plain dicts
+    """
+    for op in ops:
+        if isinstance(op, BaseModel):
+            op = op.model_dump(by_alias=True, exclude_none=True)
+
+        name = op["op"]
+        tokens = parse_pointer(op["path"])
+        value = op.get("value")
+
+        if name == "test":
+            current = _get(instance, tokens)
+            if isinstance(current, BaseModel):
+                # compare with defaults spelled out, as a client would send them
+                current = current.model_dump(
+                    mode="json", by_alias=True, exclude_none=True
+                )
+            if current != value:
+                raise PatchError(f"test failed for {op['path']}")
+            continue
+
+        if name in ("move", "copy"):
+            source = parse_pointer(op["from"])
+            value = _get(instance, source)
+            if name == "move":
+                instance = apply_op(instance, source, "remove", None)
+            name = "add"
+
+        instance = apply_op(instance, tokens, name, value)
+
+    return instance
+
+
+def _merge_plain(target: Any, patch: Any) -> Any:
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict) and isinstance(result.get(key), BaseModel):
+            result[key] = _merge_model(result[key], value)
+        else:
+            result[key] = _merge_plain(result.get(key), value)
+    return result
+
+
+def _merge_model(node: BaseModel, patch: dict[str, Any]) -> BaseModel:
+    fields = fields_by_key(type(node))
+    changes = {}
+    validate = False
+    for key, value in patch.items():
+        spec = fields.get(key)
+        if spec is None:
+            raise PatchError(f"{type(node).__name__} has no field {key!r}")
+
+        current = node.__dict__[spec.name]
+        if value is None:
+            if current is not None:
+                changes[spec.name] = _MISSING
+                validate = True
+        elif isinstance(value, dict) and isinstance(current, BaseModel):
+            changes[spec.name] = _merge_model(current, value)
+        else:
+            changes[spec.name] = _merge_plain(current, value)
+            validate = True
+
+    if not changes:
+        return node
+    return _rebuild(node, changes, validate)
+
+
+def apply_merge_patch(instance: M, patch: Any) -> M:
+    """
+    Apply a JSON merge patch (RFC 7386) to an instance and return the patched instance.
+
+    As with apply_patch, the instance is left untouched, only the models holding
+    changed fields are validated again and all untouched nested models are shared.
+    :param instance: A generated model instance
+    :param patch: The merge patch document
+    """
+    if not isinstance(patch, dict):
+        return type(instance).model_validate(patch)
+    return _merge_model(instance, patch)
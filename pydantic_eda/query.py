@@ -0,0 +1,179 @@
+"""
+Typed decoding of the rows of EQL query responses.
+
+The core `QueryResponse` carries its rows as untyped dicts along with the JSON
+schema of the data. `row_decoder` turns that schema into a validator once and
+caches it by schema hash, so polling the same query decodes every response
+with the validator compiled by pydantic-core, without interpreting the schema
+again. Rows are decoded into typed records (dicts holding python values of the
+declared types, e.g. datetimes) or into columns.
+
+JSON schema support covers what query schemas use: object properties, arrays,
+string/integer/number/boolean types (nullable as type lists), enums and the
+date-time and date formats. Anything else is kept as is.
+"""
+
+import datetime
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Literal, Optional, TypedDict
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from pydantic_eda.core.v25_8_1.models import QueryResponse, QuerySchema
+from pydantic_eda.decode import Buffer, as_json_input
+
+_SCALARS = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+
+_FORMATS = {
+    "date-time": datetime.datetime,
+    "date": datetime.date,
+}
+
+
+def schema_hash(json_schema: Mapping[str, Any]) -> str:
+    """
+    Return the hash identifying a query JSON schema.
+    :param json_schema: QueryResponse.jsonSchema
+    """
+    data = json.dumps(json_schema, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _row_schema(json_schema: Mapping[str, Any]) -> Mapping[str, Any]:
+    # the schema describes either the list of rows, a single row, or maps each
+    # column to its schema (QueryResponse.jsonSchema values are all objects)
+    if "items" in json_schema:
+        return json_schema["items"] or {}
+    if "properties" in json_schema or isinstance(json_schema.get("type"), str):
+        return json_schema
+    return {"type": "object", "properties": dict(json_schema)}
+
+
+def _python_type(schema: Mapping[str, Any], name: str) -> Any:
+    if "enum" in schema and schema["enum"]:
+        return Literal[tuple(schema["enum"])]
+
+    types = schema.get("type")
+    if isinstance(types, list):
+        types = [t for t in types if t != "null"]
+        types = types[0] if len(types) == 1 else None
+
+    if types == "object" or "properties" in schema:
+        return _typed_dict(schema, name)
+    if types == "array":
+        return list[_python_type(schema.get("items") or {}, f"{name}Item")]
+    if types == "string" and schema.get("format") in _FORMATS:
+        return _FORMATS[schema["format"]]
+    return _SCALARS.get(types, Any)
+
+
+def _typed_dict(schema: Mapping[str, Any], name: str) -> Any:
+    properties = schema.get("properties")
+    if not properties:
+        return dict[str, Any]
+    fields = {
+        key: Optional[_python_type(prop, f"{name}_{key}")]
+        for key, prop in properties.items()
+    }
+    return TypedDict(name, fields, total=False)
+
+
+def _fields_schema(schema: QuerySchema) -> dict[str, Any]:
+    # fallback when no jsonSchema is returned: the field list of the query schema
+    properties = {}
+    for field in schema.fields or []:
+        if field.name:
+            properties[field.name] = {"type": field.type} if field.type else {}
+    return {"type": "object", "properties": properties}
+
+
+class RowDecoder:
+    """
+    Validator of the rows of a query, compiled from its JSON schema.
+    """
+
+    def __init__(self, json_schema: Mapping[str, Any]):
+        """
+        :param json_schema: QueryResponse.jsonSchema
+        """
+        self.hash = schema_hash(json_schema)
+        self.row_type = _python_type(_row_schema(json_schema), "QueryRow")
+        properties = _row_schema(json_schema).get("properties") or {}
+        self.columns = tuple(properties)
+        self._rows = TypeAdapter(list[self.row_type])
+        self._response = create_model(
+            "TypedQueryResponse",
+            __base__=QueryResponse,
+            data=(Optional[list[self.row_type]], None),
+        )
+
+    def records(self, data: Optional[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """
+        Decode rows into typed records.
+        :param data: QueryResponse.data
+        """
+        return self._rows.validate_python(data or [])
+
+    def columns_of(self, data: Optional[list[dict[str, Any]]]) -> dict[str, list]:
+        """
+        Decode rows into one list of typed values per column, None when missing.
+        :param data: QueryResponse.data
+        """
+        records = self.records(data)
+        return {c: [r.get(c) for r in records] for c in self.columns}
+
+    def validate_json(self, body: Buffer) -> BaseModel:
+        """
+        Validate a raw QueryResponse body, with its data decoded into typed records.
+        The response must have been produced by the query this decoder was built for.
+        :param body: JSON body of the response
+        """
+        return self._response.model_validate_json(as_json_input(body))
+
+
+_decoders: OrderedDict[str, RowDecoder] = OrderedDict()
+_decoders_lock = threading.Lock()
+_MAXSIZE = 256
+
+
+def row_decoder(
+    json_schema: Optional[Mapping[str, Any]], schema: Optional[QuerySchema] = None
+) -> RowDecoder:
+    """
+    Return the decoder of a query schema, compiled on first use and then cached
+    by schema hash.
+    :param json_schema: QueryResponse.jsonSchema
+    :param schema: QueryResponse.schema_, used when no jsonSchema is given
+    """
+    if not json_schema:
+        json_schema = _fields_schema(schema or QuerySchema())
+    key = schema_hash(json_schema)
+    with _decoders_lock:
+        decoder = _decoders.get(key)
+        if decoder is not None:
+            _decoders.move_to_end(key)
+            return decoder
+
+    decoder = RowDecoder(json_schema)
+    with _decoders_lock:
+        _decoders[key] = decoder
+        if len(_decoders) > _MAXSIZE:
+            _decoders.popitem(last=False)
+    return decoder
+
+
+def decode_rows(response: QueryResponse) -> list[dict[str, Any]]:
+    """
+    Decode the rows of a query response into typed records.
+    :param response: A core QueryResponse
+    """
+    return row_decoder(response.jsonSchema, response.schema_).records(response.data)
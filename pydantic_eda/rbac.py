@@ -0,0 +1,294 @@
+"""
+Local evaluation of access checks against core AuthRoles.
+
+`AccessEvaluator` compiles the resource, table and URL rules of a set of roles
+into lookup structures, and answers `AccessQuery` and `CheckAccessRequest`
+without calling the API server:
+
+- resource rules become nested maps of API group, version and resource
+  name, each with a "*" entry for wildcards,
+- table and URL rules become tries over the segments of their paths, where
+  a trailing "*" matches one more segment and "**" one or more of them.
+
+Roles are additive: a query is allowed when any matching rule of a role of its
+namespace, or of a cluster-wide role, grants the requested permission.
+Decisions are cached, and the cache is dropped whenever the roles change.
+"""
+
+import threading
+from collections.abc import Iterable, Mapping
+from typing import Optional
+
+from pydantic_eda.core.v25_8_1.models import (
+    AccessQuery,
+    AccessResult,
+    AuthRole,
+    CheckAccessRequest,
+    CheckAccessResponse,
+    ErrorResponse,
+)
+
+WILDCARD = "*"
+GLOBSTAR = "**"
+
+# permission levels, a rule grants a query when its level is at least the
+# requested one
+LEVELS = {None: 0, "none": 0, "read": 1, "readWrite": 2}
+
+# cache key of a decision: type, group, version, resource or path, namespace,
+# requested level
+_Decision = tuple[str, str, str, str, str, int]
+
+
+def plural(kind: str) -> str:
+    """
+    Return the default resource name of a kind, e.g. interfaces for Interface,
+    used for gvk queries of kinds missing from the plurals given to the evaluator.
+    :param kind: The kind
+    """
+    name = kind.lower()
+    if name.endswith("y") and name[-2:-1] not in ("a", "e", "i", "o", "u"):
+        return name[:-1] + "ies"
+    if name.endswith(("s", "x", "z", "ch", "sh")):
+        return name + "es"
+    return name + "s"
+
+
+class _PathNode:
+    __slots__ = ("children", "level", "star", "globstar")
+
+    def __init__(self):
+        self.children: dict[str, _PathNode] = {}
+        # level granted to the path ending here, or below it for the wildcards
+        self.level = 0
+        self.star = 0
+        self.globstar = 0
+
+
+class _PathTrie:
+    """
+    Rules over the segments of table paths (.a.b.*) or URL paths (/a/b/**).
+    """
+
+    def __init__(self, separator: str):
+        self.separator = separator
+        self._root = _PathNode()
+
+    def _segments(self, path: str) -> list[str]:
+        return path.strip(self.separator).split(self.separator)
+
+    def add(self, path: str, level: int):
+        segments = self._segments(path)
+        last = segments[-1]
+        if last in (WILDCARD, GLOBSTAR):
+            segments.pop()
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _PathNode())
+        if last == WILDCARD:
+            node.star = max(node.star, level)
+        elif last == GLOBSTAR:
+            node.globstar = max(node.globstar, level)
+        else:
+            node.level = max(node.level, level)
+
+    def level(self, path: str) -> int:
+        segments = self._segments(path)
+        node = self._root
+        level = 0
+        last = len(segments) - 1
+        for i, segment in enumerate(segments):
+            level = max(level, node.globstar)
+            if i == last:
+                level = max(level, node.star)
+            node = node.children.get(segment)
+            if node is None:
+                return level
+        return max(level, node.level)
+
+
+class _Rules:
+    """
+    The compiled rules of the roles of a namespace, or of the cluster-wide roles.
+    """
+
+    def __init__(self):
+        # group -> version -> resource -> level, "*" entries for wildcards
+        self.resources: dict[str, dict[str, dict[str, int]]] = {}
+        self.tables = _PathTrie(".")
+        self.urls = _PathTrie("/")
+
+    def add(self, role: AuthRole):
+        for rule in role.resourceRules or ():
+            level = LEVELS[rule.permissions]
+            for api_group in rule.apiGroups:
+                group, _, version = api_group.partition("/")
+                versions = self.resources.setdefault(group, {})
+                resources = versions.setdefault(version or WILDCARD, {})
+                for resource in rule.resources:
+                    resources[resource] = max(resources.get(resource, 0), level)
+        for rule in role.tableRules or ():
+            self.tables.add(rule.path, LEVELS[rule.permissions])
+        for rule in role.urlRules or ():
+            self.urls.add(rule.path, LEVELS[rule.permissions])
+
+    def resource_level(self, group: str, version: str, resource: str) -> int:
+        level = 0
+        for g in (group, WILDCARD):
+            versions = self.resources.get(g)
+            if versions is None:
+                continue
+            for v in (version, WILDCARD):
+                resources = versions.get(v)
+                if resources is None:
+                    continue
+                level = max(
+                    level, resources.get(resource, 0), resources.get(WILDCARD, 0)
+                )
+        return level
+
+
+class AccessEvaluator:
+    """
+    Evaluates access queries against a set of roles.
+
+    evaluator = AccessEvaluator(user_roles, plurals={"Interface": "interfaces"})
+    evaluator.check(AccessQuery(type="url", path="/core/alarms/v1", permissions="read"))
+    response = evaluator.check_access(check_access_request)
+    """
+
+    def __init__(
+        self,
+        roles: Iterable[AuthRole] = (),
+        plurals: Optional[Mapping[str, str]] = None,
+        cache_size: int = 65536,
+    ):
+        """
+        :param roles: The roles of the user
+        :param plurals: Resource names by kind, for gvk queries, see plural
+        :param cache_size: Number of cached decisions
+        """
+        self.plurals = dict(plurals or {})
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._roles: dict[tuple[Optional[str], str], AuthRole] = {}
+        # namespace (None for the cluster-wide roles) -> compiled rules
+        self._rules: Optional[dict[Optional[str], _Rules]] = None
+        # incremented on every change, decisions of older roles aren't cached
+        self._generation = 0
+        self._cache: dict[_Decision, bool] = {}
+        self.set_roles(roles)
+
+    def _changed(self):
+        self._rules = None
+        self._generation += 1
+        self._cache.clear()
+
+    def set_roles(self, roles: Iterable[AuthRole]):
+        """
+        Replace the roles.
+        :param roles: The roles of the user
+        """
+        with self._lock:
+            self._roles = {(r.namespace or None, r.name): r for r in roles}
+            self._changed()
+
+    def add_role(self, role: AuthRole):
+        """
+        Add or replace a role.
+        :param role: The role
+        """
+        with self._lock:
+            self._roles[(role.namespace or None, role.name)] = role
+            self._changed()
+
+    def remove_role(self, name: str, namespace: Optional[str] = None):
+        """
+        Remove a role, if present.
+        :param name: Name of the role
+        :param namespace: Namespace of the role, None for cluster-wide roles
+        """
+        with self._lock:
+            if self._roles.pop((namespace or None, name), None) is not None:
+                self._changed()
+
+    def _compile(self) -> dict[Optional[str], _Rules]:
+        rules: dict[Optional[str], _Rules] = {}
+        for (namespace, _), role in self._roles.items():
+            rules.setdefault(namespace, _Rules()).add(role)
+        return rules
+
+    def _key(self, query: AccessQuery) -> _Decision:
+        level = LEVELS[query.permissions or "read"]
+        namespace = query.namespace or ""
+        if query.type == "gvk" or query.type == "gvr":
+            target = query.gvk if query.type == "gvk" else query.gvr
+            if target is None:
+                raise ValueError(f"a {query.type} query requires {query.type}")
+            if query.type == "gvk":
+                if not target.kind:
+                    raise ValueError("a gvk query requires a kind")
+                resource = self.plurals.get(target.kind) or plural(target.kind)
+            else:
+                resource = target.resource
+                if not resource:
+                    raise ValueError("a gvr query requires a resource")
+            group, version = target.group or "", target.version or ""
+            return "resource", group, version, resource, namespace, level
+        if not query.path:
+            raise ValueError(f"a {query.type} query requires a path")
+        return query.type, "", "", query.path, namespace, level
+
+    def _decide(self, key: _Decision) -> tuple[bool, int]:
+        kind, group, version, target, namespace, level = key
+        with self._lock:
+            if self._rules is None:
+                self._rules = self._compile()
+            rules = self._rules
+            generation = self._generation
+        granted = 0
+        for ns in (None, namespace or None) if namespace else (None,):
+            compiled = rules.get(ns)
+            if compiled is None:
+                continue
+            if kind == "resource":
+                granted = max(granted, compiled.resource_level(group, version, target))
+            elif kind == "table":
+                granted = max(granted, compiled.tables.level(target))
+            else:
+                granted = max(granted, compiled.urls.level(target))
+        return granted >= level, generation
+
+    def check(self, query: AccessQuery) -> bool:
+        """
+        Return whether a query is allowed. Raises ValueError for incomplete queries.
+        :param query: The access query, read permission is checked by default
+        """
+        key = self._key(query)
+        allowed = self._cache.get(key)
+        if allowed is not None:
+            return allowed
+        allowed, generation = self._decide(key)
+        with self._lock:
+            cache = self._cache
+            if generation == self._generation:
+                if len(cache) >= self.cache_size:
+                    # drop the oldest decision
+                    del cache[next(iter(cache))]
+                cache[key] = allowed
+        return allowed
+
+    def check_access(self, request: CheckAccessRequest) -> CheckAccessResponse:
+        """
+        Evaluate the queries of a check access request.
+        :param request: The request, queries by key
+        """
+        results = {}
+        for key, query in (request.root or {}).items():
+            try:
+                results[key] = AccessResult(access=self.check(query))
+            except ValueError as e:
+                results[key] = AccessResult(
+                    access=False, error=ErrorResponse(code=400, message=str(e))
+                )
+        return CheckAccessResponse(results)
@@ -0,0 +1,158 @@
+"""
+Compiler of the label selectors found in the generated specs.
+
+Selector fields (e.g. `FabricSpecLeafs.leafNodeSelector`, `VLANSpec.interfaceSelector`
+or `RouterSpec.nodeSelector`) are lists of Kubernetes label selector strings.
+A resource is selected when it matches any string of the list, and matches a
+string when it satisfies all its comma-separated requirements:
+
+    key=value, key==value, key!=value, key in (a,b), key notin (a,b), key, !key
+
+Compiled selectors are kept in a bounded cache and can either match a single
+label set or be evaluated against the inverted label index of a ResourceStore,
+as set intersections and differences rather than a scan of every resource.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional
+
+Operator = Literal["=", "!=", "in", "notin", "exists", "!"]
+
+_REQUIREMENT = re.compile(
+    r"""\s*(?:
+        (?P<not>!)\s*(?P<nkey>[^\s,=!()]+)
+      | (?P<skey>[^\s,=!()]+)\s+(?P<setop>in|notin)\s*\((?P<values>[^)]*)\)
+      | (?P<key>[^\s,=!()]+)\s*(?:(?P<op>==|=|!=)\s*(?P<value>[^\s,=!()]*))?
+    )\s*(?:,|$)""",
+    re.VERBOSE,
+)
+
+
+class SelectorError(ValueError):
+    """
+    Raised for selector strings that can't be parsed.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class Requirement:
+    key: str
+    op: Operator
+    values: frozenset[str] = frozenset()
+
+    def matches(self, labels: Mapping[str, str]) -> bool:
+        value = labels.get(self.key)
+        if self.op == "exists":
+            return value is not None
+        if self.op == "!":
+            return value is None
+        if self.op in ("=", "in"):
+            return value in self.values
+        # != and notin also match resources without the label
+        return value not in self.values
+
+    @property
+    def positive(self) -> bool:
+        """
+        Whether the requirement can only be met by resources holding the label.
+        """
+        return self.op in ("=", "in", "exists")
+
+
+@dataclass(frozen=True, slots=True)
+class Selector:
+    # alternatives, each a conjunction of requirements
+    terms: tuple[tuple[Requirement, ...], ...]
+
+    def matches(self, labels: Optional[Mapping[str, str]]) -> bool:
+        """
+        Return whether a label set is selected.
+        :param labels: The labels of a resource
+        """
+        labels = labels or {}
+        return any(all(r.matches(labels) for r in term) for term in self.terms)
+
+    def select(
+        self,
+        index: Mapping[tuple[str, str], set],
+        key_index: Mapping[str, set],
+        universe: Iterable,
+    ) -> set:
+        """
+        Return the keys of the selected resources from an inverted label index.
+        :param index: (label key, label value) -> keys of the resources holding it
+        :param key_index: label key -> keys of the resources holding it
+        :param universe: keys of all the resources, only used by terms without
+            any positive requirement
+        """
+        selected = set()
+        for term in self.terms:
+            candidates = []
+            for r in term:
+                if r.op == "exists":
+                    candidates.append(key_index.get(r.key, ()))
+                elif r.positive:
+                    sets = [index.get((r.key, v), ()) for v in r.values]
+                    candidates.append(sets[0] if len(sets) == 1 else set().union(*sets))
+            if candidates:
+                candidates.sort(key=len)
+                keys = set(candidates[0])
+                for c in candidates[1:]:
+                    if not keys:
+                        break
+                    keys &= c
+            else:
+                keys = set(universe)
+
+            for r in term:
+                if not keys:
+                    break
+                if r.op == "!":
+                    keys -= key_index.get(r.key, set())
+                elif not r.positive:
+                    for v in r.values:
+                        keys -= index.get((r.key, v), set())
+            selected |= keys
+        return selected
+
+
+def _parse(selector: str) -> tuple[Requirement, ...]:
+    requirements = []
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        m = _REQUIREMENT.match(selector, pos)
+        if m is None or m.end() == pos:
+            raise SelectorError(f"invalid selector {selector!r} at position {pos}")
+        if m["nkey"]:
+            requirements.append(Requirement(m["nkey"], "!"))
+        elif m["skey"]:
+            values = frozenset(v.strip() for v in m["values"].split(",") if v.strip())
+            requirements.append(Requirement(m["skey"], m["setop"], values))
+        elif m["op"]:
+            op = "!=" if m["op"] == "!=" else "="
+            requirements.append(Requirement(m["key"], op, frozenset((m["value"],))))
+        else:
+            requirements.append(Requirement(m["key"], "exists"))
+        pos = m.end()
+    return tuple(requirements)
+
+
+# selectors come from resource specs, keep a bounded number of them
+@lru_cache(maxsize=65536)
+def _compile(selectors: tuple[str, ...]) -> Selector:
+    return Selector(tuple(_parse(s) for s in selectors))
+
+
+def compile_selector(selectors: str | Iterable[str]) -> Selector:
+    """
+    Compile a selector field into a reusable Selector.
+    An empty list selects nothing, an empty string selects everything.
+    :param selectors: A selector string or a list of them, as found in the specs
+    """
+    if isinstance(selectors, str):
+        selectors = (selectors,)
+    return _compile(tuple(selectors))
@@ -0,0 +1,314 @@
+"""
+On-disk snapshot store of validated resources of a generated kind.
+
+A snapshot file holds resources of a single kind as an append-only log, so
+updating a resource only appends a record. Every record carries the key of the
+resource (namespace/name), its resourceVersion, its content fingerprint and
+the resource encoded with the positional codec (see pydantic_eda.codecs),
+which is decoded by the positional validators of pydantic-core.
+
+Opening a snapshot scans the record headers only and keeps an in-memory index
+of key to record offset; resources are decoded from the memory-mapped file on
+lookup. Deletes append a record without a resource. `compact()` rewrites the
+file with the live records only.
+
+File layout:
+    header  magic (8 bytes) | schema fingerprint of the kind (8 bytes)
+    record  data length, key length, version length, fingerprint length
+            (uint32, uint16, uint16, uint16, little-endian) | key | version |
+            fingerprint | data
+
+A file written for a different schema of the kind is discarded on open.
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.canonical import fingerprint
+from pydantic_eda.codecs import decoder, encoder, schema_fingerprint
+
+M = TypeVar("M", bound=BaseModel)
+
+MAGIC = b"EDASNAP2"
+_HEADER = len(MAGIC) + 8
+_RECORD = struct.Struct("<IHHH")
+
+
+def key_of(name: str, namespace: Optional[str] = None) -> str:
+    """
+    Return the snapshot key of a resource.
+    :param name: Name of the resource
+    :param namespace: Namespace of the resource, None for cluster-scoped resources
+    """
+    return f"{namespace}/{name}" if namespace else name
+
+
+def _resource_key(resource: BaseModel) -> str:
+    metadata = resource.metadata
+    return key_of(metadata.name, getattr(metadata, "namespace", None))
+
+
+class _Entry:
+    __slots__ = ("offset", "length", "version", "fingerprint")
+
+    def __init__(self, offset: int, length: int, version: str, fingerprint: str):
+        # offset and length of the encoded resource in the file
+        self.offset = offset
+        self.length = length
+        self.version = version
+        self.fingerprint = fingerprint
+
+
+class SnapshotStore(Generic[M]):
+    """
+    Snapshot of the resources of one kind, persisted in a file.
+
+    with SnapshotStore("toponodes.snap", TopoNode) as snapshot:
+        node = snapshot.get("leaf1", "eda")
+        if node is None or snapshot.is_stale(fresh_node):
+            snapshot.put(fresh_node)
+    """
+
+    def __init__(self, path: str | os.PathLike, model: type[M]):
+        """
+        Open the snapshot file of a kind, creating it if needed.
+        :param path: Path of the snapshot file
+        :param model: The generated model class of the kind, e.g. TopoNode
+        """
+        self.path = os.fspath(path)
+        self.model = model
+        self._encode = encoder(model)
+        self._decode = decoder(model)
+        self._header = MAGIC + schema_fingerprint(model)
+        self._index: dict[str, _Entry] = {}
+        self._map: Optional[mmap.mmap] = None
+        # size of the file covered by the index
+        self._size = 0
+        self._open(load=True)
+
+    def _open(self, load: bool):
+        with ExitStack() as stack:
+            self._file = stack.enter_context(open(self.path, "a+b"))
+            if load:
+                self._load()
+            # keep the file open once loaded, it's closed on failure
+            stack.pop_all()
+
+    def _load(self):
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size < _HEADER or self._read(0, _HEADER) != self._header:
+            # new file, or written for another schema of the kind
+            self._file.truncate(0)
+            self._file.write(self._header)
+            self._file.flush()
+            self._size = _HEADER
+            return
+
+        buf = self._mapped(size)
+        index = self._index
+        offset = _HEADER
+        while offset + _RECORD.size <= size:
+            data_len, key_len, version_len, fp_len = _RECORD.unpack_from(buf, offset)
+            start = offset + _RECORD.size
+            end = start + key_len + version_len + fp_len + data_len
+            if end > size:
+                # incomplete last record, e.g. interrupted write
+                break
+            key = buf[start : start + key_len].decode()
+            if data_len:
+                start += key_len
+                version = buf[start : start + version_len].decode()
+                start += version_len
+                fp = buf[start : start + fp_len].decode()
+                index[key] = _Entry(start + fp_len, data_len, version, fp)
+            else:
+                index.pop(key, None)
+            offset = end
+
+        if offset != size:
+            self._file.truncate(offset)
+        self._size = offset
+
+    def _read(self, offset: int, length: int) -> bytes:
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def _mapped(self, size: Optional[int] = None) -> mmap.mmap:
+        size = self._size if size is None else size
+        if self._map is None or len(self._map) < size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _append(self, key: str, version: str, fp: str, data: bytes):
+        key_b, version_b, fp_b = key.encode(), version.encode(), fp.encode()
+        record = b"".join(
+            (
+                _RECORD.pack(len(data), len(key_b), len(version_b), len(fp_b)),
+                key_b,
+                version_b,
+                fp_b,
+                data,
+            )
+        )
+        self._file.write(record)
+        self._size += len(record)
+        return self._size - len(data)
+
+    def _put(self, resource: M, version: Optional[str]):
+        key = _resource_key(resource)
+        fp = fingerprint(resource)
+        if version is None:
+            version = getattr(resource.metadata, "resourceVersion", None) or ""
+        entry = self._index.get(key)
+        if entry is not None and entry.fingerprint == fp and entry.version == version:
+            return
+        data = json.dumps(
+            self._encode(resource), separators=(",", ":"), ensure_ascii=False
+        ).encode()
+        offset = self._append(key, version, fp, data)
+        self._index[key] = _Entry(offset, len(data), version, fp)
+
+    def put(self, resource: M, version: Optional[str] = None):
+        """
+        Store a resource, replacing the previous snapshot of it.
+        Nothing is written when the resource is unchanged.
+        :param resource: A validated instance of the kind
+        :param version: resourceVersion of the resource, as returned by the API
+        """
+        self._put(resource, version)
+        self._file.flush()
+
+    def put_many(self, resources: Iterable[M]):
+        """
+        Store many resources, e.g. the items of a list response.
+        :param resources: Validated instances of the kind
+        """
+        for resource in resources:
+            self._put(resource, None)
+        self._file.flush()
+
+    def delete(self, name: str, namespace: Optional[str] = None) -> bool:
+        """
+        Remove a resource from the snapshot, returns whether it was present.
+        :param name: Name of the resource
+        :param namespace: Namespace of the resource
+        """
+        key = key_of(name, namespace)
+        if self._index.pop(key, None) is None:
+            return False
+        self._append(key, "", "", b"")
+        self._file.flush()
+        return True
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[M]:
+        """
+        Return the snapshot of a resource, or None if it isn't in the snapshot.
+        :param name: Name of the resource
+        :param namespace: Namespace of the resource
+        """
+        entry = self._index.get(key_of(name, namespace))
+        if entry is None:
+            return None
+        return self._load_entry(entry)
+
+    def _load_entry(self, entry: _Entry) -> M:
+        buf = self._mapped()
+        return self._decode(json.loads(buf[entry.offset : entry.offset + entry.length]))
+
+    def version(self, name: str, namespace: Optional[str] = None) -> Optional[str]:
+        """
+        Return the resourceVersion stored with a resource, None if unknown.
+        :param name: Name of the resource
+        :param namespace: Namespace of the resource
+        """
+        entry = self._index.get(key_of(name, namespace))
+        return entry.version or None if entry is not None else None
+
+    def is_stale(self, resource: M, version: Optional[str] = None) -> bool:
+        """
+        Return whether the snapshot of a resource differs from the given one.
+        The resourceVersions are compared when both are known, the content
+        fingerprints otherwise.
+        :param resource: The current instance of the resource
+        :param version: resourceVersion of the resource, as returned by the API
+        """
+        entry = self._index.get(_resource_key(resource))
+        if entry is None:
+            return True
+        if version is None:
+            version = getattr(resource.metadata, "resourceVersion", None)
+        if version and entry.version:
+            return version != entry.version
+        return fingerprint(resource) != entry.fingerprint
+
+    def keys(self) -> list[str]:
+        """
+        Return the keys (namespace/name) of the resources in the snapshot.
+        """
+        return list(self._index)
+
+    def __iter__(self) -> Iterator[M]:
+        for entry in list(self._index.values()):
+            yield self._load_entry(entry)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def compact(self):
+        """
+        Rewrite the snapshot file with the live records only.
+        """
+        tmp = f"{self.path}.tmp"
+        buf = self._mapped()
+        index = {}
+        with open(tmp, "wb") as out:
+            out.write(self._header)
+            size = _HEADER
+            for key, entry in self._index.items():
+                key_b = key.encode()
+                version_b = entry.version.encode()
+                fp_b = entry.fingerprint.encode()
+                out.write(
+                    _RECORD.pack(entry.length, len(key_b), len(version_b), len(fp_b))
+                )
+                out.write(key_b + version_b + fp_b)
+                size += _RECORD.size + len(key_b) + len(version_b) + len(fp_b)
+                out.write(buf[entry.offset : entry.offset + entry.length])
+                index[key] = _Entry(
+                    size, entry.length, entry.version, entry.fingerprint
+                )
+                size += entry.length
+
+        self.close()
+        os.replace(tmp, self.path)
+        self._open(load=False)
+        self._index = index
+        self._size = size
+
+    def close(self):
+        """
+        Close the snapshot file.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotStore[M]":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,327 @@
+"""
+Indexed in-memory store of the resources of a generated kind.
+
+The store keeps the resources of a kind keyed by (namespace, name) and
+maintains secondary indexes on labels and on chosen fields, updated
+incrementally on every add, update and delete, so that list-and-watch
+consumers can answer "which interfaces have label X" without scanning.
+
+The store is thread-safe: writers and readers take the same lock, and reads
+return the stored instances, which must be treated as read-only.
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import partial
+from typing import Any, Generic, Literal, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.access import compile_accessor
+from pydantic_eda.selector import Selector, compile_selector
+from pydantic_eda.update import get_in
+
+M = TypeVar("M", bound=BaseModel)
+
+Key = tuple[Optional[str], str]
+
+# watch event types, as sent by the Kubernetes API
+EventType = Literal["ADDED", "MODIFIED", "DELETED"]
+
+# called as callback(event, key, old, new) for every change of a store
+ChangeCallback = Callable[
+    [EventType, Key, Optional[BaseModel], Optional[BaseModel]], None
+]
+
+
+def key_of(resource: BaseModel) -> Key:
+    """
+    Return the (namespace, name) key of a resource, namespace is None for
+    cluster-scoped resources.
+    :param resource: A generated resource instance
+    """
+    metadata = resource.metadata
+    return getattr(metadata, "namespace", None), metadata.name
+
+
+def _index_values(value: Any) -> Iterable[Any]:
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value
+    return (value,)
+
+
+class ResourceStore(Generic[M]):
+    """
+    Thread-safe store of resources with label and field indexes.
+
+    store = ResourceStore(Interface, indexes={"node": "spec.members[*].node"})
+    store.replace(interface_list.items)
+    store.apply_event("MODIFIED", interface)
+    leafs = store.by_label("role", "leaf")
+    on_leaf1 = store.by_index("node", "leaf1")
+    """
+
+    def __init__(
+        self,
+        model: Optional[type[M]] = None,
+        indexes: Optional[Mapping[str, str | Callable[[M], Any]]] = None,
+    ):
+        """
+        :param model: The generated model class of the kind, checked on writes
+        :param indexes: Secondary indexes by name: either a dotted path or JSON
+            pointer of the indexed field, compiled with compile_accessor when the
+            model is given, or a function returning the indexed value of a
+            resource. A list value indexes the resource under each item.
+        """
+        self.model = model
+        self._lock = threading.RLock()
+        self._items: dict[Key, M] = {}
+        # (label key, label value) -> resource keys
+        self._labels: dict[tuple[str, str], set[Key]] = {}
+        # label key -> resource keys, for existence queries
+        self._label_keys: dict[str, set[Key]] = {}
+        self._extractors: dict[str, Callable[[M], Any]] = {
+            name: self._extractor(index) for name, index in (indexes or {}).items()
+        }
+        # index name -> indexed value -> resource keys
+        self._indexes: dict[str, dict[Any, set[Key]]] = {
+            name: {} for name in self._extractors
+        }
+        self._callbacks: list[ChangeCallback] = []
+
+    def _extractor(self, index: str | Callable[[M], Any]) -> Callable[[M], Any]:
+        if not isinstance(index, str):
+            return index
+        if self.model is not None:
+            # checked against the model once, raises PathError for wrong paths
+            return compile_accessor(self.model, index)
+        return partial(get_in, path=index)
+
+    def _link(self, key: Key, resource: M):
+        labels = getattr(resource.metadata, "labels", None)
+        if labels:
+            for item in labels.items():
+                self._labels.setdefault(item, set()).add(key)
+                self._label_keys.setdefault(item[0], set()).add(key)
+        for name, extract in self._extractors.items():
+            index = self._indexes[name]
+            for value in _index_values(extract(resource)):
+                index.setdefault(value, set()).add(key)
+
+    @staticmethod
+    def _discard(table: dict, entry: Any, key: Key):
+        keys = table.get(entry)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del table[entry]
+
+    def _unlink(self, key: Key, resource: M):
+        labels = getattr(resource.metadata, "labels", None)
+        if labels:
+            for item in labels.items():
+                self._discard(self._labels, item, key)
+                self._discard(self._label_keys, item[0], key)
+        for name, extract in self._extractors.items():
+            index = self._indexes[name]
+            for value in _index_values(extract(resource)):
+                self._discard(index, value, key)
+
+    def _put(self, resource: M):
+        if self.model is not None and not isinstance(resource, self.model):
+            raise TypeError(
+                f"expected {self.model.__name__}, got {type(resource).__name__}"
+            )
+        key = key_of(resource)
+        previous = self._items.get(key)
+        if previous is resource:
+            return
+        if previous is not None:
+            self._unlink(key, previous)
+        self._items[key] = resource
+        self._link(key, resource)
+        for callback in self._callbacks:
+            callback(
+                "ADDED" if previous is None else "MODIFIED", key, previous, resource
+            )
+
+    def _pop(self, key: Key) -> Optional[M]:
+        resource = self._items.pop(key, None)
+        if resource is not None:
+            self._unlink(key, resource)
+            for callback in self._callbacks:
+                callback("DELETED", key, resource, None)
+        return resource
+
+    def on_change(self, callback: ChangeCallback):
+        """
+        Register a callback called, under the lock of the store, for every
+        change as callback(event, key, old, new), and first with an ADDED event
+        for each resource already in the store.
+        :param callback: The callback
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+            for key, resource in self._items.items():
+                callback("ADDED", key, None, resource)
+
+    def add(self, resource: M):
+        """
+        Add or replace a resource.
+        :param resource: A generated resource instance
+        """
+        with self._lock:
+            self._put(resource)
+
+    update = add
+
+    def delete(self, name: str, namespace: Optional[str] = None) -> Optional[M]:
+        """
+        Remove a resource, returns the removed instance if it was present.
+        :param name: Name of the resource
+        :param namespace: Namespace of the resource
+        """
+        with self._lock:
+            return self._pop((namespace, name))
+
+    def apply_event(self, event: EventType, resource: M):
+        """
+        Apply a watch event.
+        :param event: ADDED, MODIFIED or DELETED
+        :param resource: The resource of the event
+        """
+        with self._lock:
+            if event == "DELETED":
+                self._pop(key_of(resource))
+            elif event in ("ADDED", "MODIFIED"):
+                self._put(resource)
+            else:
+                raise ValueError(f"unknown event type {event!r}")
+
+    def replace(self, resources: Iterable[M]):
+        """
+        Replace the content of the store with the resources of a list call.
+        Resources that are unchanged (same instance) keep their index entries.
+        :param resources: All the resources of the kind
+        """
+        with self._lock:
+            seen = set()
+            for resource in resources:
+                self._put(resource)
+                seen.add(key_of(resource))
+            for key in [k for k in self._items if k not in seen]:
+                self._pop(key)
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[M]:
+        """
+        Return a resource by name, or None.
+        :param name: Name of the resource
+        :param namespace: Namespace of the resource
+        """
+        return self._items.get((namespace, name))
+
+    def _resolve(self, keys: Optional[set[Key]]) -> list[M]:
+        if not keys:
+            return []
+        items = self._items
+        return [items[k] for k in keys]
+
+    def by_label(self, key: str, value: Optional[str] = None) -> list[M]:
+        """
+        Return the resources holding a label, with the given value if not None.
+        :param key: Label key
+        :param value: Label value
+        """
+        with self._lock:
+            if value is None:
+                return self._resolve(self._label_keys.get(key))
+            return self._resolve(self._labels.get((key, value)))
+
+    def select(self, selector: str | Iterable[str] | Selector) -> list[M]:
+        """
+        Return the resources matching a label selector, using the label index.
+        :param selector: A selector string, a list of them as found in the specs,
+            or a compiled Selector
+        """
+        if not isinstance(selector, Selector):
+            selector = compile_selector(selector)
+        with self._lock:
+            return self._resolve(
+                selector.select(self._labels, self._label_keys, self._items)
+            )
+
+    def by_index(self, index: str, value: Any) -> list[M]:
+        """
+        Return the resources whose indexed value is the given one.
+        :param index: Name of the index
+        :param value: Indexed value
+        """
+        with self._lock:
+            return self._resolve(self._indexes[index].get(value))
+
+    def find(
+        self,
+        conditions: Iterable[tuple[str, Literal["==", "!="], Any]],
+        namespace: Optional[str] = None,
+    ) -> list[M]:
+        """
+        Return the resources meeting all the conditions on indexed values.
+        At least one condition must be an equality.
+        :param conditions: (index name, "==" or "!=", value) tuples
+        :param namespace: Only return resources of this namespace
+        """
+        with self._lock:
+            equal = []
+            not_equal = []
+            for index, op, value in conditions:
+                keys = self._indexes[index].get(value, set())
+                (equal if op == "==" else not_equal).append(keys)
+            if not equal:
+                raise ValueError("find needs at least one equality condition")
+            equal.sort(key=len)
+            keys = equal[0].intersection(*equal[1:])
+            if not_equal:
+                keys = keys.difference(*not_equal)
+            if namespace is not None:
+                keys = {k for k in keys if k[0] == namespace}
+            return self._resolve(keys)
+
+    def has_index(self, index: str) -> bool:
+        """
+        Return whether the store maintains the given index.
+        :param index: Name of the index
+        """
+        return index in self._indexes
+
+    def index_values(self, index: str) -> list[Any]:
+        """
+        Return the distinct values of an index.
+        :param index: Name of the index
+        """
+        with self._lock:
+            return list(self._indexes[index])
+
+    def keys(self) -> list[Key]:
+        """
+        Return the (namespace, name) keys of the stored resources.
+        """
+        with self._lock:
+            return list(self._items)
+
+    def values(self) -> list[M]:
+        """
+        Return the stored resources.
+        """
+        with self._lock:
+            return list(self._items.values())
+
+    def __iter__(self) -> Iterator[M]:
+        return iter(self.values())
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,201 @@
+"""
+Incremental result tables of streaming EQL queries.
+
+The OpenAPI specification only describes non-streaming query responses. A
+streaming query sends frames carrying the schema of the rows once and then
+operations on the rows of the result, identified by a row id:
+
+    {"schema": {...}, "jsonSchema": {...},
+     "op": [{"insert_or_modify": {"rows": [{"id": 1, "data": {...}}]}},
+            {"delete": {"ids": [2]}}]}
+
+`QueryTable` applies those operations to a table keyed by row id, notifies
+change callbacks, and keeps nothing but the live rows. Frames can be recorded
+to a file, one JSON frame per line, and replayed with `replay`.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from typing import IO, Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from pydantic_eda.core.v25_8_1.models import QuerySchema
+from pydantic_eda.decode import Buffer, as_json_input
+from pydantic_eda.query import RowDecoder, row_decoder
+
+RowId = Union[int, str]
+
+Change = Literal["insert", "update", "delete"]
+
+
+class StreamRow(BaseModel):
+    id: RowId
+    data: Optional[dict[str, Any]] = None
+
+
+class StreamInsertOrModify(BaseModel):
+    rows: Optional[list[StreamRow]] = None
+
+
+class StreamDelete(BaseModel):
+    ids: Optional[list[RowId]] = None
+
+
+class StreamOp(BaseModel):
+    insert_or_modify: Optional[StreamInsertOrModify] = None
+    delete: Optional[StreamDelete] = None
+
+
+class QueryStreamFrame(BaseModel):
+    """
+    A frame of a streaming query
+    """
+
+    jsonSchema: Optional[dict[str, dict[str, Any]]] = None
+    schema_: Annotated[Optional[QuerySchema], Field(alias="schema")] = None
+    op: Optional[list[StreamOp]] = None
+
+
+_frame_validator = QueryStreamFrame.__pydantic_validator__
+
+ChangeCallback = Callable[[Change, RowId, Optional[dict], Optional[dict]], None]
+
+
+class QueryTable:
+    """
+    The live result of a streaming query, keyed by row id.
+
+    table = QueryTable()
+    table.on_change(lambda change, id, old, new: print(change, id))
+    for frame in websocket:
+        table.apply_json(frame)
+    row = table.get(row_id)
+    """
+
+    def __init__(self, decoder: Optional[RowDecoder] = None):
+        """
+        :param decoder: Decoder of the rows, taken from the first frame
+            carrying a schema by default. Rows are kept as received without one.
+        """
+        self.decoder = decoder
+        self._rows: dict[RowId, dict[str, Any]] = {}
+        self._callbacks: list[ChangeCallback] = []
+
+    def on_change(self, callback: ChangeCallback):
+        """
+        Register a callback called for every changed row, after the change is
+        applied, as callback(change, row_id, old_row, new_row).
+        :param callback: The callback
+        """
+        self._callbacks.append(callback)
+
+    def _notify(self, change: Change, key: RowId, old, new):
+        for callback in self._callbacks:
+            callback(change, key, old, new)
+
+    def apply(self, frame: QueryStreamFrame) -> int:
+        """
+        Apply the operations of a frame, returns the number of changed rows.
+        :param frame: A validated frame
+        """
+        if frame.jsonSchema or frame.schema_ is not None:
+            self.decoder = row_decoder(frame.jsonSchema, frame.schema_)
+
+        rows = self._rows
+        changed = 0
+        for op in frame.op or ():
+            upsert = op.insert_or_modify
+            if upsert is not None and upsert.rows:
+                data = [row.data or {} for row in upsert.rows]
+                if self.decoder is not None:
+                    data = self.decoder.records(data)
+                for row, new in zip(upsert.rows, data):
+                    old = rows.get(row.id)
+                    rows[row.id] = new
+                    changed += 1
+                    if self._callbacks:
+                        self._notify(
+                            "insert" if old is None else "update", row.id, old, new
+                        )
+
+            delete = op.delete
+            if delete is not None and delete.ids:
+                for key in delete.ids:
+                    old = rows.pop(key, None)
+                    if old is not None:
+                        changed += 1
+                        if self._callbacks:
+                            self._notify("delete", key, old, None)
+        return changed
+
+    def apply_json(self, frame: Buffer) -> int:
+        """
+        Decode and apply a raw frame, returns the number of changed rows.
+        :param frame: JSON frame
+        """
+        return self.apply(_frame_validator.validate_json(as_json_input(frame)))
+
+    def get(self, key: RowId) -> Optional[dict[str, Any]]:
+        """
+        Return a row by id, or None.
+        :param key: Row id
+        """
+        return self._rows.get(key)
+
+    def rows(self) -> dict[RowId, dict[str, Any]]:
+        """
+        Return a copy of the table, by row id.
+        """
+        return dict(self._rows)
+
+    def clear(self):
+        """
+        Drop all the rows, e.g. before the stream is restarted.
+        """
+        self._rows.clear()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(list(self._rows.values()))
+
+    def __contains__(self, key: RowId) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def record(out: IO[bytes], frame: Buffer):
+    """
+    Append a raw frame to a replay file.
+    :param out: Replay file opened in binary mode
+    :param frame: JSON frame, on a single line
+    """
+    data = as_json_input(frame)
+    if isinstance(data, str):
+        data = data.encode()
+    out.write(bytes(data).rstrip(b"\n") + b"\n")
+
+
+def iter_frames(path: str | os.PathLike) -> Iterator[bytes]:
+    """
+    Yield the raw frames of a replay file.
+    :param path: Path of the replay file
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def replay(path: str | os.PathLike, table: Optional[QueryTable] = None) -> QueryTable:
+    """
+    Apply the frames of a replay file to a table.
+    :param path: Path of the replay file
+    :param table: The table to apply the frames to, a new one by default
+    """
+    table = QueryTable() if table is None else table
+    for frame in iter_frames(path):
+        table.apply_json(frame)
+    return table
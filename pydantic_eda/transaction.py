@@ -0,0 +1,294 @@
+"""
+Builder of EDA transactions from generated app model instances.
+
+Building a core `Transaction` model from app resources means dumping every
+resource into a dict, validating it into `TransactionContent` and serializing
+the whole transaction again. The builder instead serializes every CR straight
+to JSON bytes once, when it is added, and stitches the transaction body
+together from those fragments.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from pydantic_eda.canonical import SERVER_FIELDS
+from pydantic_eda.core.v25_8_1.models import NsCrGvkName, Transaction
+from pydantic_eda.write import json_writer, write_json, write_python
+
+Operation = Literal["create", "replace", "modify", "patch", "delete"]
+
+
+def _dump(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def resource_json(resource: BaseModel) -> bytes:
+    """
+    Serialize an app resource into the JSON form used as a transaction value:
+    apiVersion, kind, metadata and spec, without status, None and unset fields.
+    :param resource: A generated resource instance, e.g. Interface or BridgeDomain
+    """
+    return json_writer(type(resource), SERVER_FIELDS)(resource)
+
+
+def target_of(resource: BaseModel) -> dict[str, Any]:
+    """
+    Return the NsCrGvkName identifying a resource, as a dict.
+    :param resource: A generated resource instance
+    """
+    group, _, version = resource.apiVersion.rpartition("/")
+    target = {
+        "gvk": {"group": group, "kind": resource.kind, "version": version},
+        "name": resource.metadata.name,
+    }
+    namespace = getattr(resource.metadata, "namespace", None)
+    if namespace:
+        target["namespace"] = namespace
+    return target
+
+
+class TransactionCrEntry:
+    """
+    A CR of a transaction, already serialized to its JSON form.
+    """
+
+    __slots__ = ("op", "target", "data")
+
+    def __init__(self, op: Operation, target: dict[str, Any], data: bytes):
+        self.op = op
+        # NsCrGvkName of the CR as a dict
+        self.target = target
+        # serialized TransactionCr
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return (
+            f"TransactionCrEntry(op={self.op!r}, target={self.target!r}, "
+            f"size={len(self.data)})"
+        )
+
+
+class TransactionBuilder:
+    """
+    Incrementally builds the JSON body of a core Transaction from app resources.
+
+    builder = TransactionBuilder("add bridge interfaces")
+    builder.create(bridge_domain)
+    for bi in bridge_interfaces:
+        builder.create(bi)
+    body = builder.to_json()
+    """
+
+    def __init__(
+        self,
+        description: str = "",
+        dry_run: bool = False,
+        result_type: str | None = None,
+        retain: bool | None = None,
+    ):
+        self.description = description
+        self.dry_run = dry_run
+        self.result_type = result_type
+        self.retain = retain
+        self.crs: list[TransactionCrEntry] = []
+
+    def _add_value(self, op: Operation, resource: BaseModel):
+        data = b'{"type":{"%s":{"value":%s}}}' % (
+            op.encode(),
+            resource_json(resource),
+        )
+        self.crs.append(TransactionCrEntry(op, target_of(resource), data))
+
+    def create(self, resource: BaseModel) -> "TransactionBuilder":
+        """
+        Add a create operation for the resource.
+        :param resource: A generated resource instance
+        """
+        self._add_value("create", resource)
+        return self
+
+    def replace(self, resource: BaseModel) -> "TransactionBuilder":
+        """
+        Add a replace operation for the resource.
+        :param resource: A generated resource instance
+        """
+        self._add_value("replace", resource)
+        return self
+
+    def modify(self, resource: BaseModel) -> "TransactionBuilder":
+        """
+        Add a modify operation for the resource.
+        :param resource: A generated resource instance
+        """
+        self._add_value("modify", resource)
+        return self
+
+    def patch(
+        self,
+        target: BaseModel,
+        ops: Iterable[BaseModel | dict[str, Any]],
+    ) -> "TransactionBuilder":
+        """
+        Add a patch operation with JSON patch ops for the resource.
+        :param target: The resource to patch, or a core NsCrGvkName
+        :param ops: K8SPatchOp instances (from core or any app module) or plain dicts
+        """
+        target = self._target(target)
+        patch_ops = b",".join(
+            write_json(op) if isinstance(op, BaseModel) else _dump(op) for op in ops
+        )
+        data = b'{"type":{"patch":{"patchOps":[%s],"target":%s}}}' % (
+            patch_ops,
+            _dump(target),
+        )
+        self.crs.append(TransactionCrEntry("patch", target, data))
+        return self
+
+    def delete(self, target: BaseModel) -> "TransactionBuilder":
+        """
+        Add a delete operation for the resource.
+        :param target: The resource to delete, or a core NsCrGvkName
+        """
+        target = self._target(target)
+        data = b'{"type":{"delete":%s}}' % _dump(target)
+        self.crs.append(TransactionCrEntry("delete", target, data))
+        return self
+
+    @staticmethod
+    def _target(target: BaseModel) -> dict[str, Any]:
+        if isinstance(target, NsCrGvkName):
+            return write_python(target)
+        return target_of(target)
+
+    def _envelope(self) -> tuple[bytes, bytes]:
+        """
+        Return the JSON body parts before and after the CRs.
+        """
+        tail = {"description": self.description, "dryRun": self.dry_run}
+        if self.result_type is not None:
+            tail["resultType"] = self.result_type
+        if self.retain is not None:
+            tail["retain"] = self.retain
+        return b'{"crs":[', b"]," + _dump(tail)[1:]
+
+    def iter_json(self, crs: list[TransactionCrEntry] | None = None) -> Iterator[bytes]:
+        """
+        Yield the transaction body in chunks, e.g. to stream it as a request body.
+        :param crs: CRs to include, defaults to all CRs added to the builder
+        """
+        head, tail = self._envelope()
+        yield head
+        for i, cr in enumerate(self.crs if crs is None else crs):
+            if i:
+                yield b","
+            yield cr.data
+        yield tail
+
+    def to_json(self) -> bytes:
+        """
+        Return the transaction body as JSON bytes.
+        """
+        return b"".join(self.iter_json())
+
+    def to_model(self) -> Transaction:
+        """
+        Return the transaction as a validated core Transaction model.
+        """
+        return Transaction.model_validate_json(self.to_json())
+
+    def split(
+        self,
+        max_bytes: int | None = None,
+        max_crs: int | None = None,
+        deletes_last: bool = True,
+    ) -> list["TransactionBuilder"]:
+        """
+        Split the transaction into several ones bounded by body size and CR count.
+        See plan_chunks for the ordering guarantees.
+        :param max_bytes: Maximum size of each transaction body in bytes
+        :param max_crs: Maximum number of CRs in each transaction
+        :param deletes_last: Move deletes after all the other operations
+        """
+        head, tail = self._envelope()
+        chunks = plan_chunks(
+            self.crs,
+            max_bytes=max_bytes,
+            max_crs=max_crs,
+            overhead=len(head) + len(tail),
+            deletes_last=deletes_last,
+        )
+
+        builders = []
+        for chunk in chunks:
+            builder = TransactionBuilder(
+                self.description, self.dry_run, self.result_type, self.retain
+            )
+            builder.crs = chunk
+            builders.append(builder)
+        return builders
+
+    def __len__(self) -> int:
+        return len(self.crs)
+
+
+def plan_chunks(
+    crs: list[TransactionCrEntry],
+    max_bytes: int | None = None,
+    max_crs: int | None = None,
+    overhead: int = 0,
+    deletes_last: bool = True,
+) -> list[list[TransactionCrEntry]]:
+    """
+    Split a list of CRs into chunks that fit in a transaction each.
+
+    The relative order of the CRs is kept, so a resource added before the ones
+    referencing it (e.g. a BridgeDomain before its BridgeInterfaces) always lands
+    in the same or an earlier transaction. With deletes_last, deletes are moved
+    after all the other operations, so the resources replacing the deleted ones
+    are created first. Sizes are summed from the already serialized CRs.
+    :param crs: Serialized CRs, in dependency order
+    :param max_bytes: Maximum size of each transaction body in bytes
+    :param max_crs: Maximum number of CRs in each transaction
+    :param overhead: Size of the transaction body without any CR
+    :param deletes_last: Move deletes after all the other operations
+    """
+    if deletes_last:
+        crs = [cr for cr in crs if cr.op != "delete"] + [
+            cr for cr in crs if cr.op == "delete"
+        ]
+
+    chunks = []
+    chunk = []
+    size = overhead
+    for cr in crs:
+        # CRs are separated by a comma
+        cr_size = len(cr.data) + (1 if chunk else 0)
+
+        if max_bytes is not None and overhead + len(cr.data) > max_bytes:
+            raise ValueError(
+                f"CR {cr.target} of {len(cr.data)} bytes does not fit in a "
+                f"transaction of {max_bytes} bytes"
+            )
+
+        if chunk and (
+            (max_bytes is not None and size + cr_size > max_bytes)
+            or (max_crs is not None and len(chunk) >= max_crs)
+        ):
+            chunks.append(chunk)
+            chunk = []
+            size = overhead
+            cr_size = len(cr.data)
+
+        chunk.append(cr)
+        size += cr_size
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
@@ -0,0 +1,130 @@
+"""
+Copy-on-write updates of the generated models.
+
+Changing a single leaf of a large spec otherwise takes either a deep copy of
+the whole tree or an in-place mutation that breaks every cache holding the
+instance. The helpers below return a new instance with the given path changed,
+copying only the models along that path and sharing every other sub-model
+with the original instance, so many versions of the same spec can be kept at
+the cost of the changed paths only.
+"""
+
+import re
+from collections.abc import Callable, Mapping
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from pydantic_eda.fields import fields_by_key, fields_by_name
+from pydantic_eda.patch import apply_op, parse_pointer
+
+M = TypeVar("M", bound=BaseModel)
+
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+|\*)\]|\[\"((?:[^\"\\]|\\.)*)\"\]")
+
+
+def parse_path(path: str) -> list[str]:
+    """
+    Split a path into reference tokens.
+
+    Paths are either JSON pointers (/spec/overlayProtocol/bgp) or dotted paths
+    with bracketed list indexes and dict keys, e.g. spec.overlayProtocol.bgp.timers,
+    spec.statement[3].action or metadata.labels["eda.nokia.com/role"].
+    Field names can be given either as attribute names or as keys (aliases).
+    [*] is returned as the * token, used as a wildcard by compiled accessors.
+    :param path: The path to parse
+    """
+    if path.startswith("/") or path == "":
+        return parse_pointer(path)
+
+    tokens = []
+    pos = 0
+    while pos < len(path):
+        if path[pos] == "." and tokens:
+            pos += 1
+        m = _PATH_TOKEN.match(path, pos)
+        if m is None:
+            raise ValueError(f"invalid path {path!r} at position {pos}")
+        name, index, key = m.groups()
+        if key is not None:
+            tokens.append(re.sub(r"\\(.)", r"\1", key))
+        else:
+            tokens.append(name if name is not None else index)
+        pos = m.end()
+    return tokens
+
+
+def get_in(instance: BaseModel, path: str, default: Any = None) -> Any:
+    """
+    Return the value at the path, or the default when the path does not exist.
+    :param instance: A generated model instance
+    :param path: Dotted path or JSON pointer
+    :param default: Value returned for missing paths
+    """
+    value: Any = instance
+    for token in parse_path(path):
+        if isinstance(value, BaseModel):
+            spec = fields_by_key(type(value)).get(token) or fields_by_name(
+                type(value)
+            ).get(token)
+            value = None if spec is None else value.__dict__[spec.name]
+        elif isinstance(value, list):
+            value = (
+                value[int(token)]
+                if token.isdigit() and int(token) < len(value)
+                else None
+            )
+        elif isinstance(value, Mapping):
+            value = value.get(token)
+        else:
+            value = None
+        if value is None:
+            return default
+    return value
+
+
+def set_in(instance: M, path: str, value: Any) -> M:
+    """
+    Return a copy of the instance with the value at the path replaced.
+
+    The value can be a model instance, shared as is, or raw data validated
+    against the field it lands in. Missing intermediate models and dicts are
+    created, list items must exist. The model holding the changed or created
+    field is validated again; all untouched sub-models are shared with the
+    instance.
+    :param instance: A generated model instance
+    :param path: Dotted path or JSON pointer, e.g. spec.overlayProtocol.bgp.timers
+    :param value: The new value
+    """
+    return apply_op(instance, parse_path(path), "set", value, by_name=True)
+
+
+def delete_in(instance: M, path: str) -> M:
+    """
+    Return a copy of the instance with the value at the path removed.
+    :param instance: A generated model instance
+    :param path: Dotted path or JSON pointer
+    """
+    return apply_op(instance, parse_path(path), "remove", by_name=True)
+
+
+def update_in(instance: M, path: str, fn: Callable[[Any], Any]) -> M:
+    """
+    Return a copy of the instance with the value at the path replaced by fn(value).
+    fn receives None when the path does not exist yet and must not mutate its argument.
+    :param instance: A generated model instance
+    :param path: Dotted path or JSON pointer
+    :param fn: Function computing the new value from the current one
+    """
+    return set_in(instance, path, fn(get_in(instance, path)))
+
+
+def evolve(instance: M, changes: Mapping[str, Any]) -> M:
+    """
+    Return a copy of the instance with several paths replaced at once.
+    :param instance: A generated model instance
+    :param changes: New values keyed by dotted path or JSON pointer
+    """
+    for path, value in changes.items():
+        instance = set_in(instance, path, value)
+    return instance
@@ -0,0 +1,70 @@
+"""
+Serializers of the generated models for outbound API bodies.
+
+Nearly every generated field is `Optional[...] = None` and stays unset, so a
+plain `model_dump_json` mostly emits nulls. The writers returned here skip
+None and unset fields, use the wire keys (aliases) and are bound once per class
+to the serializer pydantic-core already compiled for it, so no option is
+handled in python per call nor per field.
+"""
+
+from collections.abc import Callable
+from functools import cache, partial
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@cache
+def json_writer(
+    model: type[BaseModel], exclude: frozenset[str] = frozenset()
+) -> Callable[[BaseModel], bytes]:
+    """
+    Return the function serializing instances of a model into an outbound JSON body.
+    :param model: The generated model class
+    :param exclude: Top-level fields never sent, e.g. status
+    """
+    return partial(
+        model.__pydantic_serializer__.to_json,
+        by_alias=True,
+        exclude_unset=True,
+        exclude_none=True,
+        exclude=set(exclude) or None,
+    )
+
+
+@cache
+def python_writer(
+    model: type[BaseModel], exclude: frozenset[str] = frozenset()
+) -> Callable[[BaseModel], dict[str, Any]]:
+    """
+    Return the function serializing instances of a model into an outbound body
+    made of JSON-compatible python objects.
+    :param model: The generated model class
+    :param exclude: Top-level fields never sent, e.g. status
+    """
+    return partial(
+        model.__pydantic_serializer__.to_python,
+        mode="json",
+        by_alias=True,
+        exclude_unset=True,
+        exclude_none=True,
+        exclude=set(exclude) or None,
+    )
+
+
+def write_json(instance: BaseModel) -> bytes:
+    """
+    Serialize an instance into an outbound JSON body, without None and unset fields.
+    :param instance: A generated model instance
+    """
+    return json_writer(type(instance))(instance)
+
+
+def write_python(instance: BaseModel) -> dict[str, Any]:
+    """
+    Serialize an instance into an outbound body as JSON-compatible python objects,
+    without None and unset fields.
+    :param instance: A generated model instance
+    """
+    return python_writer(type(instance))(instance)
@@ -0,0 +1,32 @@
+from typing import Optional
+
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+
+
+@pytest.fixture(scope="session")
+def make_interface():
+    def make(
+        name: str,
+        node: str = "leaf1",
+        namespace: str = "eda",
+        labels: Optional[dict[str, str]] = None,
+        **spec,
+    ) -> Interface:
+        metadata = {"name": name, "namespace": namespace}
+        if labels is not None:
+            metadata["labels"] = labels
+        return Interface.model_validate(
+            {
+                "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+                "kind": "Interface",
+                "metadata": metadata,
+                "spec": {
+                    "members": [{"node": node, "interface": "ethernet-1-1"}],
+                    **spec,
+                },
+            }
+        )
+
+    return make
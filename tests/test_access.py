@@ -0,0 +1,82 @@
+import pytest
+
+from pydantic_eda.access import PathError, compile_accessor
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface, InterfaceState
+from pydantic_eda.core.v25_8_1 import models as core
+
+
+@pytest.fixture(scope="module")
+def state():
+    return InterfaceState.model_validate(
+        {
+            "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+            "kind": "InterfaceState",
+            "metadata": {"name": "a", "namespace": "eda"},
+            "spec": {"members": []},
+            "status": {
+                "operationalState": "up",
+                "members": [
+                    {"node": "leaf1", "operationalState": "up"},
+                    {"node": "leaf2", "operationalState": "down"},
+                ],
+            },
+        }
+    )
+
+
+def test_fields(make_interface):
+    interface = make_interface("a", labels={"eda.nokia.com/role": "leaf"})
+    assert compile_accessor(Interface, "metadata.name")(interface) == "a"
+    assert compile_accessor(Interface, "/spec/members/0/node")(interface) == "leaf1"
+    assert compile_accessor(Interface, "spec.members[1].node")(interface) is None
+    assert compile_accessor(Interface, "spec.ethernet.fec")(interface) is None
+    labels = compile_accessor(Interface, 'metadata.labels["eda.nokia.com/role"]')
+    assert labels(interface) == "leaf"
+    assert compile_accessor(Interface, "metadata.labels.other")(interface) is None
+    assert compile_accessor(Interface, "spec")(None) is None
+
+
+def test_aliases():
+    op = core.K8SPatchOp.model_validate({"op": "add", "path": "/spec", "from": "/a"})
+    assert compile_accessor(core.K8SPatchOp, "from")(op) == "/a"
+    assert compile_accessor(core.K8SPatchOp, "from_")(op) == "/a"
+
+
+def test_wildcards(make_interface):
+    interfaces = [make_interface("a", "leaf1"), make_interface("b", "leaf2")]
+    nodes = compile_accessor(Interface, "spec.members[*].node")
+    assert nodes.wildcard
+    assert nodes.many(interfaces) == [["leaf1"], ["leaf2"]]
+    labels = compile_accessor(Interface, "metadata.labels.*")
+    assert labels(make_interface("c", labels={"a": "1", "b": "2"})) == ["1", "2"]
+    assert labels(make_interface("d")) == []
+
+
+def test_untyped_fields(state):
+    assert compile_accessor(InterfaceState, "status.operationalState")(state) == "up"
+    assert compile_accessor(InterfaceState, "status.members[1].node")(state) == "leaf2"
+    assert compile_accessor(InterfaceState, "status.members.5.node")(state) is None
+    assert compile_accessor(InterfaceState, "status.nope.deeper")(state) is None
+    states = compile_accessor(InterfaceState, "status.members[*].operationalState")
+    assert states(state) == ["up", "down"]
+
+
+def test_cached():
+    assert compile_accessor(Interface, "spec.mtu") is compile_accessor(
+        Interface, "spec.mtu"
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "spec.nope",
+        "spec.mtu.value",
+        "spec.members.node",
+        "spec.*",
+        "spec.members[x]",
+    ],
+)
+def test_errors(path):
+    with pytest.raises(PathError):
+        compile_accessor(Interface, path)
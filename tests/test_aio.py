@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from pydantic_eda.aio import DecodePool, LoopLagMonitor
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+
+
+@pytest.fixture
+def payloads(make_interface):
+    small = make_interface("a").model_dump_json(by_alias=True)
+    large = make_interface("b", description="x" * 1000).model_dump_json(by_alias=True)
+    return small, large
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_decode(kind, payloads, make_interface):
+    small, large = payloads
+    pool = DecodePool(threshold=512, max_workers=1, max_pending=2, kind=kind)
+
+    async def main():
+        return await asyncio.gather(
+            pool.decode(Interface, small),
+            *(pool.decode(Interface, large.encode()) for _ in range(4)),
+        )
+
+    try:
+        decoded = asyncio.run(main())
+        assert decoded[0] == make_interface("a")
+        assert all(d.spec.description == "x" * 1000 for d in decoded[1:])
+        assert pool.info() == (1, 4, 0, 2)
+    finally:
+        pool.shutdown()
+
+
+def test_pool_shared_by_loops(payloads):
+    _, large = payloads
+    pool = DecodePool(threshold=0, max_workers=2, kind="thread")
+    assert pool.max_pending == 4
+    try:
+        # the in-flight bound is per loop, so a new loop can use the pool
+        for _ in range(2):
+            asyncio.run(pool.decode(Interface, large))
+        assert pool.info().offloaded == 2
+    finally:
+        pool.shutdown()
+
+
+def test_lag_monitor():
+    monitor = LoopLagMonitor(interval=0.001)
+
+    async def main():
+        monitor.start()
+        await asyncio.sleep(0.05)
+        monitor.stop()
+
+    asyncio.run(main())
+    info = monitor.info()
+    assert info.samples > 0
+    assert info.max >= info.mean >= 0
+    monitor.reset()
+    assert monitor.info() == (0, 0.0, 0.0, 0.0)
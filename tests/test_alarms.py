@@ -0,0 +1,76 @@
+import pytest
+
+from pydantic_eda.alarms import AlarmStore
+from pydantic_eda.core.v25_8_1.models import AlarmData, AlarmHistoryData
+
+
+def alarm(name, changed="2025-01-01T00:00:00Z", namespace="eda", **fields):
+    return AlarmData(name=name, namespace=namespace, lastChanged=changed, **fields)
+
+
+def names(alarms):
+    return sorted(a.name for a in alarms)
+
+
+@pytest.fixture
+def store():
+    store = AlarmStore()
+    store.ingest_many(
+        [
+            alarm("link", severity="critical", cleared=False),
+            alarm("bgp", severity="major", cleared=False, parentAlarms=["link"]),
+            alarm("route", severity="minor", cleared=False, parentAlarms=["bgp"]),
+            alarm("fan", severity="major", cleared=True),
+            alarm("link", namespace="other", severity="critical", cleared=False),
+        ]
+    )
+    return store
+
+
+def test_dedup(store):
+    assert len(store) == 5
+    assert not store.ingest(alarm("fan", "2024-12-31T00:00:00Z", severity="minor"))
+    assert store.get("fan", "eda").severity == "major"
+    assert store.ingest(
+        AlarmHistoryData(alarm=alarm("fan", "2025-01-02T00:00:00+00:00", cleared=False))
+    )
+    assert store.get("fan", "eda").cleared is False
+    assert not store.ingest(AlarmHistoryData())
+    with pytest.raises(ValueError):
+        store.ingest(AlarmData(severity="minor"))
+
+
+def test_query(store):
+    assert names(store.query(severity="major")) == ["bgp", "fan"]
+    assert names(store.query(severity=("major", "critical"), cleared=False)) == [
+        "bgp",
+        "link",
+        "link",
+    ]
+    assert names(store.query(namespace="other")) == ["link"]
+    assert store.query(severity="warning") == []
+    assert len(store.query()) == 5
+    with pytest.raises(ValueError):
+        store.query(description="x")
+
+    # indexes follow updates and removals
+    store.ingest(alarm("fan", "2025-02-01T00:00:00Z", severity="minor"))
+    assert names(store.query(severity="major")) == ["bgp"]
+    assert store.remove("bgp", "eda").name == "bgp"
+    assert store.remove("bgp", "eda") is None
+    assert store.query(severity="major") == []
+
+
+def test_root_causes(store):
+    assert names(store.children("link", "eda")) == ["bgp"]
+    assert store.children("link", "other") == []
+    assert [a.namespace for a in store.roots_of("route", "eda")] == ["eda"]
+    assert names(store.roots_of("route", "eda")) == ["link"]
+    assert names(store.roots_of("fan", "eda")) == ["fan"]
+    assert names(store.root_causes(cleared=False)) == ["link", "link"]
+
+    # once the parent is gone the child becomes a root cause
+    store.remove("link", "eda")
+    store.remove("link", "other")
+    assert names(store.root_causes(cleared=False)) == ["bgp"]
+    assert names(store.roots_of("route", "eda")) == ["bgp"]
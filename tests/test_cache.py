@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.cache import ValidationCache, digest
+
+BODY = json.dumps(
+    {
+        "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+        "kind": "Interface",
+        "metadata": {"name": "a", "namespace": "eda", "labels": {"role": "leaf"}},
+        "spec": {"members": [{"node": "leaf1", "interface": "ethernet-1-1"}]},
+    }
+).encode()
+
+
+def test_validation_cache():
+    cache = ValidationCache(maxsize=2)
+    first = cache.validate_json(Interface, BODY)
+    assert cache.validate_json(Interface, bytearray(BODY)) is first
+    assert type(first) is Interface
+    copy = cache.validate_json(Interface, BODY, copy=True)
+    assert copy == first and copy is not first
+    assert copy.spec.members[0] is not first.spec.members[0]
+
+    other = BODY.replace(b'"a"', b'"b"')
+    cache.validate_json(Interface, other)
+    cache.validate_json(Interface, other.replace(b'"b"', b'"c"'))
+    assert cache.info() == (2, 3, 1, 2, 2)
+    assert cache.validate_json(Interface, BODY) is not first
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+    assert digest(BODY.decode()) == digest(BODY)
+    with pytest.raises(ValueError):
+        ValidationCache(maxsize=0)
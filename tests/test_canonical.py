@@ -0,0 +1,63 @@
+import json
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import InterfaceState
+from pydantic_eda.canonical import canonical_dict, canonical_json, fingerprint
+from pydantic_eda.core.v25_8_1 import models as core
+
+
+def test_canonical_form(make_interface):
+    interface = make_interface(
+        "a", labels={"z": "1", "a": "2"}, enabled=True, description="é"
+    )
+    data = canonical_json(interface)
+    assert (
+        data
+        == json.dumps(
+            json.loads(data), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+    )
+    parsed = json.loads(data)
+    # defaults are dropped, whether they were spelled out or not
+    assert "enabled" not in parsed["spec"]
+    assert parsed["spec"]["description"] == "é"
+    assert list(parsed["metadata"]["labels"]) == ["a", "z"]
+    assert canonical_dict(interface) == parsed
+
+
+def test_fingerprint_ignores_set_defaults_and_order(make_interface):
+    a = make_interface("a", labels={"x": "1", "y": "2"})
+    b = make_interface("a", labels={"y": "2", "x": "1"}, enabled=True, lldp=True)
+    assert fingerprint(a) == fingerprint(b)
+    assert fingerprint(a).startswith("1:")
+    assert fingerprint(a) != fingerprint(make_interface("a", mtu=1500))
+
+
+def test_status_is_omitted():
+    def state(status):
+        return InterfaceState.model_validate(
+            {
+                "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+                "kind": "InterfaceState",
+                "metadata": {"name": "a", "namespace": "eda"},
+                "spec": {"members": []},
+                "status": status,
+            }
+        )
+
+    assert fingerprint(state({"operationalState": "up"})) == fingerprint(
+        state({"operationalState": "down"})
+    )
+
+
+def test_dicts_and_floats_match_json_dumps():
+    for value in (0.1, 1e-7, 0.00001, 1e22, 123456.789):
+        op = core.K8SPatchOp(
+            op="add", path="/a", value={"f": value, "b": {"z": 1, "a": None}}
+        )
+        data = canonical_json(op)
+        assert (
+            data
+            == json.dumps(
+                canonical_dict(op), sort_keys=True, separators=(",", ":")
+            ).encode()
+        )
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from pydantic_eda.apps.core.v1.models import ClusterRoleSpecResourceRule
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface, InterfaceState
+from pydantic_eda.codecs import (
+    Codec,
+    CodecError,
+    JsonCodec,
+    MsgpackCodec,
+    decoder,
+    encoder,
+    schema_fingerprint,
+)
+from pydantic_eda.core.v25_8_1 import models as core
+
+CODECS = [JsonCodec, MsgpackCodec]
+
+
+def dump(instance):
+    return instance.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+
+@pytest.fixture
+def resources(make_interface):
+    return [
+        make_interface("a"),
+        make_interface("b", labels={"role": "leaf"}, description="x", mtu=9000),
+        InterfaceState.model_validate(
+            {
+                "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+                "kind": "InterfaceState",
+                "metadata": {"name": "a", "namespace": "eda"},
+                "spec": {"members": []},
+                "status": {"operationalState": "up", "members": [{"node": "leaf1"}]},
+            }
+        ),
+        core.StoreAppVersionMetadata.model_validate(
+            {"publishedTime": "2025-01-02T03:04:05+01:00", "semVer": "1.2.3"}
+        ),
+    ]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip(codec, resources):
+    codec = codec()
+    for resource in resources:
+        decoded = codec.decode(type(resource), codec.encode(resource))
+        assert decoded == resource
+        # defaults stay unset
+        assert dump(decoded) == dump(resource)
+        assert decoded.model_fields_set == resource.model_fields_set
+
+
+def test_positional_layout(make_interface):
+    interface = make_interface("a")
+    data = encoder(Interface)(interface)
+    # set fields only, keyed by position
+    assert list(data) == ["0", "1", "2", "3"]
+    assert data["0"] == "interfaces.eda.nokia.com/v1alpha1"
+    assert data["2"] == {"2": "a", "3": "eda"}
+    assert decoder(Interface)(data) == interface
+
+
+def test_root_model_fields():
+    rule = ClusterRoleSpecResourceRule.model_validate(
+        {"apiGroups": ["core.eda.nokia.com"], "resources": ["*"], "permissions": "read"}
+    )
+    data = encoder(type(rule))(rule)
+    assert ["core.eda.nokia.com"] in data.values()
+    for codec in CODECS:
+        codec = codec()
+        assert codec.decode(type(rule), codec.encode(rule)) == rule
+
+
+def test_schema_mismatch(make_interface):
+    codec = JsonCodec()
+    payload = codec.encode(make_interface("a"))
+    with pytest.raises(CodecError):
+        codec.decode(InterfaceState, payload)
+    with pytest.raises(CodecError):
+        codec.decode(Interface, b"not json")
+    fingerprint, data = json.loads(payload)
+    assert bytes.fromhex(fingerprint) == schema_fingerprint(Interface)
+    with pytest.raises(CodecError):
+        decoder(Interface)(data | {"0": "other/v1"})
+    with pytest.raises(CodecError):
+        decoder(Interface)([])
+    with pytest.raises(CodecError, match="malformed"):
+        codec.decode(Interface, json.dumps([fingerprint, []]).encode())
+
+
+def test_fingerprints():
+    assert schema_fingerprint(Interface) != schema_fingerprint(InterfaceState)
+    assert len(schema_fingerprint(Interface)) == 8
+
+
+def test_codec_is_abstract():
+    with pytest.raises(TypeError):
+        Codec()
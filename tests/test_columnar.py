@@ -0,0 +1,93 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import (
+    Interface,
+    InterfaceState,
+    InterfaceStatus,
+)
+from pydantic_eda.columnar import INT_MISSING, compile_column, to_columns
+
+
+@pytest.fixture
+def interfaces(make_interface):
+    a = make_interface("a", "leaf1", labels={"role": "leaf"}, mtu=9000, type="lag")
+    a.status = InterfaceStatus(lastChange="2025-01-02T03:04:05+01:00")
+    b = make_interface("b", "leaf2", enabled=False)
+    return [a, b]
+
+
+def test_columns(interfaces):
+    table = to_columns(
+        interfaces,
+        [
+            "metadata.name",
+            "spec.mtu",
+            "spec.enabled",
+            "spec.type",
+            "spec.members[0].node",
+            "spec.members[1].node",
+            "metadata.labels.role",
+            "status.lastChange",
+        ],
+    )
+    assert len(table) == 2
+    assert table["spec.mtu"].tolist() == [9000, INT_MISSING]
+    assert table["spec.mtu"].dtype == np.int64
+    # defaults are exported
+    assert table["spec.enabled"].tolist() == [1, 0]
+    # Literal codes are the index of the value among the Literal values
+    assert table["spec.type"].tolist() == [0, 1]
+    assert table.decode("spec.type") == ["lag", "interface"]
+    assert table.decode("spec.members[0].node") == ["leaf1", "leaf2"]
+    assert table.decode("spec.members[1].node") == [None, None]
+    assert table.decode("metadata.labels.role") == ["leaf", None]
+    assert table["status.lastChange"][0] == np.datetime64("2025-01-02T02:04:05")
+    assert np.isnat(table["status.lastChange"][1])
+
+    structured = table.to_structured()
+    assert structured["spec.mtu"].tolist() == [9000, INT_MISSING]
+    assert len(to_columns([], ["spec.mtu"])) == 0
+
+
+def test_untyped_paths():
+    def state(status):
+        return InterfaceState.model_validate(
+            {
+                "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+                "kind": "InterfaceState",
+                "metadata": {"name": "a", "namespace": "eda"},
+                "spec": {"members": []},
+                "status": status,
+            }
+        )
+
+    states = [
+        state({"operationalState": "up", "speed": 100, "since": "2025-01-02"}),
+        state({"members": [{"node": "leaf1"}]}),
+    ]
+    table = to_columns(
+        states,
+        [
+            "status.operationalState",
+            "status.speed",
+            "status.since",
+            "status.members[0].node",
+        ],
+        dtypes={"status.speed": int, "status.since": datetime.date},
+    )
+    assert table.decode("status.operationalState") == ["up", None]
+    assert table["status.speed"].tolist() == [100, INT_MISSING]
+    assert table["status.since"].tolist() == [datetime.date(2025, 1, 2), None]
+    assert table.decode("status.members[0].node") == [None, "leaf1"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["spec", "spec.members", "spec.members[*].node", "spec.nope", "spec.mtu.x"],
+)
+def test_errors(path):
+    with pytest.raises(ValueError):
+        compile_column(Interface, path)
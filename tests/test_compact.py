@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import K8SPatchOp
+from pydantic_eda.compact import CompactModel, FrozenDict, compact, to_compact
+from pydantic_eda.core.v25_8_1 import models as core
+
+
+def test_round_trip(make_interface):
+    interface = make_interface("a", labels={"role": "leaf"}, mtu=9000)
+    small = to_compact(interface)
+    assert isinstance(small, CompactModel)
+    assert small.metadata.labels == {"role": "leaf"}
+    assert isinstance(small.spec.members, tuple)
+    assert small.spec.members[0].node == "leaf1"
+    back = small.to_model()
+    assert back == interface
+    assert back.model_dump(exclude_unset=True) == interface.model_dump(
+        exclude_unset=True
+    )
+    assert back.spec.model_fields_set == interface.spec.model_fields_set
+
+
+def test_read_only(make_interface):
+    small = to_compact(make_interface("a", labels={"role": "leaf"}))
+    with pytest.raises(AttributeError):
+        small.spec = None
+    with pytest.raises(TypeError):
+        small.metadata.labels["role"] = "spine"
+    assert hash(small) == hash(to_compact(make_interface("a", labels={"role": "leaf"})))
+
+
+def test_hash_ignores_dict_order(make_interface):
+    assert hash(FrozenDict(a=1, b=2)) == hash(FrozenDict(b=2, a=1))
+    c = to_compact(make_interface("a", labels={"role": "leaf", "rack": "1"}))
+    d = to_compact(make_interface("a", labels={"rack": "1", "role": "leaf"}))
+    assert c == d
+    assert len({c, d}) == 1
+
+
+def test_pickle(make_interface):
+    assert pickle.loads(pickle.dumps(FrozenDict(a=1))) == {"a": 1}
+    interface = make_interface("a", labels={"role": "leaf"}, mtu=9000)
+    small = to_compact(interface)
+    loaded = pickle.loads(pickle.dumps(small))
+    assert loaded == small
+    assert type(loaded) is type(small)
+    assert type(loaded.spec) is type(small.spec)
+    assert loaded.to_model() == interface
+
+
+def test_variants_are_named_after_their_model():
+    ops = [
+        to_compact(model(op="add", path="/a"))
+        for model in (core.K8SPatchOp, K8SPatchOp)
+    ]
+    assert type(ops[0]).__qualname__ != type(ops[1]).__qualname__
+    assert repr(ops[0]).startswith("pydantic_eda.core.v25_8_1.models.K8SPatchOp(")
+
+
+def test_variant_is_cached(make_interface):
+    interface = make_interface("a")
+    assert compact(type(interface)) is type(to_compact(interface))
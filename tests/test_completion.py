@@ -0,0 +1,90 @@
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.completion import CompletionIndex, PrefixTrie, field_paths
+from pydantic_eda.core.v25_8_1.models import (
+    GetLabelCompletionRequest,
+    GroupVersionKind,
+)
+from pydantic_eda.store import ResourceStore
+
+GVK = GroupVersionKind(group="interfaces.eda.nokia.com", kind="Interface")
+
+
+def test_trie():
+    trie = PrefixTrie()
+    for word in ["role", "rack", "role", "region", "r"]:
+        trie.add(word)
+    assert len(trie) == 4
+    assert trie.complete("r") == ["r", "rack", "region", "role"]
+    assert trie.complete("re") == ["region"]
+    assert trie.complete("r", limit=2) == ["r", "rack"]
+    assert trie.complete("x") == []
+
+    # words are reference counted
+    trie.discard("role")
+    assert "role" in trie
+    trie.discard("role")
+    trie.discard("role")
+    trie.discard("r")
+    assert "role" not in trie
+    assert trie.complete("") == ["rack", "region"]
+
+
+def test_field_paths():
+    paths = field_paths(Interface)
+    assert "spec.members" in paths
+    assert "spec.members[*]" in paths
+    assert "spec.members[*].node" in paths
+    assert "metadata.labels" in paths
+
+
+def labels(index, value, namespace=None):
+    request = GetLabelCompletionRequest(gvk=GVK, value=value, namespace=namespace)
+    return index.complete_labels(request).results
+
+
+@pytest.fixture
+def tracked(make_interface):
+    store = ResourceStore(Interface)
+    index = CompletionIndex()
+    index.track(store)
+    store.replace(
+        [
+            make_interface("a", labels={"role": "leaf", "rack": "1"}),
+            make_interface("b", labels={"role": "leaf"}, namespace="x"),
+            make_interface("c", labels={"role": "spine"}),
+        ]
+    )
+    return store, index
+
+
+def test_labels(tracked, make_interface):
+    store, index = tracked
+    assert labels(index, "r") == ["rack", "role"]
+    assert labels(index, "role=") == ["role=leaf", "role=spine"]
+    assert labels(index, "role=l", namespace="x") == ["role=leaf"]
+    assert labels(index, "r", namespace="x") == ["role"]
+
+    # completions follow the store
+    store.add(make_interface("a", labels={"role": "spine"}))
+    assert labels(index, "r") == ["role"]
+    store.delete("c", "eda")
+    assert labels(index, "role=") == ["role=leaf", "role=spine"]
+    store.delete("a", "eda")
+    assert labels(index, "role=") == ["role=leaf"]
+    assert labels(index, "r", namespace="eda") == []
+
+
+def test_query(tracked):
+    _, index = tracked
+    response = index.complete_query('metadata.name == "a" and spec.mem', GVK)
+    assert [c.completion for c in response.completions][:2] == [
+        "spec.members",
+        "spec.members[*]",
+    ]
+    assert {c.token for c in response.completions} == {"spec.mem"}
+    other = GroupVersionKind(group="x", kind="Y")
+    assert index.complete_query("spec", other).completions == []
+    with pytest.raises(ValueError):
+        index.add_model(GroupVersionKind)
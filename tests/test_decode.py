@@ -0,0 +1,32 @@
+import json
+import mmap
+
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.decode import as_json_input, load, validate_buffer
+
+BODY = json.dumps(
+    {
+        "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+        "kind": "Interface",
+        "metadata": {"name": "a", "namespace": "eda", "labels": {"role": "leaf"}},
+        "spec": {"members": [{"node": "leaf1", "interface": "ethernet-1-1"}]},
+    }
+).encode()
+
+
+def test_buffers(tmp_path):
+    data = bytearray(BODY)
+    assert as_json_input(memoryview(data)) is data
+    assert as_json_input(memoryview(BODY)[:10]) == BODY[:10]
+    with pytest.raises(TypeError):
+        as_json_input(123)
+
+    expected = validate_buffer(Interface, BODY)
+    assert validate_buffer(Interface, memoryview(BODY)) == expected
+    path = tmp_path / "interface.json"
+    path.write_bytes(BODY)
+    assert load(Interface, path) == expected
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert validate_buffer(Interface, m) == expected
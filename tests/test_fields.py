@@ -0,0 +1,42 @@
+from pydantic_eda.apps.interfaces.v1alpha1.models import (
+    Interface,
+    InterfaceSpec,
+    InterfaceSpecMember,
+)
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.fields import construct, field_table, fields_by_key, fields_by_name
+
+
+def test_field_table():
+    assert [f.name for f in field_table(Interface)] == list(Interface.model_fields)
+    assert field_table(Interface) is field_table(Interface)
+
+    spec = fields_by_name(Interface)["spec"]
+    assert (spec.container, spec.model, spec.required) == (None, InterfaceSpec, True)
+    members = fields_by_name(InterfaceSpec)["members"]
+    assert (members.container, members.model) == ("list", InterfaceSpecMember)
+    mtu = fields_by_name(InterfaceSpec)["mtu"]
+    assert (mtu.annotation, mtu.model, mtu.required) == (int, None, False)
+    assert fields_by_name(InterfaceSpec)["enabled"].default is True
+    assert fields_by_name(InterfaceSpec)["type"].literals == (
+        "lag",
+        "interface",
+        "loopback",
+    )
+    labels = fields_by_name(fields_by_name(Interface)["metadata"].model)["labels"]
+    assert (labels.container, labels.model) == ("dict", None)
+
+
+def test_aliases():
+    assert fields_by_key(core.K8SPatchOp)["from"].name == "from_"
+    assert fields_by_name(core.K8SPatchOp)["from_"].key == "from"
+
+
+def test_construct(make_interface):
+    interface = make_interface("a")
+    values = dict(interface.__dict__)
+    copy = construct(Interface, values, {"apiVersion", "kind", "metadata", "spec"})
+    assert copy == interface
+    assert copy.model_dump(exclude_unset=True) == interface.model_dump(
+        exclude_unset=True
+    )
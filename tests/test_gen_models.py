@@ -0,0 +1,54 @@
+import pytest
+
+gen_models = pytest.importorskip("gen_models")
+
+FIELD = 'kind: Annotated[str, Field(pattern="^Interface$")]'
+
+
+def literalize(tmp_path, source):
+    path = tmp_path / "models.py"
+    path.write_text(source)
+    gen_models.Generator.literalize_patterns(None, path)
+    return path.read_text()
+
+
+def test_literalize_patterns(tmp_path):
+    source = (
+        "from __future__ import annotations\n\n"
+        "from typing import Annotated, Optional\n\n"
+        "from pydantic import Field\n\n\n"
+        "class Interface(BaseModel):\n"
+        '    apiVersion: Annotated[str, Field(pattern="^a\\\\.b\\\\.c/v1$")]\n'
+        f"    {FIELD}\n"
+        '    name: Annotated[str, Field(pattern="^[a-z]+$")]\n'
+    )
+    content = literalize(tmp_path, source)
+    assert "from typing import Annotated, Literal, Optional\n" in content
+    assert 'apiVersion: Literal["a.b.c/v1"]' in content
+    assert 'kind: Literal["Interface"]' in content
+    assert 'Field(pattern="^[a-z]+$")' in content
+
+
+def test_parenthesized_typing_import(tmp_path):
+    source = (
+        "from typing import (\n    Annotated,\n    Literal,\n    Optional,\n)\n\n"
+        f"{FIELD}\n"
+    )
+    content = literalize(tmp_path, source)
+    assert content.startswith("from typing import (\n    Annotated,\n")
+    assert 'kind: Literal["Interface"]' in content
+
+    source = "from typing import (\n    Annotated,\n    Optional,\n)\n\n" + FIELD
+    content = literalize(tmp_path, source)
+    assert content.startswith("from typing import Annotated, Literal, Optional\n")
+
+
+def test_missing_typing_import(tmp_path):
+    content = literalize(
+        tmp_path, "from __future__ import annotations\n\nimport re\n\n" + FIELD
+    )
+    assert content.startswith(
+        "from __future__ import annotations\n\nfrom typing import Literal\n"
+    )
+    content = literalize(tmp_path, "# generated\nimport re\n\n" + FIELD)
+    assert content.startswith("# generated\nfrom typing import Literal\nimport re\n")
@@ -0,0 +1,27 @@
+import json
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.intern import StringPool, intern_strings, validate_json_interned
+
+BODY = json.dumps(
+    {
+        "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+        "kind": "Interface",
+        "metadata": {"name": "a", "namespace": "eda", "labels": {"role": "leaf"}},
+        "spec": {"members": [{"node": "leaf1", "interface": "ethernet-1-1"}]},
+    }
+).encode()
+
+
+def test_string_pool():
+    pool = StringPool(max_length=8)
+    a = validate_json_interned(Interface, BODY, pool)
+    b = intern_strings(Interface.model_validate_json(BODY), pool)
+    assert a.metadata.namespace is b.metadata.namespace
+    assert a.spec.members[0].node is b.spec.members[0].node
+    assert next(iter(a.metadata.labels)) is next(iter(b.metadata.labels))
+    assert "eda" in pool
+    # longer strings are left alone
+    assert "interfaces.eda.nokia.com/v1alpha1" not in pool
+    pool.clear()
+    assert len(pool) == 0
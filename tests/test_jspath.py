@@ -0,0 +1,172 @@
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.jspath import (
+    JsPath,
+    JsPathError,
+    JsPathResolver,
+    Predicate,
+    Segment,
+    parse_jspath,
+)
+from pydantic_eda.store import ResourceStore
+
+ALARM_PATH = (
+    '.node{.name=="spine-1-1"}.srl{.version=="24.10.1"}'
+    '.interface{.name=="ethernet-1-1"}'
+)
+
+
+def test_parse():
+    path = parse_jspath(ALARM_PATH)
+    assert path == JsPath(
+        (
+            Segment("node", (Predicate("name", "==", "spine-1-1"),)),
+            Segment("srl", (Predicate("version", "==", "24.10.1"),)),
+            Segment("interface", (Predicate("name", "==", "ethernet-1-1"),)),
+        )
+    )
+    assert str(path) == ALARM_PATH
+    assert path.keys() == {
+        "node.name": "spine-1-1",
+        "srl.version": "24.10.1",
+        "interface.name": "ethernet-1-1",
+    }
+    assert parse_jspath(ALARM_PATH) is path
+
+
+def test_parse_predicates():
+    (segment,) = parse_jspath(
+        '.x{.a=="q\\"uote" and .b!=-3 && .c==1.5, .d==true}'
+    ).segments
+    assert segment.predicates == (
+        Predicate("a", "==", 'q"uote'),
+        Predicate("b", "!=", -3),
+        Predicate("c", "==", 1.5),
+        Predicate("d", "==", True),
+    )
+    assert parse_jspath(str(parse_jspath(str(segment)))).segments == (segment,)
+    assert [s.name for s in parse_jspath(".namespace.node.normal.v1").segments] == [
+        "namespace",
+        "node",
+        "normal",
+        "v1",
+    ]
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["node", ".node{", '.node{.name=="a"', ".node{.name}", '.a{.b=="c" or .d=="e"}'],
+)
+def test_parse_errors(path):
+    with pytest.raises(JsPathError):
+        parse_jspath(path)
+
+
+@pytest.fixture
+def resolver(make_interface):
+    store = ResourceStore(
+        Interface,
+        indexes={"name": "metadata.name", "node": "spec.members[*].node"},
+    )
+    store.replace(
+        [
+            make_interface("ethernet-1-1", "spine-1-1"),
+            make_interface("ethernet-1-2", "spine-1-1", enabled=False),
+            make_interface("ethernet-1-1", "spine-1-2", namespace="other"),
+        ]
+    )
+    resolver = JsPathResolver(max_plans=2)
+    resolver.bind("interface", store, {"name": "name", "node.name": "node"})
+    return resolver
+
+
+def located(resources):
+    return sorted((r.metadata.namespace, r.metadata.name) for r in resources)
+
+
+def test_resolve(resolver):
+    assert located(resolver.resolve('.node{.name=="spine-1-1"}.interface')) == [
+        ("eda", "ethernet-1-1"),
+        ("eda", "ethernet-1-2"),
+    ]
+    assert located(resolver.resolve('.interface{.name=="ethernet-1-1"}', "other")) == [
+        ("other", "ethernet-1-1")
+    ]
+    # trailing unbound segments resolve against the last bound one
+    path = '.node{.name=="spine-1-1"}.interface{.name!="ethernet-1-1"}.subinterface'
+    assert located(resolver.resolve(path)) == [("eda", "ethernet-1-2")]
+    # no bound equality
+    assert resolver.resolve(".interface") == []
+    assert resolver.resolve('.node{.name=="spine-1-1"}') == []
+
+
+def test_unbound_predicates(resolver):
+    path = '.node{.name=="spine-1-1"}.interface{.spec.enabled==false}'
+    assert located(resolver.resolve(path)) == [("eda", "ethernet-1-2")]
+    with pytest.raises(JsPathError):
+        resolver.resolve('.node{.name=="spine-1-1"}.interface{.speed=="10G"}')
+    with pytest.raises(JsPathError):
+        resolver.resolve(ALARM_PATH)
+
+
+def test_ignored_predicates(resolver):
+    store = resolver._bindings["interface"].store
+    keys = {"name": "name", "node.name": "node"}
+    for ignore in ({"srl"}, {"srl.version"}):
+        resolver.bind("interface", store, keys, ignore=ignore)
+        assert located(resolver.resolve(ALARM_PATH)) == [("eda", "ethernet-1-1")]
+    resolver.bind("interface", store, keys, ignore={"speed"})
+    path = '.node{.name=="spine-1-1"}.interface{.speed=="10G"}'
+    assert len(resolver.resolve(path)) == 2
+
+
+def test_plans_are_bounded(resolver):
+    for i in range(5):
+        resolver.resolve(f'.interface{{.name=="ethernet-1-{i}"}}')
+    assert len(resolver._plans) == 2
+
+
+def test_correlate(resolver):
+    class Alarm:
+        def __init__(self, jsPath, namespace=None):
+            self.jsPath = jsPath
+            self.namespace = namespace
+
+    result = resolver.correlate(
+        [
+            Alarm('.node{.name=="spine-1-1"}.interface{.name=="ethernet-1-2"}', "eda"),
+            Alarm(None),
+            Alarm('.node{.name=="spine-1-2"}.interface'),
+            Alarm(ALARM_PATH, "eda"),
+            Alarm(".node{"),
+        ]
+    )
+    assert {i: located(r) for i, r in result.items()} == {
+        0: [("eda", "ethernet-1-2")],
+        2: [("other", "ethernet-1-1")],
+    }
+
+
+def test_correlate_records_errors(resolver):
+    class Alarm:
+        def __init__(self, jsPath):
+            self.jsPath = jsPath
+            self.namespace = "eda"
+
+    alarms = [Alarm(ALARM_PATH), Alarm(".node{"), Alarm(ALARM_PATH)]
+    errors = {}
+    assert resolver.correlate(alarms, errors=errors) == {}
+    assert sorted(errors) == [0, 1, 2]
+    assert all(isinstance(e, JsPathError) for e in errors.values())
+
+    store = resolver._bindings["interface"].store
+    keys = {"name": "name", "node.name": "node"}
+    resolver.bind("interface", store, keys, ignore={"srl"})
+    errors = {}
+    result = resolver.correlate(alarms, errors=errors)
+    assert {i: located(r) for i, r in result.items()} == {
+        0: [("eda", "ethernet-1-1")],
+        2: [("eda", "ethernet-1-1")],
+    }
+    assert list(errors) == [1]
@@ -0,0 +1,172 @@
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import K8SPatchOp
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.patch import (
+    PatchError,
+    apply_merge_patch,
+    apply_patch,
+    diff,
+    escape,
+    parse_pointer,
+    unescape,
+)
+
+
+def dump(instance):
+    return instance.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def test_pointers():
+    assert escape("a/b~c") == "a~1b~0c"
+    assert unescape(escape("a/b~c")) == "a/b~c"
+    assert parse_pointer("") == []
+    assert parse_pointer("/metadata/labels/eda.nokia.com~1role") == [
+        "metadata",
+        "labels",
+        "eda.nokia.com/role",
+    ]
+    with pytest.raises(PatchError):
+        parse_pointer("metadata")
+
+
+def test_diff_of_equal_instances(make_interface):
+    assert diff(make_interface("a"), make_interface("a")) == []
+
+
+def test_diff_replaces_enclosing_objects(make_interface):
+    ops = diff(make_interface("a"), make_interface("a", description="x"))
+    assert all(isinstance(op, K8SPatchOp) for op in ops)
+    assert [(op.op, op.path) for op in ops] == [("replace", "/spec")]
+    assert ops[0].value["description"] == "x"
+    ops = diff(make_interface("a", description="x"), make_interface("a"))
+    assert [(op.op, op.path) for op in ops] == [("remove", "/spec/description")]
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"spec": {"description": "uplink"}},
+        {"spec": {"enabled": False, "mtu": 9000}},
+        {"labels": {"role": "leaf", "eda.nokia.com/rack": "r1"}},
+        {"spec": {"description": None}},
+        {
+            "spec": {
+                "members": [
+                    {"node": "leaf1", "interface": "ethernet-1-1"},
+                    {"node": "leaf2", "interface": "ethernet-1-2"},
+                ]
+            }
+        },
+        {"spec": {"members": [{"node": "leaf2", "interface": "ethernet-1-9"}]}},
+        {"spec": {"ethernet": {"fec": "rs528", "stormControl": {"enabled": True}}}},
+    ],
+)
+def test_diff_apply_patch_round_trip(make_interface, changes):
+    old = make_interface("a", labels={"role": "spine"}, description="old")
+    data = dump(old)
+    if "labels" in changes:
+        data["metadata"]["labels"] = changes["labels"]
+    for key, value in changes.get("spec", {}).items():
+        if value is None:
+            data["spec"].pop(key, None)
+        else:
+            data["spec"][key] = value
+    new = type(old).model_validate(data)
+
+    ops = diff(old, new)
+    assert ops
+    assert all(isinstance(op, K8SPatchOp) for op in ops)
+    patched = apply_patch(old, ops)
+    assert dump(patched) == dump(new)
+    # the original instance is left untouched
+    assert dump(old) != dump(new)
+
+
+def test_diff_removes_list_items_by_name():
+    old = core.NamespaceGetResponse(
+        namespaces=[{"name": n, "description": n.upper()} for n in ("a", "b", "c")]
+    )
+    new = core.NamespaceGetResponse(
+        namespaces=[{"name": n, "description": n.upper()} for n in ("a", "c")]
+    )
+    ops = diff(old, new)
+    assert [(op.op, op.path) for op in ops] == [("remove", "/namespaces/1")]
+    assert dump(apply_patch(old, ops)) == dump(new)
+
+
+def test_apply_patch_ops(make_interface):
+    interface = make_interface("a", description="x")
+    patched = apply_patch(
+        interface,
+        [
+            {"op": "test", "path": "/spec/description", "value": "x"},
+            {"op": "add", "path": "/metadata/labels", "value": {"role": "leaf"}},
+            {"op": "add", "path": "/spec/mtu", "value": 1500},
+            {"op": "replace", "path": "/spec/mtu", "value": 9000},
+            {
+                "op": "add",
+                "path": "/spec/members/-",
+                "value": {"node": "leaf2", "interface": "ethernet-1-2"},
+            },
+            {"op": "move", "from": "/spec/description", "path": "/metadata/labels/d"},
+            {"op": "remove", "path": "/spec/members/0"},
+        ],
+    )
+    assert patched.metadata.labels == {"role": "leaf", "d": "x"}
+    assert patched.spec.mtu == 9000
+    assert patched.spec.description is None
+    assert [m.node for m in patched.spec.members] == ["leaf2"]
+    assert interface.spec.description == "x"
+
+
+def test_apply_patch_shares_untouched_models(make_interface):
+    interface = make_interface("a", mtu=9000)
+    patched = apply_patch(
+        interface, [{"op": "replace", "path": "/spec/mtu", "value": 1500}]
+    )
+    assert patched.metadata is interface.metadata
+    assert patched.spec is not interface.spec
+    assert patched.spec.members[0] is interface.spec.members[0]
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        {"op": "test", "path": "/spec/enabled", "value": False},
+        {"op": "replace", "path": "/spec/nope", "value": 1},
+        {"op": "replace", "path": "/spec/mtu", "value": "not a number"},
+        {"op": "remove", "path": "/spec/members/5"},
+        {"op": "add", "path": "/spec/members/01", "value": {}},
+        {"op": "remove", "path": ""},
+        {"op": "frobnicate", "path": "/spec/mtu"},
+    ],
+)
+def test_apply_patch_errors(make_interface, op):
+    with pytest.raises(ValueError):
+        apply_patch(make_interface("a"), [op])
+
+
+def test_pointers_address_keys_only():
+    op = core.K8SPatchOp.model_validate({"op": "add", "path": "/spec", "from": "/a"})
+    patched = apply_patch(op, [{"op": "replace", "path": "/from", "value": "/b"}])
+    assert patched.from_ == "/b"
+    with pytest.raises(PatchError):
+        apply_patch(op, [{"op": "replace", "path": "/from_", "value": "/b"}])
+
+
+def test_apply_merge_patch(make_interface):
+    interface = make_interface("a", labels={"role": "spine", "rack": "r1"}, mtu=9000)
+    patched = apply_merge_patch(
+        interface,
+        {
+            "metadata": {"labels": {"rack": None, "pod": "p1"}},
+            "spec": {"mtu": None, "description": "uplink"},
+        },
+    )
+    assert patched.metadata.labels == {"role": "spine", "pod": "p1"}
+    assert patched.spec.mtu is None
+    assert patched.spec.description == "uplink"
+    assert patched.spec.members[0] is interface.spec.members[0]
+    with pytest.raises(PatchError):
+        apply_merge_patch(interface, {"spec": {"nope": 1}})
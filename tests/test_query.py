@@ -0,0 +1,72 @@
+import datetime
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.query import decode_rows, row_decoder, schema_hash
+
+JSON_SCHEMA = {
+    "name": {"type": "string"},
+    "mtu": {"type": ["integer", "null"]},
+    "since": {"type": "string", "format": "date-time"},
+    "state": {"enum": ["up", "down"]},
+    "tags": {"type": "array", "items": {"type": "string"}},
+}
+
+
+def test_records():
+    decoder = row_decoder(JSON_SCHEMA)
+    assert decoder is row_decoder(dict(reversed(JSON_SCHEMA.items())))
+    assert decoder.hash == schema_hash(JSON_SCHEMA)
+    assert decoder.columns == tuple(JSON_SCHEMA)
+
+    (row,) = decoder.records(
+        [
+            {
+                "name": "a",
+                "mtu": None,
+                "since": "2025-01-02T03:04:05Z",
+                "state": "up",
+                "tags": ["x"],
+            }
+        ]
+    )
+    assert row["since"] == datetime.datetime(
+        2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+    )
+    assert row["mtu"] is None
+    assert decoder.records(None) == []
+    assert decoder.columns_of([{"name": "a"}, {"mtu": 1}]) == {
+        "name": ["a", None],
+        "mtu": [None, 1],
+        "since": [None, None],
+        "state": [None, None],
+        "tags": [None, None],
+    }
+    with pytest.raises(ValidationError):
+        decoder.records([{"state": "unknown"}])
+
+
+def test_responses():
+    body = {
+        "jsonSchema": JSON_SCHEMA,
+        "data": [{"name": "a", "since": "2025-01-02T03:04:05Z"}],
+    }
+    response = core.QueryResponse.model_validate(body)
+    (row,) = decode_rows(response)
+    assert isinstance(row["since"], datetime.datetime)
+
+    typed = row_decoder(JSON_SCHEMA).validate_json(json.dumps(body))
+    assert isinstance(typed, core.QueryResponse)
+    assert typed.data == [row]
+
+    # without a JSON schema, the field list of the query schema is used
+    untyped = core.QueryResponse.model_validate(
+        {
+            "schema": {"fields": [{"name": "name"}]},
+            "data": [{"name": "a", "other": 1}],
+        }
+    )
+    assert decode_rows(untyped) == [{"name": "a"}]
@@ -0,0 +1,190 @@
+import pytest
+
+from pydantic_eda.core.v25_8_1.models import (
+    AccessQuery,
+    AuthRole,
+    CheckAccessRequest,
+    TableRule,
+)
+from pydantic_eda.rbac import AccessEvaluator, plural
+
+INTERFACE = {
+    "group": "interfaces.eda.nokia.com",
+    "version": "v1alpha1",
+    "kind": "Interface",
+}
+
+
+def role(name, namespace=None, resources=(), tables=(), urls=()):
+    return AuthRole(
+        name=name,
+        namespace=namespace,
+        description="",
+        resourceRules=[
+            {"apiGroups": groups, "resources": names, "permissions": permissions}
+            for groups, names, permissions in resources
+        ],
+        # the generated pattern of table paths rejects valid paths
+        tableRules=[
+            TableRule.model_construct(path=path, permissions=permissions)
+            for path, permissions in tables
+        ],
+        urlRules=[
+            {"path": path, "permissions": permissions} for path, permissions in urls
+        ],
+    )
+
+
+@pytest.fixture
+def evaluator():
+    return AccessEvaluator(
+        [
+            role(
+                "viewer",
+                resources=[(["*"], ["*"], "read")],
+                tables=[(".namespace.node.**", "read")],
+                urls=[("/core/alarms/*", "read")],
+            ),
+            role(
+                "netops",
+                namespace="eda",
+                resources=[
+                    (["interfaces.eda.nokia.com/*"], ["interfaces"], "readWrite")
+                ],
+                tables=[(".namespace.node.srl.interface", "readWrite")],
+                urls=[("/apps/**", "readWrite")],
+            ),
+        ]
+    )
+
+
+def test_plural():
+    assert [plural(k) for k in ("Interface", "Policy", "Gateway", "Class", "Box")] == [
+        "interfaces",
+        "policies",
+        "gateways",
+        "classes",
+        "boxes",
+    ]
+
+
+def test_deny_by_default():
+    evaluator = AccessEvaluator()
+    assert not evaluator.check(AccessQuery(type="url", path="/core/alarms/v1"))
+    assert not evaluator.check(AccessQuery(type="gvk", gvk=INTERFACE))
+
+
+def test_resource_wildcards(evaluator):
+    query = AccessQuery(type="gvk", gvk=INTERFACE, namespace="eda")
+    assert evaluator.check(query)
+    assert evaluator.check(query.model_copy(update={"permissions": "readWrite"}))
+    # the namespaced role doesn't apply to other namespaces
+    other = query.model_copy(update={"namespace": "other", "permissions": "readWrite"})
+    assert not evaluator.check(other)
+    assert evaluator.check(other.model_copy(update={"permissions": "read"}))
+    gvr = {"group": "x.eda.nokia.com", "version": "v1", "resource": "ys"}
+    assert evaluator.check(AccessQuery(type="gvr", gvr=gvr))
+    assert not evaluator.check(
+        AccessQuery(type="gvr", gvr=gvr, permissions="readWrite")
+    )
+
+
+def test_plurals_override():
+    evaluator = AccessEvaluator(
+        [role("r", resources=[(["g"], ["indices"], "read")])],
+        plurals={"Index": "indices"},
+    )
+    assert evaluator.check(
+        AccessQuery(type="gvk", gvk={"group": "g", "version": "v1", "kind": "Index"})
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "namespace", "permissions", "allowed"),
+    [
+        (".namespace.node.srl.interface", None, "read", True),
+        # ** matches one or more segments
+        (".namespace.node", None, "read", False),
+        (".namespace.alarms", None, "read", False),
+        (".namespace.node.srl.interface", "eda", "readWrite", True),
+        (".namespace.node.srl.interface", None, "readWrite", False),
+        (".namespace.node.srl.interface.subinterface", "eda", "readWrite", False),
+    ],
+)
+def test_table_rules(evaluator, path, namespace, permissions, allowed):
+    query = AccessQuery(
+        type="table", path=path, namespace=namespace, permissions=permissions
+    )
+    assert evaluator.check(query) is allowed
+
+
+@pytest.mark.parametrize(
+    ("path", "namespace", "permissions", "allowed"),
+    [
+        ("/core/alarms/v1", None, "read", True),
+        # * matches a single segment
+        ("/core/alarms/v1/x", None, "read", False),
+        ("/core/alarms", None, "read", False),
+        ("/core/alarms/v1", None, "readWrite", False),
+        # ** matches one or more segments
+        ("/apps/a/b/c", "eda", "readWrite", True),
+        ("/apps/a/b/c", None, "readWrite", False),
+    ],
+)
+def test_url_rules(evaluator, path, namespace, permissions, allowed):
+    query = AccessQuery(
+        type="url", path=path, namespace=namespace, permissions=permissions
+    )
+    assert evaluator.check(query) is allowed
+
+
+def test_most_permissive_rule_wins():
+    evaluator = AccessEvaluator(
+        [
+            role("a", urls=[("/apps/**", "read"), ("/apps/x", "none")]),
+            role("b", urls=[("/apps/*", "readWrite")]),
+        ]
+    )
+    assert evaluator.check(
+        AccessQuery(type="url", path="/apps/x", permissions="readWrite")
+    )
+    assert evaluator.check(AccessQuery(type="url", path="/apps/x/y"))
+    assert not evaluator.check(
+        AccessQuery(type="url", path="/apps/x/y", permissions="readWrite")
+    )
+
+
+def test_cache_invalidated_on_role_changes(evaluator):
+    query = AccessQuery(
+        type="gvk", gvk=INTERFACE, namespace="eda", permissions="readWrite"
+    )
+    assert evaluator.check(query)
+    evaluator.remove_role("netops", "eda")
+    assert not evaluator.check(query)
+    evaluator.add_role(
+        role(
+            "netops",
+            namespace="eda",
+            resources=[(["interfaces.eda.nokia.com"], ["*"], "readWrite")],
+        )
+    )
+    assert evaluator.check(query)
+    evaluator.set_roles([])
+    assert not evaluator.check(query)
+
+
+def test_check_access(evaluator):
+    response = evaluator.check_access(
+        CheckAccessRequest(
+            {
+                "url": AccessQuery(type="url", path="/core/alarms/v1"),
+                "gvk": AccessQuery(type="gvk", gvk=INTERFACE, permissions="readWrite"),
+                "incomplete": AccessQuery(type="table"),
+            }
+        )
+    )
+    assert response.root["url"].access
+    assert not response.root["gvk"].access
+    assert response.root["gvk"].error is None
+    assert not response.root["incomplete"].access
+    assert response.root["incomplete"].error.code == 400
@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+
+from pydantic_eda.selector import (
+    Requirement,
+    SelectorError,
+    _compile,
+    compile_selector,
+)
+from pydantic_eda.store import ResourceStore
+
+LABELS = {
+    "role": ["leaf", "spine", "borderleaf"],
+    "rack": ["r1", "r2"],
+    "pod": ["p1"],
+}
+
+SELECTORS = [
+    "",
+    "role=leaf",
+    "role==leaf",
+    "role!=leaf",
+    "role in (leaf, spine)",
+    "role notin (leaf,spine)",
+    "rack",
+    "!rack",
+    "role=leaf,rack=r1",
+    "role=leaf, !pod",
+    "rack!=r1,pod",
+    "role notin (spine),!pod,rack in (r2)",
+]
+
+
+def test_parse():
+    (term,) = compile_selector("role in (leaf, spine), !pod, rack!=r1, x=").terms
+    assert term == (
+        Requirement("role", "in", frozenset({"leaf", "spine"})),
+        Requirement("pod", "!"),
+        Requirement("rack", "!=", frozenset({"r1"})),
+        Requirement("x", "=", frozenset({""})),
+    )
+    assert compile_selector("a = b").terms == (
+        (Requirement("a", "=", frozenset({"b"})),),
+    )
+    assert compile_selector(["a", "b"]) is compile_selector(("a", "b"))
+
+
+@pytest.mark.parametrize("selector", ["role=(leaf", "role in leaf", "=leaf", "a,,b"])
+def test_parse_errors(selector):
+    with pytest.raises(SelectorError):
+        compile_selector(selector)
+
+
+def test_matches():
+    selector = compile_selector(["role=leaf,rack=r1", "pod"])
+    assert selector.matches({"role": "leaf", "rack": "r1"})
+    assert selector.matches({"pod": "p2"})
+    assert not selector.matches({"role": "leaf"})
+    assert not selector.matches(None)
+    assert compile_selector("").matches({})
+    assert not compile_selector([]).matches({"role": "leaf"})
+
+
+@pytest.fixture(scope="module")
+def labelled(make_interface):
+    rng = random.Random(7)
+    interfaces = []
+    for i in range(300):
+        labels = {
+            key: rng.choice(values)
+            for key, values in LABELS.items()
+            if rng.random() < 0.7
+        }
+        interfaces.append(make_interface(f"i{i}", labels=labels))
+    return interfaces
+
+
+@pytest.mark.parametrize(
+    "selectors",
+    [[s] for s in SELECTORS] + [list(p) for p in itertools.combinations(SELECTORS, 2)],
+)
+def test_index_matches_scan(labelled, selectors):
+    store = ResourceStore(type(labelled[0]))
+    store.replace(labelled)
+    selector = compile_selector(selectors)
+    indexed = sorted(r.metadata.name for r in store.select(selector))
+    scanned = sorted(
+        r.metadata.name for r in labelled if selector.matches(r.metadata.labels)
+    )
+    assert indexed == scanned
+
+
+def test_compiled_selectors_are_cached_and_bounded():
+    assert compile_selector(["role=leaf"]) is compile_selector(("role=leaf",))
+    assert compile_selector("role=leaf") is compile_selector(["role=leaf"])
+    assert _compile.cache_info().maxsize is not None
@@ -0,0 +1,150 @@
+import os
+import struct
+
+import pytest
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface, InterfaceState
+from pydantic_eda.canonical import fingerprint
+from pydantic_eda.codecs import schema_fingerprint
+from pydantic_eda.snapshot import MAGIC, SnapshotStore, key_of
+
+RECORD = struct.Struct("<IHHH")
+
+
+def records(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    header, offset = data[:16], 16
+    result = []
+    while offset < len(data):
+        data_len, key_len, version_len, fp_len = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        fields = []
+        for length in (key_len, version_len, fp_len, data_len):
+            fields.append(data[offset : offset + length])
+            offset += length
+        result.append(tuple(fields))
+    return header, result
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "interfaces.snap"
+
+
+def test_put_get(path, make_interface):
+    a = make_interface("a", labels={"role": "leaf"})
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(a, version="1")
+        snapshot.put_many([make_interface("b"), make_interface("c", namespace="x")])
+        assert len(snapshot) == 3
+        assert "eda/a" in snapshot
+        assert snapshot.version("a", "eda") == "1"
+
+    with SnapshotStore(path, Interface) as snapshot:
+        assert sorted(snapshot.keys()) == ["eda/a", "eda/b", "x/c"]
+        stored = snapshot.get("a", "eda")
+        assert stored == a
+        assert stored.model_fields_set == a.model_fields_set
+        assert stored.spec.model_fields_set == a.spec.model_fields_set
+        assert snapshot.get("a") is None
+        assert sorted(r.metadata.name for r in snapshot) == ["a", "b", "c"]
+
+
+def test_file_format(path, make_interface):
+    a = make_interface("a")
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(a, version="7")
+        snapshot.delete("a", "eda")
+
+    header, (put, delete) = records(path)
+    assert header == MAGIC + schema_fingerprint(Interface)
+    assert MAGIC == b"EDASNAP2"
+    key, version, fp, data = put
+    assert (key, version, fp.decode()) == (b"eda/a", b"7", fingerprint(a))
+    assert data.startswith(b"{")
+    assert delete == (b"eda/a", b"", b"", b"")
+
+
+def test_unchanged_resources_are_not_written(path, make_interface):
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(make_interface("a"))
+        size = os.path.getsize(path)
+        snapshot.put(make_interface("a"))
+        assert os.path.getsize(path) == size
+        snapshot.put(make_interface("a", mtu=1500))
+        assert os.path.getsize(path) > size
+
+
+def test_staleness(path, make_interface):
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(make_interface("a"), version="1")
+        snapshot.put(make_interface("b"))
+        assert not snapshot.is_stale(make_interface("a", mtu=1500), version="1")
+        assert snapshot.is_stale(make_interface("a"), version="2")
+        assert not snapshot.is_stale(make_interface("b"))
+        assert snapshot.is_stale(make_interface("b", mtu=1500))
+        assert snapshot.is_stale(make_interface("c"))
+
+
+def test_crash_recovery(path, make_interface):
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put_many([make_interface("a"), make_interface("b")])
+        snapshot.delete("a", "eda")
+    complete = os.path.getsize(path)
+
+    # a record cut short by a crash, header first, then within the data
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(make_interface("c", mtu=1500))
+    with open(path, "r+b") as f:
+        f.truncate(complete + 5)
+
+    with SnapshotStore(path, Interface) as snapshot:
+        assert snapshot.keys() == ["eda/b"]
+        assert os.path.getsize(path) == complete
+        snapshot.put(make_interface("c", mtu=1500))
+
+    grown = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.truncate(grown - 3)
+    with SnapshotStore(path, Interface) as snapshot:
+        assert snapshot.keys() == ["eda/b"]
+        assert snapshot.get("b", "eda") == make_interface("b")
+
+
+def test_other_schema_or_format_is_discarded(path, make_interface):
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(make_interface("a"))
+    with SnapshotStore(path, InterfaceState) as snapshot:
+        assert len(snapshot) == 0
+
+    with SnapshotStore(path, Interface) as snapshot:
+        snapshot.put(make_interface("a"))
+    with open(path, "r+b") as f:
+        f.write(b"EDASNAP1")
+    with SnapshotStore(path, Interface) as snapshot:
+        assert len(snapshot) == 0
+
+
+def test_compact(path, make_interface):
+    with SnapshotStore(path, Interface) as snapshot:
+        for mtu in range(1500, 1510):
+            snapshot.put(make_interface("a", mtu=mtu), version=str(mtu))
+        snapshot.put(make_interface("b"))
+        snapshot.delete("b", "eda")
+        before = os.path.getsize(path)
+        snapshot.compact()
+        assert os.path.getsize(path) < before
+        assert snapshot.get("a", "eda").spec.mtu == 1509
+        snapshot.put(make_interface("c"))
+
+    _, stored = records(path)
+    assert [r[0] for r in stored] == [b"eda/a", b"eda/c"]
+    with SnapshotStore(path, Interface) as snapshot:
+        assert snapshot.version("a", "eda") == "1509"
+        assert sorted(snapshot.keys()) == ["eda/a", "eda/c"]
+
+
+def test_key_of():
+    assert key_of("a", "eda") == "eda/a"
+    assert key_of("a") == "a"
@@ -0,0 +1,88 @@
+import pytest
+
+from pydantic_eda.access import PathError
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.store import ResourceStore, key_of
+
+
+def names(resources):
+    return sorted(r.metadata.name for r in resources)
+
+
+@pytest.fixture
+def store(make_interface):
+    store = ResourceStore(
+        Interface,
+        indexes={
+            "node": "spec.members[*].node",
+            "mtu": lambda i: i.spec.mtu,
+        },
+    )
+    store.replace(
+        [
+            make_interface("a", "leaf1", labels={"role": "leaf"}, mtu=9000),
+            make_interface("b", "leaf2", labels={"role": "leaf"}),
+            make_interface("c", "spine1", labels={"role": "spine"}, mtu=9000),
+        ]
+    )
+    return store
+
+
+def test_lookups(store):
+    assert len(store) == 3
+    assert store.get("a", "eda").metadata.name == "a"
+    assert store.get("a") is None
+    assert ("eda", "b") in store
+    assert names(store.by_label("role", "leaf")) == ["a", "b"]
+    assert names(store.by_label("role")) == ["a", "b", "c"]
+    assert names(store.by_index("node", "spine1")) == ["c"]
+    assert names(store.by_index("mtu", 9000)) == ["a", "c"]
+    assert sorted(store.index_values("node")) == ["leaf1", "leaf2", "spine1"]
+    assert names(store.select("role=leaf")) == ["a", "b"]
+
+
+def test_find(store):
+    assert names(store.find([("mtu", "==", 9000), ("node", "!=", "spine1")])) == ["a"]
+    assert store.find([("mtu", "==", 9000)], namespace="other") == []
+    with pytest.raises(ValueError):
+        store.find([("node", "!=", "leaf1")])
+
+
+def test_indexes_follow_updates(store, make_interface):
+    store.add(make_interface("a", "leaf3", labels={"role": "spine"}))
+    assert names(store.by_label("role", "leaf")) == ["b"]
+    assert names(store.by_label("role", "spine")) == ["a", "c"]
+    assert store.by_index("node", "leaf1") == []
+    assert names(store.by_index("mtu", 9000)) == ["c"]
+
+    store.apply_event("DELETED", store.get("c", "eda"))
+    assert names(store.by_label("role", "spine")) == ["a"]
+    assert store.by_index("node", "spine1") == []
+
+    store.replace([make_interface("d")])
+    assert names(store.values()) == ["d"]
+    assert store.by_label("role") == []
+    assert store.delete("d", "eda") is not None
+    assert store.delete("d", "eda") is None
+
+
+def test_on_change(store, make_interface):
+    events = []
+    store.on_change(lambda event, key, old, new: events.append((event, key)))
+    assert sorted(events) == [("ADDED", ("eda", n)) for n in "abc"]
+    events.clear()
+
+    b = make_interface("b", "leaf9")
+    store.add(b)
+    store.add(b)
+    store.delete("a", "eda")
+    assert events == [("MODIFIED", key_of(b)), ("DELETED", ("eda", "a"))]
+
+
+def test_checks(store, make_interface):
+    with pytest.raises(TypeError):
+        store.add(make_interface("x").spec)
+    with pytest.raises(PathError):
+        ResourceStore(Interface, indexes={"node": "spec.nodes"})
+    with pytest.raises(ValueError):
+        store.apply_event("BOOKMARK", make_interface("x"))
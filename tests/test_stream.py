@@ -0,0 +1,64 @@
+import json
+
+from pydantic_eda.stream import QueryTable, record, replay
+
+SCHEMA = {
+    "jsonSchema": {"name": {"type": "string"}, "mtu": {"type": "integer"}},
+    "schema": {"fields": [{"name": "name"}, {"name": "mtu"}]},
+}
+
+FRAMES = [
+    {
+        **SCHEMA,
+        "op": [
+            {
+                "insert_or_modify": {
+                    "rows": [
+                        {"id": 1, "data": {"name": "a", "mtu": 1500}},
+                        {"id": 2, "data": {"name": "b", "mtu": 9000}},
+                    ]
+                }
+            }
+        ],
+    },
+    {
+        "op": [
+            {
+                "insert_or_modify": {
+                    "rows": [{"id": 1, "data": {"name": "a", "mtu": 1}}]
+                }
+            },
+            {"delete": {"ids": [2, 3]}},
+        ]
+    },
+]
+
+
+def test_apply():
+    table = QueryTable()
+    changes = []
+    table.on_change(lambda change, key, old, new: changes.append((change, key)))
+
+    assert table.apply_json(json.dumps(FRAMES[0])) == 2
+    assert table.decoder is not None
+    assert table.get(2) == {"name": "b", "mtu": 9000}
+    assert table.apply_json(json.dumps(FRAMES[1]).encode()) == 2
+    assert table.rows() == {1: {"name": "a", "mtu": 1}}
+    assert 2 not in table
+    assert len(table) == 1
+    assert changes == [
+        ("insert", 1),
+        ("insert", 2),
+        ("update", 1),
+        ("delete", 2),
+    ]
+    table.clear()
+    assert list(table) == []
+
+
+def test_record_and_replay(tmp_path):
+    path = tmp_path / "frames.jsonl"
+    with open(path, "wb") as f:
+        for frame in FRAMES:
+            record(f, json.dumps(frame) + "\n")
+    assert replay(path).rows() == {1: {"name": "a", "mtu": 1}}
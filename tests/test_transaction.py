@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.transaction import TransactionBuilder, resource_json, target_of
+
+
+def test_resource_json(make_interface):
+    interface = make_interface("a", labels={"role": "leaf"}, mtu=1500)
+    data = json.loads(resource_json(interface))
+    assert data == interface.model_dump(
+        mode="json", by_alias=True, exclude_unset=True, exclude_none=True
+    )
+    assert target_of(interface) == {
+        "gvk": {
+            "group": "interfaces.eda.nokia.com",
+            "kind": "Interface",
+            "version": "v1alpha1",
+        },
+        "name": "a",
+        "namespace": "eda",
+    }
+
+
+def test_body_validates(make_interface):
+    builder = TransactionBuilder("test", dry_run=True, retain=False)
+    builder.create(make_interface("a")).replace(make_interface("b"))
+    builder.modify(make_interface("c", mtu=1500))
+    builder.patch(
+        make_interface("d"),
+        [
+            core.K8SPatchOp(op="add", path="/spec", value={"mtu": 9000}),
+            {"op": "remove", "path": "/spec/description"},
+        ],
+    )
+    builder.delete(
+        core.NsCrGvkName.model_validate(
+            {"gvk": {"group": "g", "kind": "K", "version": "v1"}, "name": "e"}
+        )
+    )
+    assert len(builder) == 5
+
+    body = json.loads(builder.to_json())
+    assert body["description"] == "test"
+    assert body["dryRun"] is True
+    assert body["retain"] is False
+    assert [next(iter(cr["type"])) for cr in body["crs"]] == [
+        "create",
+        "replace",
+        "modify",
+        "patch",
+        "delete",
+    ]
+    assert body["crs"][2]["type"]["modify"]["value"]["spec"]["mtu"] == 1500
+    patch = body["crs"][3]["type"]["patch"]
+    assert patch["patchOps"][1] == {"op": "remove", "path": "/spec/description"}
+    assert patch["target"]["name"] == "d"
+    assert body["crs"][4]["type"]["delete"]["name"] == "e"
+
+    transaction = builder.to_model()
+    assert len(transaction.crs) == 5
+    assert b"".join(builder.iter_json()) == builder.to_json()
+
+
+def test_split(make_interface):
+    builder = TransactionBuilder("split")
+    builder.delete(make_interface("old"))
+    for name in "abcdefg":
+        builder.create(make_interface(name))
+
+    chunks = builder.split(max_crs=3)
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    ops = [(cr.op, cr.target["name"]) for chunk in chunks for cr in chunk.crs]
+    # order is kept, deletes go last
+    assert ops == [("create", n) for n in "abcdefg"] + [("delete", "old")]
+
+    size = max(len(cr) for cr in builder.crs) * 2 + 200
+    for chunk in builder.split(max_bytes=size):
+        assert len(chunk.to_json()) <= size
+        json.loads(chunk.to_json())
+    assert [c.op for c in builder.split(deletes_last=False)[0].crs][0] == "delete"
+
+    with pytest.raises(ValueError):
+        builder.split(max_bytes=100)
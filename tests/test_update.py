@@ -0,0 +1,103 @@
+import pytest
+
+from pydantic_eda.core.v25_8_1 import models as core
+from pydantic_eda.patch import PatchError
+from pydantic_eda.update import (
+    delete_in,
+    evolve,
+    get_in,
+    parse_path,
+    set_in,
+    update_in,
+)
+
+
+def test_parse_path():
+    assert parse_path("spec.members[0].node") == ["spec", "members", "0", "node"]
+    assert parse_path('metadata.labels["eda.nokia.com/role"]') == [
+        "metadata",
+        "labels",
+        "eda.nokia.com/role",
+    ]
+    assert parse_path("/spec/members/0") == ["spec", "members", "0"]
+    assert parse_path("status.members[*].state") == ["status", "members", "*", "state"]
+    with pytest.raises(ValueError):
+        parse_path("spec.members[x]")
+
+
+def test_get_in(make_interface):
+    interface = make_interface("a", labels={"eda.nokia.com/role": "leaf"})
+    assert get_in(interface, "spec.members[0].node") == "leaf1"
+    assert get_in(interface, 'metadata.labels["eda.nokia.com/role"]') == "leaf"
+    assert get_in(interface, "spec.members[3].node") is None
+    assert get_in(interface, "spec.ethernet.fec", "none") == "none"
+
+
+def test_set_in_copies_the_path_only(make_interface):
+    interface = make_interface("a")
+    updated = set_in(interface, "spec.members[0].node", "leaf2")
+    assert updated.spec.members[0].node == "leaf2"
+    assert interface.spec.members[0].node == "leaf1"
+    assert updated.metadata is interface.metadata
+
+    updated = set_in(interface, "spec.ethernet", {"fec": "rs528"})
+    assert updated.spec.ethernet.fec == "rs528"
+    assert interface.spec.ethernet is None
+
+
+def test_set_in_creates_missing_intermediates(make_interface):
+    interface = make_interface("a")
+    updated = set_in(interface, "spec.ethernet.fec", "rs528")
+    assert updated.spec.ethernet.fec == "rs528"
+    assert updated.spec.ethernet.model_fields_set == {"fec"}
+    assert updated.spec.members[0] is interface.spec.members[0]
+
+    updated = set_in(updated, "spec.lag.lacp.mode", "active")
+    assert updated.spec.lag.lacp.mode == "active"
+    assert set_in(updated, "spec.lag.lacp.interval", "fast").spec.lag.lacp.mode == (
+        "active"
+    )
+
+    labelled = update_in(interface, "metadata.labels.role", lambda v: v or "leaf")
+    assert labelled.metadata.labels == {"role": "leaf"}
+    assert set_in(labelled, 'metadata.labels["rack"]', "r1").metadata.labels == {
+        "role": "leaf",
+        "rack": "r1",
+    }
+
+    # the created models are validated
+    with pytest.raises(ValueError):
+        set_in(interface, "spec.ethernet.fec", "nope")
+    with pytest.raises(PatchError):
+        set_in(interface, "spec.ethernet.nope", 1)
+    # list items are not created
+    with pytest.raises(PatchError):
+        set_in(interface, "spec.members[1].node", "leaf2")
+
+
+def test_set_in_creates_dict_items():
+    op = core.K8SPatchOp(op="add", path="/spec")
+    assert set_in(op, "value.a.b", 1).value == {"a": {"b": 1}}
+    op = set_in(op, "value.a", {"c": 2})
+    assert set_in(op, "value.a.b", 1).value == {"a": {"c": 2, "b": 1}}
+
+
+def test_set_in_validates(make_interface):
+    with pytest.raises(ValueError):
+        set_in(make_interface("a"), "spec.mtu", "not a number")
+    with pytest.raises(PatchError):
+        set_in(make_interface("a"), "spec.nope", 1)
+
+
+def test_delete_update_evolve(make_interface):
+    interface = make_interface("a", description="x", mtu=1500)
+    assert delete_in(interface, "spec.description").spec.description is None
+    assert update_in(interface, "spec.mtu", lambda v: v * 6).spec.mtu == 9000
+    evolved = evolve(interface, {"spec.mtu": 9000, "/spec/description": "y"})
+    assert (evolved.spec.mtu, evolved.spec.description) == (9000, "y")
+
+
+def test_paths_accept_attribute_names():
+    op = core.K8SPatchOp.model_validate({"op": "add", "path": "/spec", "from": "/a"})
+    assert set_in(op, "from_", "/b").from_ == "/b"
+    assert set_in(op, "from", "/c").from_ == "/c"
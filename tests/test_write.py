@@ -0,0 +1,25 @@
+import json
+
+from pydantic_eda.apps.interfaces.v1alpha1.models import Interface
+from pydantic_eda.write import json_writer, write_json, write_python
+
+BODY = json.dumps(
+    {
+        "apiVersion": "interfaces.eda.nokia.com/v1alpha1",
+        "kind": "Interface",
+        "metadata": {"name": "a", "namespace": "eda", "labels": {"role": "leaf"}},
+        "spec": {"members": [{"node": "leaf1", "interface": "ethernet-1-1"}]},
+    }
+).encode()
+
+
+def test_writers():
+    interface = Interface.model_validate_json(BODY)
+    body = json.loads(write_json(interface))
+    assert body == json.loads(BODY)
+    assert write_python(interface) == body
+    assert "status" not in body
+    assert "enabled" not in body["spec"]
+    writer = json_writer(Interface, frozenset({"spec"}))
+    assert "spec" not in json.loads(writer(interface))
+    assert json_writer(Interface) is json_writer(Interface)